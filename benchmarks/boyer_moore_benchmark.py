@@ -0,0 +1,75 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Benchmark of the Galil Rule for Boyer-Moore on Periodic Inputs
+#
+# Run with: python -m benchmarks.boyer_moore_benchmark --length 200000 --pattern-length 1000
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import argparse
+import time
+
+from source.patterns.boyer_moore import BoyerMoorePattern, compile
+
+
+def build_inputs(length: int, pattern_length: int) -> dict[str, tuple[str, str]]:
+    """
+    Builds periodic texts and patterns, where every alignment is a match and rescanning the overlap
+    after each shift makes the search quadratic.
+    :param length: The number of characters in each text.
+    :param pattern_length: The number of characters in each pattern.
+    :return: A dictionary mapping each input name to its text and pattern.
+    """
+    line: str = "INFO request served in 12ms\n"
+    return {
+        "single character": ("a" * length, "a" * pattern_length),
+        "period 2": (("ab" * length)[:length], ("ab" * pattern_length)[:pattern_length]),
+        "repeated lines": ((line * (length // len(line) + 1))[:length],
+                           (line * (pattern_length // len(line) + 1))[:pattern_length]),
+    }
+
+
+def time_search(compiled: BoyerMoorePattern, text: str, galil: bool, repeat: int) -> tuple[float, int]:
+    """
+    Times a search.
+    :param compiled: The compiled pattern.
+    :param text: The text.
+    :param galil: Whether to apply the Galil rule.
+    :param repeat: The number of runs.
+    :return: The best time in seconds and the number of matches.
+    """
+    best: float = float("inf")
+    count: int = 0
+
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        count = sum(1 for _ in compiled.finditer(text, galil=galil))
+        best = min(best, time.perf_counter() - start)
+
+    return best, count
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Benchmark Boyer-Moore with and without the Galil rule on periodic inputs.")
+    parser.add_argument("--length", type=int, default=200_000)
+    parser.add_argument("--pattern-length", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments: argparse.Namespace = parser.parse_args()
+
+    print(f"{'input':<20}{'matches':>10}{'plain (s)':>12}{'galil (s)':>12}{'speedup':>10}")
+
+    for name, (text, pattern) in build_inputs(arguments.length, arguments.pattern_length).items():
+        compiled: BoyerMoorePattern = compile(pattern)
+        plain, plain_count = time_search(compiled, text, False, arguments.repeat)
+        galil, galil_count = time_search(compiled, text, True, arguments.repeat)
+
+        if plain_count != galil_count:
+            raise AssertionError(f"The Galil rule found different matches on {name}")
+
+        print(f"{name:<20}{galil_count:>10}{plain:>12.3f}{galil:>12.3f}{plain / galil:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Benchmark of Addressable Priority Queues on Dijkstra-Style Workloads
+#
+# Run with: python -m benchmarks.heap_benchmark --vertices 100000 --degree 8
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from source.heaps.dary_heap import IndexedDaryHeap
+from source.heaps.fibonacci_heap import MinimumFibonacciHeap
+from source.heaps.pairing_heap import MinimumPairingHeap
+from source.heaps.priority_queue import PriorityQueue
+
+
+HEAPS: dict[str, Callable[[], PriorityQueue]] = {
+    "fibonacci": MinimumFibonacciHeap,
+    "pairing": MinimumPairingHeap,
+    "4-ary": lambda: IndexedDaryHeap(4),
+    "8-ary": lambda: IndexedDaryHeap(8),
+}
+
+
+def build_graph(vertex_count: int, degree: int, seed: int) -> list[list[tuple[int, int]]]:
+    """
+    Builds a random directed graph with many parallel improving paths, so that Dijkstra's algorithm
+    performs many decrease_key calls.
+    :param vertex_count: The number of vertices.
+    :param degree: The number of outgoing edges of each vertex.
+    :param seed: The random seed.
+    :return: Adjacency lists of (target, weight) pairs.
+    """
+    generator: random.Random = random.Random(seed)
+    return [[(generator.randrange(vertex_count), generator.randrange(1, 1000)) for _ in range(degree)]
+            for _ in range(vertex_count)]
+
+
+def dijkstra(graph: list[list[tuple[int, int]]], heap: PriorityQueue) -> tuple[list[float], int]:
+    """
+    Runs Dijkstra's algorithm from vertex 0 using the given priority queue.
+    :param graph: Adjacency lists of (target, weight) pairs.
+    :param heap: An empty priority queue.
+    :return: The distances and the number of decrease_key calls.
+    """
+    distances: list[float] = [float("inf")] * len(graph)
+    handles: list = [None] * len(graph)
+    done: list[bool] = [False] * len(graph)
+    decrease_count: int = 0
+
+    distances[0] = 0
+    handles[0] = heap.push(0, 0)
+
+    while len(heap) > 0:
+        distance, vertex = heap.pop()
+        done[vertex] = True
+
+        for target, weight in graph[vertex]:
+            candidate: float = distance + weight
+
+            if done[target] or candidate >= distances[target]:
+                continue
+
+            distances[target] = candidate
+
+            if handles[target] is None:
+                handles[target] = heap.push(candidate, target)
+            else:
+                heap.decrease_key(handles[target], candidate)
+                decrease_count += 1
+
+    return distances, decrease_count
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Benchmark addressable priority queues on Dijkstra-style workloads.")
+    parser.add_argument("--vertices", type=int, default=100_000)
+    parser.add_argument("--degree", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments: argparse.Namespace = parser.parse_args()
+
+    graph: list[list[tuple[int, int]]] = build_graph(arguments.vertices, arguments.degree, arguments.seed)
+    expected: list[float] | None = None
+    print(f"{'heap':<12}{'best (s)':>12}{'decrease_key calls':>22}")
+
+    for name, factory in HEAPS.items():
+        best: float = float("inf")
+
+        for _ in range(arguments.repeat):
+            start: float = time.perf_counter()
+            distances, decrease_count = dijkstra(graph, factory())
+            best = min(best, time.perf_counter() - start)
+
+        # Every implementation must agree on the shortest paths
+        if expected is None:
+            expected = distances
+        elif distances != expected:
+            raise AssertionError(f"{name} computed different distances")
+
+        print(f"{name:<12}{best:>12.3f}{decrease_count:>22}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Benchmark of Exact Pattern Matchers on Generated Corpora
+#
+# Run with: python -m benchmarks.pattern_benchmark --sizes 20000 40000 80000 --json results.json
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import argparse
+import json
+import math
+import random
+import time
+import tracemalloc
+from typing import Callable
+
+from source.patterns import boyer_moore, search, shift_and
+from source.patterns.aho_corasick import AhoCorasickAutomaton
+from source.patterns.naive_matching import naive_match
+from source.patterns.z_algorithm import build_z_array
+from source.patterns.z_matching import z_match, z_match_stream
+
+
+WORDS: list[str] = ("the of and to in is that it was for on are with as his they be at one have this from or "
+                    "had by word but what some we can out other were all there when up use your how said an "
+                    "each she which do their time if will way about many then them write would like so these "
+                    "her long make thing see him two has look more day could go come did number sound no most "
+                    "people my over know water than call first who may down side been now find").split()
+
+
+def uniform(alphabet: str) -> Callable[[int, int, random.Random], tuple[str, str]]:
+    """
+    :param alphabet: The characters of the corpus.
+    :return: A generator of uniformly random texts over the alphabet, with patterns taken from the text.
+    """
+    def generate(length: int, pattern_length: int, generator: random.Random) -> tuple[str, str]:
+        text: str = "".join(generator.choices(alphabet, k=length))
+        start: int = generator.randrange(length - pattern_length + 1)
+        return text, text[start:start + pattern_length]
+
+    return generate
+
+
+def english(length: int, pattern_length: int, generator: random.Random) -> tuple[str, str]:
+    """
+    Generates English-like text from common words with Zipf-distributed frequencies.
+    """
+    weights: list[float] = [1 / (rank + 1) for rank in range(len(WORDS))]
+    words: list[str] = []
+    total: int = 0
+
+    while total < length:
+        words.append(generator.choices(WORDS, weights)[0])
+        total += len(words[-1]) + 1
+
+    text: str = " ".join(words)[:length]
+    start: int = generator.randrange(length - pattern_length + 1)
+    return text, text[start:start + pattern_length]
+
+
+def periodic(length: int, pattern_length: int, generator: random.Random) -> tuple[str, str]:
+    """
+    Generates the classic worst case for naive matching, where every alignment fails at the last character.
+    """
+    return "a" * length, "a" * (pattern_length - 1) + "b"
+
+
+def all_match(length: int, pattern_length: int, generator: random.Random) -> tuple[str, str]:
+    """
+    Generates a text where the pattern matches at every alignment.
+    """
+    return "a" * length, "a" * pattern_length
+
+
+def no_match(length: int, pattern_length: int, generator: random.Random) -> tuple[str, str]:
+    """
+    Generates a text containing no character of the pattern.
+    """
+    return "".join(generator.choices("ab", k=length)), "c" * pattern_length
+
+
+CORPORA: dict[str, Callable[[int, int, random.Random], tuple[str, str]]] = {
+    "uniform-2": uniform("ab"),
+    "dna": uniform("acgt"),
+    "uniform-26": uniform("abcdefghijklmnopqrstuvwxyz"),
+    "uniform-95": uniform("".join(map(chr, range(32, 127)))),
+    "english": english,
+    "periodic": periodic,
+    "all-match": all_match,
+    "no-match": no_match,
+}
+
+MATCHERS: dict[str, Callable[[str, str], object]] = {
+    "naive": naive_match,
+    "z": z_match,
+    "z-stream": lambda text, pattern: list(z_match_stream([text], pattern)),
+    "boyer-moore": lambda text, pattern: list(boyer_moore.compile(pattern).finditer(text)),
+    "shift-and": lambda text, pattern: list(shift_and.compile(pattern, classes=False).finditer(text)),
+    "aho-corasick": lambda text, pattern: AhoCorasickAutomaton([pattern]).match(text)[0],
+    "search": search.find,
+    "z-array": lambda text, pattern: build_z_array(text),
+}
+
+
+def measure(matcher: Callable[[str, str], object], text: str, pattern: str, repeat: int) -> tuple[float, int]:
+    """
+    Measures a matcher on one input.
+    :param matcher: The matcher.
+    :param text: The text.
+    :param pattern: The pattern.
+    :param repeat: The number of timed runs.
+    :return: The best time in seconds, and the peak traced memory in bytes of a separate untimed run.
+    """
+    best: float = float("inf")
+
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        matcher(text, pattern)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    matcher(text, pattern)
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def scaling_exponent(sizes: list[int], times: list[float]) -> float:
+    """
+    Fits time = c * size^e by least squares on a log-log scale.
+    :param sizes: The input sizes.
+    :param times: The times of the inputs.
+    :return: The exponent e, near 1 for linear algorithms and 2 for quadratic ones.
+    """
+    xs: list[float] = [math.log(size) for size in sizes]
+    ys: list[float] = [math.log(max(elapsed, 1e-9)) for elapsed in times]
+    x_mean: float = sum(xs) / len(xs)
+    y_mean: float = sum(ys) / len(ys)
+    variance: float = sum((x - x_mean) ** 2 for x in xs)
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / variance if variance > 0 else float("nan")
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Benchmark exact pattern matchers on generated corpora.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20_000, 40_000, 80_000])
+    parser.add_argument("--pattern-length", type=int, default=16)
+    parser.add_argument("--corpora", nargs="+", choices=list(CORPORA), default=list(CORPORA))
+    parser.add_argument("--matchers", nargs="+", choices=list(MATCHERS), default=list(MATCHERS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="Optional. The path of a JSON file to write the results to.")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    results: list[dict] = []
+    exponents: dict[str, dict[str, float]] = {}
+    print(f"{'corpus':<12}{'matcher':<14}{'size':>10}{'MB/s':>10}{'peak (KiB)':>12}{'matches':>10}")
+
+    for corpus in arguments.corpora:
+        inputs: list[tuple[str, str]] = [CORPORA[corpus](size, arguments.pattern_length, random.Random(arguments.seed))
+                                         for size in arguments.sizes]
+        exponents[corpus] = {}
+
+        for name in arguments.matchers:
+            matcher: Callable[[str, str], object] = MATCHERS[name]
+            times: list[float] = []
+
+            for size, (text, pattern) in zip(arguments.sizes, inputs):
+                elapsed, peak = measure(matcher, text, pattern, arguments.repeat)
+                output: object = matcher(text, pattern)
+                matches: int | None = len(output) if name != "z-array" else None
+                times.append(elapsed)
+                throughput: float = size / elapsed / 1e6
+                results.append({"corpus": corpus, "matcher": name, "size": size, "pattern_length": len(pattern),
+                                "seconds": elapsed, "mb_per_second": throughput, "peak_bytes": peak,
+                                "matches": matches})
+                print(f"{corpus:<12}{name:<14}{size:>10}{throughput:>10.2f}{peak / 1024:>12.1f}"
+                      f"{'-' if matches is None else matches:>10}")
+
+            exponents[corpus][name] = scaling_exponent(arguments.sizes, times)
+
+    print()
+    print(f"{'scaling exponent':<16}" + "".join(f"{name:>14}" for name in arguments.matchers))
+
+    for corpus in arguments.corpora:
+        print(f"{corpus:<16}" + "".join(f"{exponents[corpus][name]:>14.2f}" for name in arguments.matchers))
+
+    if arguments.json is not None:
+        with open(arguments.json, "w") as file:
+            json.dump({"parameters": vars(arguments), "results": results, "exponents": exponents}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Weighted Graph in Compressed Sparse Row Form
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from array import array
+from typing import Iterable
+
+
+class CSRGraph:
+    """
+    A weighted graph stored in compressed sparse row (CSR) form.
+    The outgoing edges of vertex v are targets[offsets[v]:offsets[v + 1]], with the matching weights
+    in weights[offsets[v]:offsets[v + 1]]. All three are flat typed arrays, so an edge costs 16 bytes
+    rather than a tuple of boxed numbers.
+
+    n - number of vertices
+    m - number of edges
+
+    Auxiliary space complexity: O(n + m)
+    """
+
+    def __init__(self, offsets: array, targets: array, weights: array) -> None:
+        """
+        Initializes a graph from existing CSR arrays.
+        :param offsets: An array of n + 1 edge offsets, one per vertex plus the total edge count.
+        :param targets: An array of m edge targets.
+        :param weights: An array of m edge weights.
+        :raises ValueError: Raised if the arrays have inconsistent lengths.
+        """
+        if len(offsets) == 0 or offsets[-1] != len(targets) or len(targets) != len(weights):
+            raise ValueError("The offsets, targets and weights are inconsistent")
+
+        self.offsets: array = offsets
+        self.targets: array = targets
+        self.weights: array = weights
+
+    @classmethod
+    def from_edges(cls, vertex_count: int, edges: Iterable[tuple[int, int, int | float]],
+                   directed: bool = True) -> "CSRGraph":
+        """
+        Builds a graph from a list of edges using a counting sort on the edge sources.
+
+        n - number of vertices
+        m - number of edges
+
+        Time complexity:            O(n + m)
+        Auxiliary space complexity: O(n + m)
+
+        :param vertex_count: The number of vertices, which are numbered from 0.
+        :param edges: An iterable of (source, target, weight) edges.
+        :param directed: Whether the edges are directed. Undirected edges are stored in both directions.
+        :return: The graph.
+        :raises ValueError: Raised if an edge has an endpoint outside the vertices.
+        """
+        sources: array = array('q')
+        edge_targets: array = array('q')
+        edge_weights: array = array('d')
+
+        for source, target, weight in edges:
+            if not (0 <= source < vertex_count and 0 <= target < vertex_count):
+                raise ValueError(f"The edge ({source}, {target}) has an endpoint outside the graph")
+
+            sources.append(source)
+            edge_targets.append(target)
+            edge_weights.append(weight)
+
+            if not directed:
+                sources.append(target)
+                edge_targets.append(source)
+                edge_weights.append(weight)
+
+        # Count the out-degrees, then turn them into offsets by a prefix sum
+        offsets: array = array('q', bytes(8 * (vertex_count + 1)))
+
+        for source in sources:
+            offsets[source + 1] += 1
+
+        for vertex in range(vertex_count):
+            offsets[vertex + 1] += offsets[vertex]
+
+        # Place each edge at the next free slot of its source
+        targets: array = array('q', bytes(8 * len(sources)))
+        weights: array = array('d', bytes(8 * len(sources)))
+        next_slot: array = offsets[:-1]
+
+        for i in range(len(sources)):
+            slot: int = next_slot[sources[i]]
+            targets[slot] = edge_targets[i]
+            weights[slot] = edge_weights[i]
+            next_slot[sources[i]] = slot + 1
+
+        return cls(offsets, targets, weights)
+
+    @property
+    def vertex_count(self) -> int:
+        """
+        :return: The number of vertices.
+        """
+        return len(self.offsets) - 1
+
+    @property
+    def edge_count(self) -> int:
+        """
+        :return: The number of stored (directed) edges.
+        """
+        return len(self.targets)
+
+    def neighbours(self, vertex: int) -> Iterable[tuple[int, float]]:
+        """
+        :param vertex: A vertex of the graph.
+        :return: An iterable of the (target, weight) pairs of the vertex's outgoing edges.
+        """
+        start: int = self.offsets[vertex]
+        stop: int = self.offsets[vertex + 1]
+        return zip(self.targets[start:stop], self.weights[start:stop])
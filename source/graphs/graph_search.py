@@ -0,0 +1,197 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Shortest Paths and Minimum Spanning Trees Driven by Addressable Priority Queues
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from array import array
+from typing import Callable
+
+from source.graphs.csr_graph import CSRGraph
+from source.heaps.fibonacci_heap import MinimumFibonacciHeap
+from source.heaps.priority_queue import PriorityQueue
+
+
+INFINITY: float = float("inf")
+
+
+def build_path(predecessors: array, target: int) -> list[int]:
+    """
+    Follows the predecessor links back from a vertex to the root of its search tree.
+    :param predecessors: The predecessor of each vertex, or -1 for a root or an unreached vertex.
+    :param target: The last vertex of the path.
+    :return: The list of vertices from the root to the target.
+    """
+    path: list[int] = [target]
+
+    while predecessors[path[-1]] != -1:
+        path.append(predecessors[path[-1]])
+
+    path.reverse()
+    return path
+
+
+def dijkstra(graph: CSRGraph, source: int, target: int | None = None,
+             heap_factory: Callable[[], PriorityQueue] = MinimumFibonacciHeap) -> tuple[array, array]:
+    """
+    Finds the shortest paths from a source vertex using Dijkstra's algorithm.
+    Each vertex is inserted into the priority queue at most once, and shorter tentative distances
+    are applied with decrease_key.
+
+    n - number of vertices
+    m - number of edges
+
+    Time complexity:            O(m + n * log(n)) with a Fibonacci heap
+    Auxiliary space complexity: O(n)
+
+    :param graph: A graph with non-negative edge weights.
+    :param source: The source vertex.
+    :param target: Optional. Stop as soon as the distance to this vertex is final.
+    :param heap_factory: Creates the empty priority queue to use.
+    :return: The distance to every vertex (infinity if unreached), and the predecessor of every vertex
+    on its shortest path (-1 for the source and unreached vertices). With a target, only the vertices
+    finalized before the target are guaranteed to be correct.
+    """
+    offsets: array = graph.offsets
+    targets: array = graph.targets
+    weights: array = graph.weights
+    distances: array = array('d', [INFINITY]) * graph.vertex_count
+    predecessors: array = array('q', [-1]) * graph.vertex_count
+    handles: list = [None] * graph.vertex_count
+    done: bytearray = bytearray(graph.vertex_count)
+    heap: PriorityQueue = heap_factory()
+
+    distances[source] = 0
+    handles[source] = heap.push(0, source)
+
+    while len(heap) > 0:
+        distance, vertex = heap.pop()
+        done[vertex] = 1
+
+        if vertex == target:
+            break
+
+        for edge in range(offsets[vertex], offsets[vertex + 1]):
+            neighbour: int = targets[edge]
+            candidate: float = distance + weights[edge]
+
+            if done[neighbour] or candidate >= distances[neighbour]:
+                continue
+
+            distances[neighbour] = candidate
+            predecessors[neighbour] = vertex
+
+            if handles[neighbour] is None:
+                handles[neighbour] = heap.push(candidate, neighbour)
+            else:
+                heap.decrease_key(handles[neighbour], candidate)
+
+    return distances, predecessors
+
+
+def a_star(graph: CSRGraph, source: int, target: int, heuristic: Callable[[int], float],
+           heap_factory: Callable[[], PriorityQueue] = MinimumFibonacciHeap) -> tuple[float, list[int]]:
+    """
+    Finds a shortest path between two vertices using A* search.
+    Vertices are ordered by their tentative distance plus the heuristic estimate of the remaining
+    distance, which focuses the search towards the target.
+    :param graph: A graph with non-negative edge weights.
+    :param source: The source vertex.
+    :param target: The target vertex.
+    :param heuristic: A consistent estimate of the distance from each vertex to the target.
+    :param heap_factory: Creates the empty priority queue to use.
+    :return: The shortest distance and the path from the source to the target, or infinity and an
+    empty list if the target is unreachable.
+    """
+    offsets: array = graph.offsets
+    targets: array = graph.targets
+    weights: array = graph.weights
+    distances: array = array('d', [INFINITY]) * graph.vertex_count
+    predecessors: array = array('q', [-1]) * graph.vertex_count
+    handles: list = [None] * graph.vertex_count
+    done: bytearray = bytearray(graph.vertex_count)
+    heap: PriorityQueue = heap_factory()
+
+    distances[source] = 0
+    handles[source] = heap.push(heuristic(source), source)
+
+    while len(heap) > 0:
+        _, vertex = heap.pop()
+        done[vertex] = 1
+
+        if vertex == target:
+            return distances[target], build_path(predecessors, target)
+
+        for edge in range(offsets[vertex], offsets[vertex + 1]):
+            neighbour: int = targets[edge]
+            candidate: float = distances[vertex] + weights[edge]
+
+            if done[neighbour] or candidate >= distances[neighbour]:
+                continue
+
+            distances[neighbour] = candidate
+            predecessors[neighbour] = vertex
+
+            if handles[neighbour] is None:
+                handles[neighbour] = heap.push(candidate + heuristic(neighbour), neighbour)
+            else:
+                heap.decrease_key(handles[neighbour], candidate + heuristic(neighbour))
+
+    return INFINITY, []
+
+
+def prim(graph: CSRGraph,
+         heap_factory: Callable[[], PriorityQueue] = MinimumFibonacciHeap) -> tuple[float, array]:
+    """
+    Finds a minimum spanning forest using Prim's algorithm, growing one tree per connected component.
+
+    n - number of vertices
+    m - number of edges
+
+    Time complexity:            O(m + n * log(n)) with a Fibonacci heap
+    Auxiliary space complexity: O(n)
+
+    :param graph: An undirected graph, with every edge stored in both directions.
+    :param heap_factory: Creates the empty priority queue to use.
+    :return: The total weight of the forest, and the parent of every vertex in the forest (-1 for
+    the root of each tree).
+    """
+    offsets: array = graph.offsets
+    targets: array = graph.targets
+    weights: array = graph.weights
+    costs: array = array('d', [INFINITY]) * graph.vertex_count  # Lightest known edge into each vertex
+    parents: array = array('q', [-1]) * graph.vertex_count
+    handles: list = [None] * graph.vertex_count
+    done: bytearray = bytearray(graph.vertex_count)
+    total: float = 0
+
+    for root in range(graph.vertex_count):
+        if done[root]:
+            continue
+
+        heap: PriorityQueue = heap_factory()
+        costs[root] = 0
+        handles[root] = heap.push(0, root)
+
+        while len(heap) > 0:
+            cost, vertex = heap.pop()
+            done[vertex] = 1
+            total += cost
+
+            for edge in range(offsets[vertex], offsets[vertex + 1]):
+                neighbour: int = targets[edge]
+                weight: float = weights[edge]
+
+                if done[neighbour] or weight >= costs[neighbour]:
+                    continue
+
+                costs[neighbour] = weight
+                parents[neighbour] = vertex
+
+                if handles[neighbour] is None:
+                    handles[neighbour] = heap.push(weight, neighbour)
+                else:
+                    heap.decrease_key(handles[neighbour], weight)
+
+    return total, parents
@@ -0,0 +1,252 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Indexed Minimum d-ary Heap on Flat Arrays
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from typing import Any
+
+
+class IndexedDaryHeap:
+    """
+    An indexed minimum d-ary heap stored in flat arrays.
+    Each entry is identified by an integer handle, which indexes the key, data and position arrays.
+    There are no node objects, so there is no pointer chasing and little per-entry overhead.
+    Handles of removed entries are reused by later pushes, so the arrays grow with the largest number
+    of entries held at once rather than with the total number of pushes.
+
+    n - number of entries in the heap
+    d - arity of the heap
+
+                            Time complexity
+    push:                   O(log_d(n))
+    decrease_key:           O(log_d(n))
+    pop:                    O(d * log_d(n))
+    merge:                  O(m * log_d(n + m)) for m entries in the other heap
+    """
+
+    def __init__(self, arity: int = 4) -> None:
+        """
+        Creates an empty heap.
+        :param arity: The maximum number of children of each entry.
+        :raises ValueError: Raised if the arity is less than 2.
+        """
+        if arity < 2:
+            raise ValueError("The arity must be at least 2")
+
+        self.arity: int = arity
+        self.heap: list[int] = []           # Handles in heap order
+        self.positions: list[int] = []      # positions[h] is the index of handle h in the heap, or -1 if removed
+        self.keys: list[int | float] = []   # keys[h] is the key of handle h
+        self.data: list[Any] = []           # data[h] is the data of handle h
+        self.free: list[int] = []           # Handles of removed entries, for reuse
+
+    def __len__(self) -> int:
+        """
+        :return: The number of entries in the heap.
+        """
+        return len(self.heap)
+
+    def __contains__(self, handle: int) -> bool:
+        """
+        :param handle: A handle returned by push.
+        :return: True if the entry is still in the heap, or its handle was reused by a later push.
+        """
+        return 0 <= handle < len(self.positions) and self.positions[handle] >= 0
+
+    def sift_up(self, index: int) -> None:
+        """
+        Moves an entry towards the root until its parent's key is not greater.
+        The entry is held aside while parents are moved down, so each level costs one write.
+        :param index: The heap index of the entry.
+        """
+        heap: list[int] = self.heap
+        positions: list[int] = self.positions
+        keys: list[int | float] = self.keys
+        arity: int = self.arity
+        handle: int = heap[index]
+        key: int | float = keys[handle]
+
+        while index > 0:
+            parent_index: int = (index - 1) // arity
+            parent: int = heap[parent_index]
+
+            if keys[parent] <= key:
+                break
+
+            heap[index] = parent
+            positions[parent] = index
+            index = parent_index
+
+        heap[index] = handle
+        positions[handle] = index
+
+    def sift_down(self, index: int) -> None:
+        """
+        Moves an entry away from the root until no child has a smaller key.
+        :param index: The heap index of the entry.
+        """
+        heap: list[int] = self.heap
+        positions: list[int] = self.positions
+        keys: list[int | float] = self.keys
+        arity: int = self.arity
+        size: int = len(heap)
+        handle: int = heap[index]
+        key: int | float = keys[handle]
+
+        while True:
+            first_child: int = index * arity + 1
+
+            if first_child >= size:
+                break
+
+            # Find the child with the smallest key
+            smallest_index: int = first_child
+            smallest_key: int | float = keys[heap[first_child]]
+
+            for child_index in range(first_child + 1, min(first_child + arity, size)):
+                child_key: int | float = keys[heap[child_index]]
+
+                if child_key < smallest_key:
+                    smallest_index = child_index
+                    smallest_key = child_key
+
+            if key <= smallest_key:
+                break
+
+            child: int = heap[smallest_index]
+            heap[index] = child
+            positions[child] = index
+            index = smallest_index
+
+        heap[index] = handle
+        positions[handle] = index
+
+    def push(self, key: int | float, data: Any = None) -> int:
+        """
+        Inserts a key and optional data into the heap.
+        :param key: A numeric key for ordering.
+        :param data: Optional data stored with the key.
+        :return: The integer handle of the new entry, which may be the handle of a removed entry.
+        """
+        if self.free:
+            handle: int = self.free.pop()
+            self.keys[handle] = key
+            self.data[handle] = data
+        else:
+            handle = len(self.keys)
+            self.keys.append(key)
+            self.data.append(data)
+            self.positions.append(-1)
+
+        self.heap.append(handle)
+        self.sift_up(len(self.heap) - 1)
+        return handle
+
+    def peek(self) -> tuple[int | float, Any]:
+        """
+        :return: The smallest key and its data, without removing them.
+        :raises IndexError: Raised if the heap is empty.
+        """
+        if not self.heap:
+            raise IndexError("Cannot peek into an empty heap")
+
+        handle: int = self.heap[0]
+        return self.keys[handle], self.data[handle]
+
+    def extract_minimum(self) -> int:
+        """
+        Removes the entry with the smallest key.
+        :return: The handle of the removed entry. Its key and data remain readable in keys and data
+        until the next push, which may reuse the handle.
+        :raises IndexError: Raised if the heap is empty.
+        """
+        heap: list[int] = self.heap
+
+        if not heap:
+            raise IndexError("Cannot extract from an empty heap")
+
+        handle: int = heap[0]
+        last: int = heap.pop()
+        self.positions[handle] = -1
+        self.free.append(handle)
+
+        if heap:
+            heap[0] = last
+            self.positions[last] = 0
+            self.sift_down(0)
+
+        return handle
+
+    def pop(self) -> tuple[int | float, Any]:
+        """
+        Removes the smallest key from the heap.
+        :return: The smallest key and its data.
+        :raises IndexError: Raised if the heap is empty.
+        """
+        handle: int = self.extract_minimum()
+        data: Any = self.data[handle]
+        self.data[handle] = None    # Release the data, since the handle is no longer in use
+        return self.keys[handle], data
+
+    def decrease_key(self, handle: int, key: int | float) -> None:
+        """
+        Decreases the key of an entry in the heap.
+        :param handle: The handle returned by push.
+        :param key: The new key, which must not be greater than the current key.
+        :raises ValueError: Raised if the new key is greater than the current key.
+        """
+        if key > self.keys[handle]:
+            raise ValueError("The new key cannot be greater than the current key")
+
+        self.keys[handle] = key
+        self.sift_up(self.positions[handle])
+
+    def delete(self, handle: int) -> None:
+        """
+        Removes an entry from the heap, keeping its key unchanged.
+        :param handle: The handle returned by push.
+        """
+        heap: list[int] = self.heap
+        index: int = self.positions[handle]
+        last: int = heap.pop()
+        self.positions[handle] = -1
+        self.data[handle] = None
+        self.free.append(handle)
+
+        if last != handle:
+            heap[index] = last
+            self.positions[last] = index
+            self.sift_up(index)
+            self.sift_down(self.positions[last])
+
+    def merge(self, other: "IndexedDaryHeap") -> int:
+        """
+        Moves all entries of another d-ary heap into this one.
+        The other heap is left empty. Handle h of the other heap becomes handle h + offset in this
+        heap, where offset is the returned value, and the other heap's unused handles become free.
+        :param other: The heap to be merged.
+        :return: The offset added to the other heap's handles.
+        """
+        offset: int = len(self.keys)
+        self.keys.extend(other.keys)
+        self.data.extend(other.data)
+        self.positions.extend([-1] * len(other.positions))
+
+        for handle, position in enumerate(other.positions):
+            if position < 0:
+                self.data[handle + offset] = None
+                self.free.append(handle + offset)
+
+        for handle in other.heap:
+            self.positions[handle + offset] = len(self.heap)
+            self.heap.append(handle + offset)
+            self.sift_up(len(self.heap) - 1)
+
+        other.heap = []
+        other.positions = []
+        other.keys = []
+        other.data = []
+        other.free = []
+        return offset
@@ -1,9 +1,15 @@
-from typing import Any
+import math
+from typing import Any, Iterable
+
+
+PHI: float = (1 + math.sqrt(5)) / 2     # The golden ratio, which bounds the degree of any node
 
 
 class Node:
     """A node in a Fibonacci heap."""
 
+    __slots__ = ("key", "data", "child_count", "marked", "parent", "child", "left", "right")
+
     def __init__(self, key: int | float, data: Any = None) -> None:
         """
         Creates an isolated root node with a key.
@@ -20,7 +26,19 @@ class Node:
 
 
 class MinimumFibonacciHeap:
-    """A minimum Fibonacci heap."""
+    """
+    A minimum Fibonacci heap.
+
+    n - number of nodes in the heap
+
+                            Amortized time complexity
+    insert:                 O(1)
+    merge:                  O(1)
+    get_minimum:            O(1)
+    decrease_key:           O(1)
+    extract_minimum:        O(log(n))
+    delete:                 O(log(n))
+    """
 
     def __init__(self, node: Node | None = None) -> None:
         """
@@ -28,6 +46,40 @@ class MinimumFibonacciHeap:
         :param node: Optional. Any node in the root-level of existing nodes forming a minimum Fibonacci heap.
         """
         self.minimum: Node | None = self.get_minimum_sibling(node) if node is not None else None
+        self.size: int = self.count_nodes(node) if node is not None else 0
+
+    def __len__(self) -> int:
+        """
+        :return: The number of nodes in the heap.
+        """
+        return self.size
+
+    @staticmethod
+    def count_nodes(node: Node) -> int:
+        """
+        Counts a node, its siblings, and all of their descendants.
+        :param node: Any heap node with or without siblings.
+        :return: The number of nodes in the sibling level and below.
+        """
+        count: int = 0
+        stack: list[Node] = [node]
+
+        while stack:
+            start: Node = stack.pop()
+            current: Node = start
+
+            while True:
+                count += 1
+
+                if current.child is not None:
+                    stack.append(current.child)
+
+                current = current.right
+
+                if current is start:
+                    break
+
+        return count
 
     @staticmethod
     def get_minimum_sibling(node: Node) -> Node:
@@ -63,70 +115,315 @@ class MinimumFibonacciHeap:
             node = node.right
             node.parent = None
 
-    def get_minimum(self) -> Node:
+    def get_minimum(self) -> Node | None:
         """
-        :return: The heap node with the smallest key.
+        :return: The heap node with the smallest key, or None if the heap is empty.
         """
         return self.minimum
 
+    def add_roots(self, node: Node) -> None:
+        """
+        Splices a ring of sibling nodes into the root level with a single link operation.
+        The minimum is only updated against the given node, so the caller must pass the smallest node
+        of the ring.
+        :param node: The node with the smallest key in a ring of sibling nodes.
+        """
+        if self.minimum is None:
+            self.minimum = node
+            return
+
+        # Link the ring to the left of the current minimum
+        last: Node = node.left
+        self.minimum.left.right = node
+        node.left = self.minimum.left
+        last.right = self.minimum
+        self.minimum.left = last
+
+        if node.key < self.minimum.key:
+            self.minimum = node
+
     def merge(self, other: "MinimumFibonacciHeap") -> None:
         """
         Merges another minimum Fibonacci heap with this one by linking the root levels.
+        The other heap is left empty.
         :param other: The heap to be merged.
         """
-        # Link the root levels of both heaps
-        self.minimum.left.right = other.minimum.right
-        other.minimum.right.left = self.minimum.left
-        self.minimum.left = other.minimum
-        other.minimum.right = self.minimum
+        if other.minimum is not None:
+            self.add_roots(other.minimum)
 
-        # Update the new minimum node
-        if self.minimum.key > other.minimum.key:
-            self.minimum = other.minimum
+        self.size += other.size
+        other.minimum = None
+        other.size = 0
 
     def insert(self, node: Node) -> None:
         """
         Inserts a node into the heap in the root level.
-        :param node: The heap node to be inserted.
+        :param node: The isolated heap node to be inserted.
+        """
+        self.add_roots(node)
+        self.size += 1
+
+    def insert_many(self, nodes: Iterable[Node]) -> None:
+        """
+        Inserts many nodes into the heap in the root level.
+        The nodes are chained into a ring while tracking the smallest one, and the ring is then
+        spliced into the root level with a single link operation.
+
+        k - number of nodes inserted
+
+        Time complexity:            O(k)
+        Auxiliary space complexity: O(1)
+
+        :param nodes: An iterable of isolated heap nodes to be inserted.
+        """
+        first: Node | None = None
+        last: Node | None = None
+        smallest: Node | None = None
+        count: int = 0
+
+        for node in nodes:
+            if first is None:
+                first = node
+                smallest = node
+            else:
+                last.right = node
+                node.left = last
+
+                if node.key < smallest.key:
+                    smallest = node
+
+            last = node
+            count += 1
+
+        if first is None:
+            return
+
+        # Close the ring, then splice it in starting from the smallest node
+        last.right = first
+        first.left = last
+        self.add_roots(smallest)
+        self.size += count
+
+    @classmethod
+    def from_items(cls, keys: Iterable[int | float], data: Iterable[Any] | None = None) -> "MinimumFibonacciHeap":
+        """
+        Builds a heap from keys and optional data in linear time.
+        :param keys: An iterable of numeric keys.
+        :param data: Optional. An iterable of node data, paired with the keys in order.
+        :return: A heap with one root node per key.
         """
-        single_heap: MinimumFibonacciHeap = MinimumFibonacciHeap(node)  # Create a single-node heap
-        self.merge(single_heap)     # Merge the single-node heap with this heap to insert the new node
+        heap: MinimumFibonacciHeap = cls()
+        nodes: Iterable[Node] = map(Node, keys) if data is None else map(Node, keys, data)
+        heap.insert_many(nodes)
+        return heap
+
+    def push(self, key: int | float, data: Any = None) -> Node:
+        """
+        Inserts a key and optional data into the heap.
+        :param key: A numeric key for ordering.
+        :param data: Optional data stored with the key.
+        :return: The new heap node, which is the handle for decrease_key and delete.
+        """
+        node: Node = Node(key, data)
+        self.insert(node)
+        return node
+
+    def pop(self) -> tuple[int | float, Any]:
+        """
+        Removes the smallest key from the heap.
+        :return: The smallest key and its data.
+        :raises IndexError: Raised if the heap is empty.
+        """
+        node: Node = self.extract_minimum()
+        return node.key, node.data
 
     def extract_minimum(self) -> Node:
         """
         Removes and returns the heap item with the smallest key.
         :return: The heap node with the smallest key.
+        :raises IndexError: Raised if the heap is empty.
         """
+        minimum: Node | None = self.minimum
+
+        if minimum is None:
+            raise IndexError("Cannot extract from an empty heap")
+
+        # Promote any children of the minimum node to the root level
+        if minimum.child is not None:
+            child: Node = minimum.child
+            self.set_roots(child)
+            last: Node = child.left
+            minimum.right.left = last
+            last.right = minimum.right
+            minimum.right = child
+            child.left = minimum
+            minimum.child = None
+            minimum.child_count = 0
+
         # Unlink the minimum node from its siblings
-        self.minimum.left.right = self.minimum.right
-        self.minimum.right.left = self.minimum.left
-        current: Node = self.minimum.right  # Save a sibling node for later processing
-        self.minimum.left = None
-        self.minimum.right = None
-
-        # Form a new heap with any children of the minimum node and merge it with the original heap
-        if self.minimum.child_count > 0:
-            self.set_roots(self.minimum.child)  # Set the children to be roots of the new child heap
-            child_heap: MinimumFibonacciHeap = MinimumFibonacciHeap(self.minimum.child)
-            self.merge(child_heap)
+        current: Node = minimum.right
+        minimum.left.right = minimum.right
+        minimum.right.left = minimum.left
+        minimum.left = minimum
+        minimum.right = minimum
+        self.size -= 1
+
+        if current is minimum:
+            self.minimum = None
+        else:
+            self.consolidate(current)
+
+        return minimum
+
+    def link(self, child: Node, parent: Node) -> None:
+        """
+        Makes one root node a child of another root node with the same child count.
+        :param child: The root node with the larger key.
+        :param parent: The root node with the smaller key.
+        """
+        child.parent = parent
+        child.marked = False
+
+        if parent.child is None:
+            child.left = child
+            child.right = child
+            parent.child = child
+        else:
+            sibling: Node = parent.child
+            child.right = sibling
+            child.left = sibling.left
+            sibling.left.right = child
+            sibling.left = child
+
+        parent.child_count += 1
 
     def consolidate(self, start: Node) -> None:
         """
         Combines nodes in the root-level until there is only one root node for a given child count.
+        The child count of any node is at most log_phi(n), which sizes the auxiliary array.
         :param start: The node in the root level to start consolidating from.
         """
-        auxiliary_array: list[Node | None] = [None for _ in range(10)]  # Maximum child count
-        stop: Node = start.left     # TODO: Check for single node in root level
+        auxiliary_array: list[Node | None] = [None] * (int(math.log(self.size, PHI)) + 2)
+        roots: list[Node] = []
         current: Node = start
-        minimum: Node = start
 
-        while current is not stop:
-            if current.key < minimum.key:
-                minimum = current
+        # Snapshot the root level, as linking rewires the sibling pointers
+        while True:
+            roots.append(current)
+            current = current.right
+
+            if current is start:
+                break
+
+        for current in roots:
+            child_count: int = current.child_count
+
+            # Link roots with equal child counts until this root's child count is unique
+            while auxiliary_array[child_count] is not None:
+                other: Node = auxiliary_array[child_count]
+
+                if other.key < current.key:
+                    current, other = other, current
+
+                self.link(other, current)
+                auxiliary_array[child_count] = None
+                child_count += 1
 
-            if auxiliary_array[current.child_count] is None:
-                auxiliary_array[current.child_count] = current
+            auxiliary_array[child_count] = current
+
+        # Rebuild the root level from the remaining roots and find the new minimum
+        self.minimum = None
+
+        for current in auxiliary_array:
+            if current is None:
+                continue
+
+            if self.minimum is None:
+                current.left = current
+                current.right = current
+                self.minimum = current
             else:
-                
+                current.right = self.minimum
+                current.left = self.minimum.left
+                self.minimum.left.right = current
+                self.minimum.left = current
 
-            current = current.right
+                if current.key < self.minimum.key:
+                    self.minimum = current
+
+    def cut(self, node: Node, parent: Node) -> None:
+        """
+        Removes a node from its parent's children and moves it to the root level.
+        :param node: A non-root heap node.
+        :param parent: The parent of the node.
+        """
+        if node.right is node:
+            parent.child = None
+        else:
+            if parent.child is node:
+                parent.child = node.right
+
+            node.left.right = node.right
+            node.right.left = node.left
+
+        parent.child_count -= 1
+        node.parent = None
+        node.marked = False
+
+        # Splice the node into the root level
+        self.minimum.left.right = node
+        node.left = self.minimum.left
+        node.right = self.minimum
+        self.minimum.left = node
+
+    def cascading_cut(self, node: Node) -> None:
+        """
+        Marks a node that has just lost a child, or cuts it if it was already marked, repeating
+        up the tree for each cut node.
+        :param node: A heap node that has just lost a child.
+        """
+        parent: Node | None = node.parent
+
+        while parent is not None:
+            if not node.marked:
+                node.marked = True
+                return
+
+            self.cut(node, parent)
+            node = parent
+            parent = node.parent
+
+    def decrease_key(self, node: Node, key: int | float) -> None:
+        """
+        Decreases the key of a node in the heap.
+        :param node: A heap node.
+        :param key: The new key, which must not be greater than the current key.
+        :raises ValueError: Raised if the new key is greater than the current key.
+        """
+        if key > node.key:
+            raise ValueError("The new key cannot be greater than the current key")
+
+        node.key = key
+        parent: Node | None = node.parent
+
+        if parent is not None and key < parent.key:
+            self.cut(node, parent)
+            self.cascading_cut(parent)
+
+        if key < self.minimum.key:
+            self.minimum = node
+
+    def delete(self, node: Node) -> None:
+        """
+        Removes a node from the heap, keeping its key unchanged.
+        :param node: A heap node.
+        """
+        parent: Node | None = node.parent
+
+        if parent is not None:
+            self.cut(node, parent)
+            self.cascading_cut(parent)
+
+        # Force the node to be extracted next
+        self.minimum = node
+        self.extract_minimum()
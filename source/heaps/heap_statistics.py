@@ -0,0 +1,196 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Opt-in Operation Statistics for Fibonacci Heaps
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import time
+from typing import Any, Iterable
+
+from source.heaps.fibonacci_heap import MinimumFibonacciHeap, Node
+
+
+class HeapStatistics:
+    """Counters and timings collected by an InstrumentedFibonacciHeap."""
+
+    def __init__(self) -> None:
+        """
+        Creates zeroed statistics.
+        """
+        self.links: int = 0                         # Roots linked under another root while consolidating
+        self.cuts: int = 0                          # Nodes cut to the root level, including cascading cuts
+        self.cascading_cuts: int = 0                # Cuts caused by cascading up from a decrease_key or delete
+        self.consolidations: int = 0                # Number of consolidations, one per non-emptying extraction
+        self.root_list_total: int = 0               # Sum of the root-level lengths seen by consolidations
+        self.root_list_maximum: int = 0             # Longest root level seen by a consolidation
+        self.root_list_histogram: dict[int, int] = {}
+        """root_list_histogram[b] counts consolidations whose root level length had bit length b, so
+        bucket b holds lengths in [2^(b - 1), 2^b)."""
+        self.maximum_degree: int = 0                # Largest child count of a root after consolidating
+        self.operation_counts: dict[str, int] = {}
+        self.operation_nanoseconds: dict[str, int] = {}
+        self.operation_maximum_nanoseconds: dict[str, int] = {}
+
+    def record_operation(self, name: str, nanoseconds: int) -> None:
+        """
+        Records the duration of one heap operation.
+        :param name: The operation name.
+        :param nanoseconds: The duration of the operation.
+        """
+        self.operation_counts[name] = self.operation_counts.get(name, 0) + 1
+        self.operation_nanoseconds[name] = self.operation_nanoseconds.get(name, 0) + nanoseconds
+
+        if nanoseconds > self.operation_maximum_nanoseconds.get(name, 0):
+            self.operation_maximum_nanoseconds[name] = nanoseconds
+
+    def record_root_list(self, length: int) -> None:
+        """
+        Records the length of the root level at the start of a consolidation.
+        :param length: The number of root nodes.
+        """
+        self.consolidations += 1
+        self.root_list_total += length
+        self.root_list_maximum = max(self.root_list_maximum, length)
+        bucket: int = length.bit_length()
+        self.root_list_histogram[bucket] = self.root_list_histogram.get(bucket, 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        :return: A JSON-serializable copy of the statistics, with per-operation mean and maximum
+        durations.
+        """
+        return {
+            "links": self.links,
+            "cuts": self.cuts,
+            "cascading_cuts": self.cascading_cuts,
+            "consolidations": self.consolidations,
+            "root_list_total": self.root_list_total,
+            "root_list_maximum": self.root_list_maximum,
+            "root_list_mean": self.root_list_total / self.consolidations if self.consolidations else 0.0,
+            "root_list_histogram": {str(bucket): count for bucket, count in sorted(self.root_list_histogram.items())},
+            "maximum_degree": self.maximum_degree,
+            "operations": {
+                name: {
+                    "count": count,
+                    "total_ns": self.operation_nanoseconds[name],
+                    "mean_ns": self.operation_nanoseconds[name] / count,
+                    "maximum_ns": self.operation_maximum_nanoseconds[name],
+                }
+                for name, count in self.operation_counts.items()
+            },
+        }
+
+
+class InstrumentedFibonacciHeap(MinimumFibonacciHeap):
+    """
+    A minimum Fibonacci heap that collects HeapStatistics about its operations.
+    Instrumentation is opted into by constructing this class instead of MinimumFibonacciHeap, so
+    uninstrumented heaps run exactly the same code as before and pay nothing for it.
+    """
+
+    def __init__(self, node: Node | None = None) -> None:
+        """
+        Creates an empty heap, or initializes a heap from existing nodes.
+        :param node: Optional. Any node in the root-level of existing nodes forming a minimum Fibonacci heap.
+        """
+        super().__init__(node)
+        self.statistics: HeapStatistics = HeapStatistics()
+        self.deleting: bool = False     # Whether a delete is running, whose extraction isn't a separate operation
+
+    def snapshot(self, reset: bool = False) -> dict[str, Any]:
+        """
+        Exports the statistics collected so far.
+        :param reset: Whether to start collecting fresh statistics afterwards, for interval reporting.
+        :return: A JSON-serializable copy of the statistics.
+        """
+        snapshot: dict[str, Any] = self.statistics.snapshot()
+
+        if reset:
+            self.statistics = HeapStatistics()
+
+        return snapshot
+
+    def link(self, child: Node, parent: Node) -> None:
+        """Counts the link, then links the nodes."""
+        self.statistics.links += 1
+        super().link(child, parent)
+
+    def cut(self, node: Node, parent: Node) -> None:
+        """Counts the cut, then cuts the node."""
+        self.statistics.cuts += 1
+        super().cut(node, parent)
+
+    def cascading_cut(self, node: Node) -> None:
+        """Cascades the cut, counting the cuts it makes."""
+        cuts: int = self.statistics.cuts
+        super().cascading_cut(node)
+        self.statistics.cascading_cuts += self.statistics.cuts - cuts
+
+    def consolidate(self, start: Node) -> None:
+        """Records the root level length before consolidating and the maximum degree after."""
+        length: int = 1
+        current: Node = start.right
+
+        while current is not start:
+            length += 1
+            current = current.right
+
+        self.statistics.record_root_list(length)
+        super().consolidate(start)
+
+        # The new root level has at most log_phi(n) nodes, so scanning it is cheap
+        current = self.minimum
+
+        while True:
+            self.statistics.maximum_degree = max(self.statistics.maximum_degree, current.child_count)
+            current = current.right
+
+            if current is self.minimum:
+                break
+
+    def insert(self, node: Node) -> None:
+        """Times the operation."""
+        start: int = time.perf_counter_ns()
+        super().insert(node)
+        self.statistics.record_operation("insert", time.perf_counter_ns() - start)
+
+    def insert_many(self, nodes: Iterable[Node]) -> None:
+        """Times the operation."""
+        start: int = time.perf_counter_ns()
+        super().insert_many(nodes)
+        self.statistics.record_operation("insert_many", time.perf_counter_ns() - start)
+
+    def merge(self, other: MinimumFibonacciHeap) -> None:
+        """Times the operation."""
+        start: int = time.perf_counter_ns()
+        super().merge(other)
+        self.statistics.record_operation("merge", time.perf_counter_ns() - start)
+
+    def extract_minimum(self) -> Node:
+        """Times the operation, unless it is the extraction done by delete."""
+        if self.deleting:
+            return super().extract_minimum()
+
+        start: int = time.perf_counter_ns()
+        node: Node = super().extract_minimum()
+        self.statistics.record_operation("extract_minimum", time.perf_counter_ns() - start)
+        return node
+
+    def decrease_key(self, node: Node, key: int | float) -> None:
+        """Times the operation."""
+        start: int = time.perf_counter_ns()
+        super().decrease_key(node, key)
+        self.statistics.record_operation("decrease_key", time.perf_counter_ns() - start)
+
+    def delete(self, node: Node) -> None:
+        """Times the operation."""
+        start: int = time.perf_counter_ns()
+        self.deleting = True
+
+        try:
+            super().delete(node)
+        finally:
+            self.deleting = False
+
+        self.statistics.record_operation("delete", time.perf_counter_ns() - start)
@@ -0,0 +1,225 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Minimum Pairing Heap
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from typing import Any
+
+
+class PairingNode:
+    """A node in a pairing heap."""
+
+    __slots__ = ("key", "data", "child", "sibling", "previous")
+
+    def __init__(self, key: int | float, data: Any = None) -> None:
+        """
+        Creates an isolated root node with a key.
+        :param key: A numeric key for ordering nodes.
+        :param data: Optional node data.
+        """
+        self.key: int | float = key                 # A numeric key for ordering nodes
+        self.data: Any = data                       # Optional node data
+        self.child: PairingNode | None = None       # Leftmost child node, if any
+        self.sibling: PairingNode | None = None     # Right sibling, if any
+        self.previous: PairingNode | None = None    # Left sibling, or parent if leftmost, or None if root
+
+
+class MinimumPairingHeap:
+    """
+    A minimum pairing heap using the two-pass pairing strategy.
+    Each node only has three pointers and extraction needs no auxiliary array, so it has a smaller
+    constant factor than a Fibonacci heap.
+
+    n - number of nodes in the heap
+
+                            Amortized time complexity
+    insert:                 O(1)
+    merge:                  O(1)
+    get_minimum:            O(1)
+    decrease_key:           O(log(n))   (o(log(n)) conjectured, fast in practice)
+    extract_minimum:        O(log(n))
+    delete:                 O(log(n))
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an empty heap.
+        """
+        self.root: PairingNode | None = None
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        """
+        :return: The number of nodes in the heap.
+        """
+        return self.size
+
+    @staticmethod
+    def meld(first: PairingNode, second: PairingNode) -> PairingNode:
+        """
+        Links two root nodes by making the one with the larger key the leftmost child of the other.
+        :param first: A root node.
+        :param second: Another root node.
+        :return: The root node with the smaller key.
+        """
+        if second.key < first.key:
+            first, second = second, first
+
+        second.previous = first
+        second.sibling = first.child
+
+        if first.child is not None:
+            first.child.previous = second
+
+        first.child = second
+        return first
+
+    @classmethod
+    def combine_siblings(cls, first: PairingNode) -> PairingNode:
+        """
+        Combines a list of sibling nodes into a single tree using two-pass pairing.
+        The siblings are melded in pairs left-to-right, and the pairs are then melded right-to-left.
+        :param first: The leftmost sibling node.
+        :return: The root node of the combined tree.
+        """
+        pairs: list[PairingNode] = []
+
+        # First pass: meld adjacent pairs left-to-right
+        while first is not None:
+            second: PairingNode | None = first.sibling
+            first.previous = None
+            first.sibling = None
+
+            if second is None:
+                pairs.append(first)
+                break
+
+            following: PairingNode | None = second.sibling
+            second.previous = None
+            second.sibling = None
+            pairs.append(cls.meld(first, second))
+            first = following
+
+        # Second pass: meld the pairs right-to-left
+        root: PairingNode = pairs.pop()
+
+        while pairs:
+            root = cls.meld(pairs.pop(), root)
+
+        return root
+
+    @staticmethod
+    def detach(node: PairingNode) -> None:
+        """
+        Detaches a non-root node and its subtree from its parent and siblings.
+        :param node: A non-root heap node.
+        """
+        if node.previous.child is node:
+            node.previous.child = node.sibling
+        else:
+            node.previous.sibling = node.sibling
+
+        if node.sibling is not None:
+            node.sibling.previous = node.previous
+
+        node.previous = None
+        node.sibling = None
+
+    def get_minimum(self) -> PairingNode | None:
+        """
+        :return: The heap node with the smallest key, or None if the heap is empty.
+        """
+        return self.root
+
+    def merge(self, other: "MinimumPairingHeap") -> None:
+        """
+        Merges another pairing heap with this one by melding the roots.
+        The other heap is left empty.
+        :param other: The heap to be merged.
+        """
+        if other.root is not None:
+            self.root = other.root if self.root is None else self.meld(self.root, other.root)
+
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+    def insert(self, node: PairingNode) -> None:
+        """
+        Inserts a node into the heap.
+        :param node: The isolated heap node to be inserted.
+        """
+        self.root = node if self.root is None else self.meld(self.root, node)
+        self.size += 1
+
+    def push(self, key: int | float, data: Any = None) -> PairingNode:
+        """
+        Inserts a key and optional data into the heap.
+        :param key: A numeric key for ordering.
+        :param data: Optional data stored with the key.
+        :return: The new heap node, which is the handle for decrease_key and delete.
+        """
+        node: PairingNode = PairingNode(key, data)
+        self.insert(node)
+        return node
+
+    def extract_minimum(self) -> PairingNode:
+        """
+        Removes and returns the heap node with the smallest key.
+        :return: The heap node with the smallest key.
+        :raises IndexError: Raised if the heap is empty.
+        """
+        minimum: PairingNode | None = self.root
+
+        if minimum is None:
+            raise IndexError("Cannot extract from an empty heap")
+
+        self.root = self.combine_siblings(minimum.child) if minimum.child is not None else None
+        minimum.child = None
+        self.size -= 1
+        return minimum
+
+    def pop(self) -> tuple[int | float, Any]:
+        """
+        Removes the smallest key from the heap.
+        :return: The smallest key and its data.
+        :raises IndexError: Raised if the heap is empty.
+        """
+        node: PairingNode = self.extract_minimum()
+        return node.key, node.data
+
+    def decrease_key(self, node: PairingNode, key: int | float) -> None:
+        """
+        Decreases the key of a node in the heap.
+        :param node: A heap node.
+        :param key: The new key, which must not be greater than the current key.
+        :raises ValueError: Raised if the new key is greater than the current key.
+        """
+        if key > node.key:
+            raise ValueError("The new key cannot be greater than the current key")
+
+        node.key = key
+
+        # Cut the subtree off and meld it back in at the root
+        if node is not self.root:
+            self.detach(node)
+            self.root = self.meld(self.root, node)
+
+    def delete(self, node: PairingNode) -> None:
+        """
+        Removes a node from the heap, keeping its key unchanged.
+        :param node: A heap node.
+        """
+        if node is self.root:
+            self.extract_minimum()
+            return
+
+        self.detach(node)
+
+        if node.child is not None:
+            self.root = self.meld(self.root, self.combine_siblings(node.child))
+            node.child = None
+
+        self.size -= 1
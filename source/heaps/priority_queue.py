@@ -0,0 +1,59 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Common Interface of Addressable Minimum Priority Queues
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from typing import Any, Protocol, TypeVar
+
+
+Handle = TypeVar("Handle")
+
+
+class PriorityQueue(Protocol[Handle]):
+    """
+    An addressable minimum priority queue.
+    Inserting a key returns a handle, which later identifies the entry when decreasing its key.
+    MinimumFibonacciHeap, MinimumPairingHeap and IndexedDaryHeap all implement this interface, so
+    they can be swapped for each other.
+    """
+
+    def __len__(self) -> int:
+        """
+        :return: The number of entries in the queue.
+        """
+        ...
+
+    def push(self, key: int | float, data: Any = None) -> Handle:
+        """
+        Inserts a key and optional data into the queue.
+        :param key: A numeric key for ordering.
+        :param data: Optional data stored with the key.
+        :return: A handle to the new entry.
+        """
+        ...
+
+    def pop(self) -> tuple[int | float, Any]:
+        """
+        Removes the smallest key from the queue.
+        :return: The smallest key and its data.
+        :raises IndexError: Raised if the queue is empty.
+        """
+        ...
+
+    def decrease_key(self, handle: Handle, key: int | float) -> None:
+        """
+        Decreases the key of an entry in the queue.
+        :param handle: The handle returned when the entry was inserted.
+        :param key: The new key, which must not be greater than the current key.
+        :raises ValueError: Raised if the new key is greater than the current key.
+        """
+        ...
+
+    def merge(self, other: Any) -> Any:
+        """
+        Moves all entries of another queue of the same type into this one.
+        :param other: The queue to be merged, which is left empty.
+        """
+        ...
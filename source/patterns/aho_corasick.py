@@ -0,0 +1,233 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Aho-Corasick Multiple Exact Pattern Matching
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Iterator, Sequence
+
+from source.suffixes.index_file import map_sections, write_sections
+
+
+class AhoCorasickAutomaton:
+    """
+    An automaton finding all occurrences of a set of patterns in one pass over a text.
+    The trie of the patterns is stored in compressed sparse row form: the edges of each state are
+    sorted by symbol in flat arrays, and found by binary search. Each state also stores its failure
+    link, the longest proper suffix of its string that is a state, and its output link, the nearest
+    state along the failure links that ends a pattern.
+
+    n - number of characters in the text
+    m - total number of characters in the patterns
+    k - alphabet size
+    c - number of matches
+
+    Preprocessing time complexity:  O(m * log(k))
+    Search time complexity:         O(n * log(k) + c)
+    Auxiliary space complexity:     O(m)
+    """
+
+    def __init__(self, patterns: Sequence[str | bytes | bytearray | memoryview] | None) -> None:
+        """
+        Builds the automaton of a set of patterns.
+        :param patterns: A sequence of pattern strings, or of bytes-like objects. None creates an
+        uninitialized automaton for load_aho_corasick.
+        :raises ValueError: Raised if there are no patterns, a pattern is empty, or strings and bytes are mixed.
+        """
+        if patterns is None:
+            return
+
+        if len(patterns) == 0:
+            raise ValueError("There must be at least one pattern")
+
+        if any(len(pattern) == 0 for pattern in patterns):
+            raise ValueError("The patterns cannot be empty")
+
+        self.is_bytes: bool = not isinstance(patterns[0], str)
+
+        if any(isinstance(pattern, str) == self.is_bytes for pattern in patterns):
+            raise ValueError("The patterns must be all strings or all bytes-like objects")
+
+        self.lengths: Sequence[int] = array('i', map(len, patterns))
+
+        # Build the trie
+        children: list[dict[int, int]] = [{}]
+        terminals: list[list[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            state: int = 0
+
+            for symbol in (bytes(pattern) if self.is_bytes else map(ord, pattern)):
+                child: int | None = children[state].get(symbol)
+
+                if child is None:
+                    child = len(children)
+                    children[state][symbol] = child
+                    children.append({})
+                    terminals.append([])
+
+                state = child
+
+            terminals[state].append(index)
+
+        self.build_links(children, terminals)
+        self.build_tables(children, terminals)
+
+    def build_links(self, children: list[dict[int, int]], terminals: list[list[int]]) -> None:
+        """
+        Finds the failure and output links of every state in breadth-first order, so that the links
+        of shorter strings are known first.
+        :param children: children[s][a] is the state reached from state s by symbol a.
+        :param terminals: terminals[s] are the indices of the patterns ending at state s.
+        """
+        self.fail: Sequence[int] = array('i', [0]) * len(children)
+        """fail[s] is the state of the longest proper suffix of the string of state s."""
+
+        self.output_links: Sequence[int] = array('i', [-1]) * len(children)
+        """output_links[s] is the nearest state along the failure links of s that ends a pattern, or -1."""
+
+        queue: deque[int] = deque(children[0].values())
+
+        while len(queue) > 0:
+            state: int = queue.popleft()
+
+            for symbol, child in children[state].items():
+                queue.append(child)
+                fail: int = self.fail[state]
+
+                while fail > 0 and symbol not in children[fail]:
+                    fail = self.fail[fail]
+
+                fail = children[fail].get(symbol, 0) if state > 0 else 0
+                self.fail[child] = fail
+                self.output_links[child] = fail if len(terminals[fail]) > 0 else self.output_links[fail]
+
+    def build_tables(self, children: list[dict[int, int]], terminals: list[list[int]]) -> None:
+        """
+        Flattens the edges and outputs of the states into arrays.
+        :param children: children[s][a] is the state reached from state s by symbol a.
+        :param terminals: terminals[s] are the indices of the patterns ending at state s.
+        """
+        self.offsets: Sequence[int] = array('i', [0])
+        """The edges of state s are at indices offsets[s] to offsets[s + 1] of labels and targets."""
+
+        self.labels: Sequence[int] = array('I')
+        self.targets: Sequence[int] = array('i')
+
+        self.output_offsets: Sequence[int] = array('i', [0])
+        """The patterns ending at state s are outputs[output_offsets[s]:output_offsets[s + 1]]."""
+
+        self.outputs: Sequence[int] = array('i')
+
+        for state in range(len(children)):
+            for symbol in sorted(children[state]):
+                self.labels.append(symbol)
+                self.targets.append(children[state][symbol])
+
+            self.offsets.append(len(self.labels))
+            self.outputs.extend(terminals[state])
+            self.output_offsets.append(len(self.outputs))
+
+    def __len__(self) -> int:
+        """
+        :return: The number of patterns.
+        """
+        return len(self.lengths)
+
+    def finditer(self, text: str | bytes | bytearray | memoryview, start: int = 0,
+                 end: int | None = None) -> Iterator[tuple[int, int]]:
+        """
+        Finds all occurrences of all patterns in the text.
+        :param text: A text of the same kind as the patterns.
+        :param start: The inclusive start of the region to search.
+        :param end: Optional. The exclusive end of the region to search. Defaults to the end of the text.
+        :return: An iterator over pairs of the inclusive start-point of a match and the index of its
+        pattern, ordered by the end of the match and then from the longest match to the shortest.
+        """
+        offsets: Sequence[int] = self.offsets
+        labels: Sequence[int] = self.labels
+        targets: Sequence[int] = self.targets
+        fail: Sequence[int] = self.fail
+        end = len(text) if end is None else min(end, len(text))
+        state: int = 0
+
+        for position in range(max(start, 0), end):
+            symbol: int = text[position] if self.is_bytes else ord(text[position])
+
+            # Follow failure links until the symbol can be read, or the root is reached
+            while True:
+                edge: int = bisect_left(labels, symbol, offsets[state], offsets[state + 1])
+
+                if edge < offsets[state + 1] and labels[edge] == symbol:
+                    state = targets[edge]
+                    break
+
+                if state == 0:
+                    break
+
+                state = fail[state]
+
+            # Report the patterns ending here, from the longest to the shortest
+            output_state: int = state if self.output_offsets[state] < self.output_offsets[state + 1] else \
+                self.output_links[state]
+
+            while output_state >= 0:
+                for i in range(self.output_offsets[output_state], self.output_offsets[output_state + 1]):
+                    index: int = self.outputs[i]
+                    yield position - self.lengths[index] + 1, index
+
+                output_state = self.output_links[output_state]
+
+    def match(self, text: str | bytes | bytearray | memoryview) -> list[list[int]]:
+        """
+        Finds exact occurrences of every pattern in the text.
+        :param text: A text of the same kind as the patterns.
+        :return: A list holding, for each pattern, a list of the inclusive start-points of its matches
+        in the text.
+        """
+        matches: list[list[int]] = [[] for _ in range(len(self))]
+
+        for start, index in self.finditer(text):
+            matches[index].append(start)
+
+        return matches
+
+
+def save_aho_corasick(automaton: AhoCorasickAutomaton, path: str) -> None:
+    """
+    Saves an automaton so it can be memory-mapped by load_aho_corasick.
+    :param automaton: The automaton to save.
+    :param path: The path of the file to write.
+    """
+    write_sections(path, {
+        "parameters": ('q', array('q', [automaton.is_bytes])),
+        "lengths": ('i', automaton.lengths),
+        "fail": ('i', automaton.fail),
+        "output_links": ('i', automaton.output_links),
+        "offsets": ('i', automaton.offsets),
+        "labels": ('I', automaton.labels),
+        "targets": ('i', automaton.targets),
+        "output_offsets": ('i', automaton.output_offsets),
+        "outputs": ('i', automaton.outputs),
+    })
+
+
+def load_aho_corasick(path: str) -> AhoCorasickAutomaton:
+    """
+    Loads an automaton saved by save_aho_corasick without rebuilding or copying it, so that processes
+    loading the same file share its pages.
+    :param path: The path of the automaton file.
+    :return: An automaton whose arrays are memoryviews over the mapped file.
+    """
+    sections: dict[str, memoryview] = map_sections(path)
+    automaton: AhoCorasickAutomaton = AhoCorasickAutomaton(None)
+    automaton.is_bytes = bool(sections["parameters"][0])
+
+    for name in ["lengths", "fail", "output_links", "offsets", "labels", "targets", "output_offsets", "outputs"]:
+        setattr(automaton, name, sections[name])
+
+    return automaton
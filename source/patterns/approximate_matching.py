@@ -0,0 +1,137 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Approximate Pattern Matching with k Mismatches or k Edits
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from source.patterns.z_algorithm import Text
+from source.suffixes.suffix_index import SuffixIndex
+
+
+def k_mismatch_match(text: Text, pattern: str | bytes | bytearray | memoryview, k: int) -> list[tuple[int, int]]:
+    """
+    Finds the alignments of the pattern in the text with at most k mismatching characters using
+    Landau and Vishkin's kangaroo method. A suffix index of the pattern and text joined by a unique
+    separator answers longest common extension queries in constant time, so each alignment jumps
+    over a whole matching run at a time and stops after k + 1 mismatches.
+
+    n - number of characters in the text
+    m - number of characters in the pattern
+
+    Time complexity:            O((n + m) * log(n + m) + n * k)
+    Auxiliary space complexity: O((n + m) * log(n + m))
+
+    :param text: A text string or bytes-like object.
+    :param pattern: A pattern of the same kind as the text.
+    :param k: The maximum number of mismatches.
+    :return: A list of the inclusive start-points of the alignments, with their numbers of mismatches.
+    :raises ValueError: Raised if the pattern is empty or k is negative.
+    """
+    if len(pattern) == 0:
+        raise ValueError("The pattern cannot be empty")
+
+    if k < 0:
+        raise ValueError("The number of mismatches cannot be negative")
+
+    m: int = len(pattern)
+
+    if len(text) < m:
+        return []
+
+    # Shift every symbol up by one to make room for a separator smaller than all of them
+    combined: list[int] = [ord(c) + 1 for c in pattern] if isinstance(pattern, str) else [c + 1 for c in pattern]
+    combined.append(0)
+
+    if isinstance(text, str):
+        combined.extend(ord(c) + 1 for c in text)
+    else:
+        combined.extend(c + 1 for c in text)
+
+    index: SuffixIndex = SuffixIndex(combined)
+    offset: int = m + 1     # The start of the text in the combined sequence
+    matches: list[tuple[int, int]] = []
+
+    for start in range(len(text) - m + 1):
+        mismatches: int = 0
+        i: int = 0
+
+        while i < m and mismatches <= k:
+            # The separator stops every extension at the end of the pattern
+            i += index.longest_common_prefix(i, offset + start + i)
+
+            if i < m:
+                mismatches += 1
+                i += 1
+
+        if mismatches <= k:
+            matches.append((start, mismatches))
+
+    return matches
+
+
+def k_edit_match(text: Text, pattern: str | bytes | bytearray | memoryview, k: int) -> list[tuple[int, int]]:
+    """
+    Finds where substrings of the text within edit distance k of the pattern end, using Myers'
+    bit-parallel algorithm. Column j of the dynamic programming table of the pattern against the
+    text is encoded by the vertical differences between adjacent cells, +1 or -1, as two bit vectors
+    over the pattern, so each text character updates the whole column with a few word operations.
+    Python integers hold patterns of any length.
+
+    n - number of characters in the text
+    m - number of characters in the pattern
+    w - machine word size
+
+    Time complexity:            O(n * m / w)
+    Auxiliary space complexity: O(s * m / w) for s distinct pattern characters
+
+    :param text: A text string or bytes-like object.
+    :param pattern: A pattern of the same kind as the text.
+    :param k: The maximum edit distance, counting insertions, deletions and substitutions.
+    :return: A list of the exclusive end-points in the text where a substring within edit distance k
+    of the pattern ends, with the smallest edit distance of a substring ending there.
+    :raises ValueError: Raised if the pattern is empty or k is negative.
+    """
+    if len(pattern) == 0:
+        raise ValueError("The pattern cannot be empty")
+
+    if k < 0:
+        raise ValueError("The edit distance cannot be negative")
+
+    m: int = len(pattern)
+    full: int = (1 << m) - 1
+    high: int = 1 << (m - 1)
+
+    # Bit i of equalities[c] is set if pattern[i] is c
+    equalities: dict[str | int, int] = {}
+
+    for i, character in enumerate(pattern):
+        equalities[character] = equalities.get(character, 0) | (1 << i)
+
+    positive: int = full    # Bit i is set if cell i + 1 of the column is one more than cell i
+    negative: int = 0       # Bit i is set if cell i + 1 of the column is one less than cell i
+    score: int = m          # The last cell of the column, the edit distance of the whole pattern
+    matches: list[tuple[int, int]] = []
+
+    for j, character in enumerate(text):
+        equal: int = equalities.get(character, 0)
+        vertical: int = equal | negative
+        horizontal: int = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive: int = negative | (~(horizontal | positive) & full)
+        horizontal_negative: int = positive & horizontal
+
+        if horizontal_positive & high:
+            score += 1
+        elif horizontal_negative & high:
+            score -= 1
+
+        # The top row is all zeros since a match can start anywhere, so nothing is shifted in
+        horizontal_positive = (horizontal_positive << 1) & full
+        horizontal_negative = (horizontal_negative << 1) & full
+        positive = horizontal_negative | (~(vertical | horizontal_positive) & full)
+        negative = horizontal_positive & vertical
+
+        if score <= k:
+            matches.append((j + 1, score))
+
+    return matches
@@ -5,54 +5,84 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-from z_algorithm import build_z_array
+from array import array
+from bisect import bisect_left
+from typing import Iterator, Sequence
 
+from source.patterns.z_algorithm import Text, build_z_array
 
-class BoyerMooreMatcher:
-    """An implementation of the Boyer-Moore algorithm for exact pattern matching."""
 
-    def __init__(self, text: str, pattern: str):
+class BoyerMoorePattern:
+    """
+    A pattern preprocessed once for the Boyer-Moore algorithm, which can then search any number of texts.
+    All matching state is local to each search, so a compiled pattern can be shared between threads.
+
+    n - number of characters in the text
+    m - number of characters in the pattern
+    c - number of matches
+
+                                Worst case  Best case
+    Preprocessing time:         O(m)        O(m)
+    Search time complexity:     O(n * m)    O(n / m)
+    Auxiliary space complexity: O(m)        O(m)
+    """
+
+    def __init__(self, pattern: str | bytes | bytearray | memoryview) -> None:
         """
-        Initializes the matcher with a text and pattern string.
-        :param text: A text string.
-        :param pattern: A pattern string.
-        :raises ValueError: Raised if the pattern is longer than the text.
+        Preprocesses a pattern.
+        :param pattern: A pattern string or bytes-like object.
+        :raises ValueError: Raised if the pattern is empty.
         """
-        if len(text) < len(pattern):
-            raise ValueError("The pattern cannot be longer than the text")
+        if len(pattern) == 0:
+            raise ValueError("The pattern cannot be empty")
+
+        self.pattern: str | bytes = pattern if isinstance(pattern, str) else bytes(pattern)
+        self.is_bytes: bool = not isinstance(pattern, str)
 
-        self.text: str = text
-        self.pattern: str = pattern
-        self.text_index: int = len(pattern) - 1
-        self.pattern_index: int = len(pattern) - 1
+        self.positions: array = array('i')
+        """For bytes, positions[offsets[b]:offsets[b + 1]] are the ascending indices of byte b in the
+        pattern. For strings, it's unused and occurrences holds the arrays."""
 
-        self.bad_characters: list[dict[str, int]] = self.build_bad_characters()
-        """bad_characters[i][c] is the index of the rightmost occurrence of character c in
-        pattern[:i + 1]. If there is no such occurrence of character c, there is no
-        key for c in the dictionary bad_characters[i]."""
+        self.offsets: array = array('i')
+        self.occurrences: dict[str, array] = {}
+        """occurrences[c] is an array of the ascending indices of character c in the pattern."""
+
+        self.build_bad_characters()
 
         self.good_suffixes: list[int] = self.build_good_suffixes()
-        """good_suffix[i] is the inclusive endpoint of the rightmost occurrence of pattern[i:] in
+        """good_suffixes[i] is the inclusive endpoint of the rightmost occurrence of pattern[i:] in
         the pattern that is not a suffix, or -1 if no such occurrence exists."""
 
         self.borders: list[int] = self.build_borders()
         """borders[i] is the length of the longest suffix of pattern[i:] that matches a prefix of
         the pattern."""
 
-    def build_bad_characters(self) -> list[dict[str, int]]:
+    def __len__(self) -> int:
         """
-        Finds the rightmost occurrences of each character for each prefix of the pattern.
-        This is a list of dictionaries where positions[i][c] is the index of the rightmost occurrence
-        of character c in pattern[0:i + 1]. If character c doesn't occur in pattern[0:i + 1], there
-        will be no such key c in the relevant dictionary.
+        :return: The number of characters in the pattern.
         """
-        bad_characters: list[dict[str, int]] = [dict() for _ in range(len(self.pattern))]
+        return len(self.pattern)
 
-        for i in range(len(self.pattern)):
-            for j in range(i + 1):
-                bad_characters[i][self.pattern[j]] = j
+    def build_bad_characters(self) -> None:
+        """
+        Finds the positions of each character in the pattern, so that the rightmost occurrence of a
+        character in any prefix of the pattern can be found by binary search. Bytes are bucketed into
+        a dense table of offsets, and other characters into a dictionary of arrays.
+        """
+        if self.is_bytes:
+            counts: list[int] = [0] * 257
+
+            for byte in self.pattern:
+                counts[byte + 1] += 1
 
-        return bad_characters
+            for byte in range(256):
+                counts[byte + 1] += counts[byte]
+
+            self.offsets = array('i', counts)
+            self.positions = array('i', sorted(range(len(self.pattern)), key=self.pattern.__getitem__))
+        else:
+            for i, character in enumerate(self.pattern):
+                self.occurrences.setdefault(character, array('i')).append(i)
 
     def build_good_suffixes(self) -> list[int]:
         """
@@ -61,8 +91,7 @@ class BoyerMooreMatcher:
         """
         # Find an array z_suffix where z_suffix[i] is the length of the longest substring of the
         # pattern ending at index i inclusive that matches a suffix of the pattern
-        reversed_pattern: str = ''.join(reversed(self.pattern))
-        z_suffix: list[int] = build_z_array(reversed_pattern)
+        z_suffix: list[int] = build_z_array(self.pattern[::-1])
         z_suffix.reverse()
 
         good_suffixes: list[int] = [-1 for _ in range(len(self.pattern) + 1)]
@@ -95,59 +124,110 @@ class BoyerMooreMatcher:
 
         return borders
 
-    def get_bad_character_jump(self) -> int:
+    def get_bad_character_jump(self, character: str | int, pattern_index: int) -> int:
         """
+        :param character: The mismatched text character.
+        :param pattern_index: The index of the mismatch in the pattern.
         :return: The jump length based on the extended bad character rule.
         """
-        if self.pattern_index == 0:
-            return 1
+        positions: Sequence[int]
+        start: int = 0
+        stop: int
 
-        bad_character: str = self.text[self.text_index]
-        position: int = self.bad_characters[self.pattern_index - 1].get(bad_character, -1)
-        return self.pattern_index - position
+        if self.is_bytes:
+            positions = self.positions
+            start = self.offsets[character]
+            stop = self.offsets[character + 1]
+        else:
+            positions = self.occurrences.get(character, ())
+            stop = len(positions)
 
-    def get_good_suffix_jump(self) -> int:
-        """
-        :return: The jump length based on the good suffix rule.
-        """
-        return len(self.pattern) - self.good_suffixes[self.pattern_index + 1] - 1
+        # Find the rightmost occurrence of the character in pattern[:pattern_index]
+        rank: int = bisect_left(positions, pattern_index, start, stop)
+        return pattern_index - (positions[rank - 1] if rank > start else -1)
 
-    def get_matched_prefix_jump(self) -> int:
+    def get_good_suffix_jump(self, pattern_index: int) -> int:
         """
-        :return: The jump length based on the matched prefix rule.
+        :param pattern_index: The index of the mismatch in the pattern.
+        :return: The jump length based on the good suffix rule, or on the matched prefix rule if the
+        matched suffix doesn't occur elsewhere in the pattern.
         """
-        return len(self.pattern) - self.borders[self.pattern_index + 1]
+        if pattern_index == len(self.pattern) - 1:
+            return 1    # Nothing was matched
 
-    def match(self) -> list[int]:
+        if self.good_suffixes[pattern_index + 1] >= 0:
+            return len(self.pattern) - self.good_suffixes[pattern_index + 1] - 1
+
+        return len(self.pattern) - self.borders[pattern_index + 1]
+
+    def finditer(self, text: Text, start: int = 0,
+                 end: int | None = None, galil: bool = True) -> Iterator[int]:
         """
         Finds exact occurrences of the pattern in the text.
-        :return: A list of the inclusive start-points of the matches in the text.
-        """
-        matches: list[int] = []
-
-        while self.text_index + len(self.pattern) - self.pattern_index <= len(self.text):
+        With the Galil rule, after a full match the pattern shifts by its period, so the prefix
+        overlapping the previous match is known to match and isn't compared again. This bounds the
+        search to O(n + m) comparisons even on periodic texts and patterns.
+        :param text: A text of the same kind as the pattern. Bytes patterns search any bytes-like text,
+        such as a memory-mapped file, without copying it.
+        :param start: The inclusive start of the region to search.
+        :param end: Optional. The exclusive end of the region to search. Defaults to the end of the text.
+        :param galil: Whether to apply the Galil rule.
+        :return: An iterator over the inclusive start-points of the matches, in increasing order.
+        """
+        pattern: str | bytes = self.pattern
+        m: int = len(pattern)
+        end = len(text) if end is None else min(end, len(text))
+        border: int = self.borders[1] if m > 1 else 0
+        alignment: int = max(start, 0)     # The start of the pattern in the text
+        known: int = 0                      # The length of the prefix known to match at the alignment
+
+        while alignment + m <= end:
             # Scan the pattern with the text right to left
-            while (self.text_index >= 0 and self.pattern_index >= 0 and
-                   self.text[self.text_index] == self.pattern[self.pattern_index]):
-                self.text_index -= 1
-                self.pattern_index -= 1
-
-            if self.pattern_index == -1:
-                # Detect match
-                matches.append(self.text_index + 1)
+            i: int = m - 1
+
+            while i >= known and text[alignment + i] == pattern[i]:
+                i -= 1
+
+            if i < known:
+                yield alignment
+                alignment += m - border
+                known = border if galil else 0
             else:
                 # Jump the pattern along the text
-                jump1: int = self.get_bad_character_jump()
-                jump2: int = self.get_good_suffix_jump()
-                jump3: int = self.get_matched_prefix_jump()
-                jump: int
+                alignment += max(self.get_bad_character_jump(text[alignment + i], i), self.get_good_suffix_jump(i))
+                known = 0
+
 
-                if jump2 > 0:
-                    jump = max(jump1, jump2)
-                else:
-                    jump = max(jump1, jump3)
+def compile(pattern: str | bytes | bytearray | memoryview) -> BoyerMoorePattern:
+    """
+    Preprocesses a pattern for Boyer-Moore matching.
+    :param pattern: A pattern string or bytes-like object.
+    :return: The compiled pattern.
+    :raises ValueError: Raised if the pattern is empty.
+    """
+    return BoyerMoorePattern(pattern)
 
-                self.text_index += len(self.pattern) - self.pattern_index + jump - 1
-                self.pattern_index = len(self.pattern) - 1
 
-        return matches
+class BoyerMooreMatcher:
+    """An implementation of the Boyer-Moore algorithm for exact pattern matching."""
+
+    def __init__(self, text: Text, pattern: str | bytes | bytearray | memoryview):
+        """
+        Initializes the matcher with a text and pattern.
+        :param text: A text string or bytes-like object, such as a memory-mapped file.
+        :param pattern: A pattern of the same kind as the text.
+        :raises ValueError: Raised if the pattern is longer than the text, or empty.
+        """
+        if len(text) < len(pattern):
+            raise ValueError("The pattern cannot be longer than the text")
+
+        self.text: Text = text
+        self.pattern: str | bytes | bytearray | memoryview = pattern
+        self.compiled: BoyerMoorePattern = compile(pattern)
+
+    def match(self) -> list[int]:
+        """
+        Finds exact occurrences of the pattern in the text.
+        :return: A list of the inclusive start-points of the matches in the text.
+        """
+        return list(self.compiled.finditer(self.text))
@@ -0,0 +1,42 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Exact Pattern Matching in Memory-Mapped Files
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import mmap
+import os
+
+from source.patterns.boyer_moore import BoyerMoorePattern, compile
+
+
+def search_file(path: str | os.PathLike, pattern: str | bytes | bytearray | memoryview) -> list[int]:
+    """
+    Finds exact occurrences of a pattern in a file using the Boyer-Moore algorithm with the Galil rule.
+    The file is memory-mapped and searched as bytes, so it is neither decoded nor read into memory,
+    and only the pages the search touches are loaded. The linear worst case relies on the Galil rule,
+    without which periodic patterns take O(n * m) time.
+
+    n - number of bytes in the file
+    m - number of bytes in the pattern
+    c - number of matches
+
+                                Worst case  Best case
+    Time complexity:            O(n + m)    O(n / m)
+    Auxiliary space complexity: O(m + c)    O(m + c)
+
+    :param path: The path of the file.
+    :param pattern: A pattern string, which is encoded as UTF-8, or a bytes-like object.
+    :return: A list of the inclusive byte offsets of the matches in the file.
+    :raises ValueError: Raised if the pattern is empty.
+    """
+    encoded: bytes | bytearray | memoryview = pattern.encode("utf-8") if isinstance(pattern, str) else pattern
+    compiled: BoyerMoorePattern = compile(encoded)
+
+    # Empty files can't be mapped
+    if os.path.getsize(path) == 0:
+        return []
+
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as text:
+        return list(compiled.finditer(text, galil=True))
@@ -5,7 +5,12 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-def naive_match(text: str, pattern: str) -> list[int]:
+from typing import Iterator
+
+from source.patterns.z_algorithm import Text
+
+
+def naive_match(text: Text, pattern: Text) -> list[int]:
     """
     Naively finds the occurrences in the text where the pattern matches exactly.
     Works by manually comparing the pattern at every alignment with the text.
@@ -18,8 +23,8 @@ def naive_match(text: str, pattern: str) -> list[int]:
     Time complexity:            O(n * m)    O(n)
     Auxiliary space complexity: O(c)        O(c)
 
-    :param text: A text string.
-    :param pattern: A pattern string.
+    :param text: A text string or bytes-like object, such as a memory-mapped file.
+    :param pattern: A pattern of the same kind as the text.
     :return: A list of the inclusive starting positions in the text where the pattern matches.
     :raises ValueError: Raised when the pattern is longer than the text.
     """
@@ -28,7 +33,7 @@ def naive_match(text: str, pattern: str) -> list[int]:
 
     matches: list[int] = []
 
-    for i in range(len(text) - len(pattern)):
+    for i in range(len(text) - len(pattern) + 1):
         j: int = 0
 
         while j < len(pattern) and text[i + j] == pattern[j]:
@@ -38,3 +43,25 @@ def naive_match(text: str, pattern: str) -> list[int]:
             matches.append(i)
 
     return matches
+
+
+def naive_finditer(text: Text, pattern: Text, start: int = 0, end: int | None = None) -> Iterator[int]:
+    """
+    Lazily finds the occurrences of the pattern in a region of the text by comparing the pattern at
+    every alignment. Needs no preprocessing, so it suits single-character patterns and short texts.
+    :param text: A text string or bytes-like object.
+    :param pattern: A pattern of the same kind as the text.
+    :param start: The inclusive start of the region to search.
+    :param end: Optional. The exclusive end of the region to search. Defaults to the end of the text.
+    :return: An iterator over the inclusive start-points of the matches, in increasing order.
+    """
+    end = len(text) if end is None else min(end, len(text))
+
+    for i in range(max(start, 0), end - len(pattern) + 1):
+        j: int = 0
+
+        while j < len(pattern) and text[i + j] == pattern[j]:
+            j += 1
+
+        if j == len(pattern):
+            yield i
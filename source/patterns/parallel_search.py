@@ -0,0 +1,140 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Parallel Exact Pattern Matching over Overlapping Chunks
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from source.patterns.boyer_moore import compile
+from source.patterns.z_algorithm import Text
+
+
+PARALLEL_THRESHOLD: int = 1 << 22      # Texts shorter than this are searched in-process
+
+
+def search_shared_chunk(name: str, pattern: bytes, start: int, end: int) -> list[int]:
+    """
+    Searches one chunk of a text in shared memory. Runs in a worker process.
+    :param name: The name of the shared memory block holding the text.
+    :param pattern: The pattern.
+    :param start: The inclusive start of the chunk.
+    :param end: The exclusive end of the chunk, including the overlap with the next chunk.
+    :return: A list of the inclusive start-points of the matches in the chunk.
+    """
+    shared: SharedMemory = SharedMemory(name)
+
+    try:
+        return list(compile(pattern).finditer(shared.buf, start, end))
+    finally:
+        shared.close()
+
+
+def search_file_chunk(path: str | os.PathLike, pattern: bytes, start: int, end: int) -> list[int]:
+    """
+    Searches one chunk of a memory-mapped file. Runs in a worker process, which maps the file itself
+    so all workers share it through the page cache.
+    :param path: The path of the file.
+    :param pattern: The pattern.
+    :param start: The inclusive start of the chunk.
+    :param end: The exclusive end of the chunk, including the overlap with the next chunk.
+    :return: A list of the inclusive start-points of the matches in the chunk.
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as text:
+        return list(compile(pattern).finditer(text, start, end))
+
+
+def split_chunks(n: int, m: int, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Splits a text into chunks that overlap by m - 1 characters, so every match lies wholly inside
+    the chunk where it starts, and inside no other chunk.
+    :param n: The number of characters in the text.
+    :param m: The number of characters in the pattern.
+    :param chunk_size: The number of match start-points in each chunk.
+    :return: A list of the inclusive start and exclusive end of each chunk.
+    """
+    return [(start, min(start + chunk_size + m - 1, n)) for start in range(0, n - m + 1, chunk_size)]
+
+
+def parallel_search(text: Text, pattern: str | bytes | bytearray | memoryview, workers: int | None = None,
+                    chunk_size: int = 1 << 20, threshold: int = PARALLEL_THRESHOLD) -> list[int]:
+    """
+    Finds exact occurrences of a pattern in a large text using the Boyer-Moore algorithm in a process pool.
+    A bytes-like text is copied once into shared memory, and its overlapping chunks are searched by
+    the workers. Since each match is found only by the chunk where it starts, the chunk results are
+    concatenated in order, sorted and without duplicates.
+
+    n - number of characters in the text
+    m - number of characters in the pattern
+    p - number of workers
+
+    Time complexity:            O((n + m * n / chunk_size) / p) in the worst case
+    Auxiliary space complexity: O(n) shared memory plus the matches
+
+    :param text: A text string or bytes-like object. Strings, and texts shorter than the threshold,
+    are searched in-process, since starting workers would cost more than it saves.
+    :param pattern: A pattern of the same kind as the text.
+    :param workers: The number of worker processes. Defaults to the number of CPUs.
+    :param chunk_size: The number of match start-points searched by each task.
+    :param threshold: The length below which the text is searched in-process.
+    :return: A list of the inclusive start-points of the matches in the text.
+    :raises ValueError: Raised if the pattern is empty or the chunk size is less than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1")
+
+    if isinstance(text, str) or len(text) < max(threshold, 1):
+        return list(compile(pattern).finditer(text))
+
+    compile(pattern)    # Validates the pattern before starting any workers
+    shared: SharedMemory = SharedMemory(create=True, size=len(text))
+
+    try:
+        shared.buf[:len(text)] = memoryview(text).cast('B')
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            tasks = [executor.submit(search_shared_chunk, shared.name, bytes(pattern), start, end)
+                     for start, end in split_chunks(len(text), len(pattern), chunk_size)]
+            return [match for task in tasks for match in task.result()]
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def parallel_search_file(path: str | os.PathLike, pattern: str | bytes | bytearray | memoryview,
+                         workers: int | None = None, chunk_size: int = 1 << 20,
+                         threshold: int = PARALLEL_THRESHOLD) -> list[int]:
+    """
+    Finds exact occurrences of a pattern in a large file using the Boyer-Moore algorithm in a process pool.
+    Each worker memory-maps the file and searches its overlapping chunks, so the file is never
+    copied or decoded. The chunk results are concatenated in order, sorted and without duplicates.
+    :param path: The path of the file.
+    :param pattern: A pattern string, which is encoded as UTF-8, or a bytes-like object.
+    :param workers: The number of worker processes. Defaults to the number of CPUs.
+    :param chunk_size: The number of match start-points searched by each task.
+    :param threshold: The size below which the file is searched in-process.
+    :return: A list of the inclusive byte offsets of the matches in the file.
+    :raises ValueError: Raised if the pattern is empty or the chunk size is less than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be at least 1")
+
+    encoded: bytes = pattern.encode("utf-8") if isinstance(pattern, str) else bytes(pattern)
+    compile(encoded)    # Validates the pattern before starting any workers
+    n: int = os.path.getsize(path)
+
+    # Empty files can't be mapped
+    if n == 0:
+        return []
+
+    if n < threshold:
+        return search_file_chunk(path, encoded, 0, n)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = [executor.submit(search_file_chunk, path, encoded, start, end)
+                 for start, end in split_chunks(n, len(encoded), chunk_size)]
+        return [match for task in tasks for match in task.result()]
@@ -0,0 +1,99 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Exact Pattern Matching with Automatic Algorithm Selection
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from functools import lru_cache
+from typing import Iterator
+
+from source.patterns import boyer_moore, shift_and
+from source.patterns.boyer_moore import BoyerMoorePattern
+from source.patterns.naive_matching import naive_finditer
+from source.patterns.shift_and import ShiftAndPattern
+from source.patterns.z_algorithm import Text
+
+
+NAIVE: str = "naive"
+SHIFT_AND: str = "shift_and"
+BOYER_MOORE: str = "boyer_moore"
+
+SHORT_TEXT: int = 64        # Texts shorter than this aren't worth preprocessing a pattern for
+WORD_SIZE: int = 64         # Longest pattern whose Shift-And state fits in a machine word
+SMALL_ALPHABET: int = 4     # Patterns with at most this many distinct characters make Boyer-Moore shifts short
+CACHE_SIZE: int = 256       # Number of compiled patterns kept
+
+
+def select_algorithm(pattern: str | bytes, text_length: int) -> str:
+    """
+    Chooses a matching algorithm for a pattern and text.
+    Naive matching needs no preprocessing, which pays off for single characters and short texts.
+    Boyer-Moore skips more of the text the longer the pattern and the more varied its characters,
+    and Shift-And reads every character at a constant cost for the short and repetitive patterns
+    where Boyer-Moore shifts are short.
+    :param pattern: The pattern.
+    :param text_length: The number of characters in the text.
+    :return: One of NAIVE, SHIFT_AND or BOYER_MOORE.
+    """
+    if len(pattern) == 1 or text_length < SHORT_TEXT:
+        return NAIVE
+
+    if len(pattern) <= WORD_SIZE and len(set(pattern)) <= SMALL_ALPHABET:
+        return SHIFT_AND
+
+    return BOYER_MOORE
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_pattern(pattern: str | bytes, algorithm: str) -> BoyerMoorePattern | ShiftAndPattern:
+    """
+    Preprocesses a pattern, keeping the most recently used compiled patterns.
+    :param pattern: A pattern string or bytes, which must be hashable.
+    :param algorithm: SHIFT_AND or BOYER_MOORE.
+    :return: The compiled pattern.
+    """
+    if algorithm == SHIFT_AND:
+        return shift_and.compile(pattern, classes=False)
+
+    return boyer_moore.compile(pattern)
+
+
+def finditer(text: Text, pattern: str | bytes | bytearray | memoryview, start: int = 0,
+             end: int | None = None) -> Iterator[int]:
+    """
+    Lazily finds exact occurrences of a pattern in a text, using the algorithm chosen by select_algorithm.
+    :param text: A text string or bytes-like object, such as a memory-mapped file.
+    :param pattern: A pattern of the same kind as the text.
+    :param start: The inclusive start of the region to search.
+    :param end: Optional. The exclusive end of the region to search. Defaults to the end of the text.
+    :return: An iterator over the inclusive start-points of the matches, in increasing order.
+    :raises ValueError: Raised if the pattern is empty.
+    :raises TypeError: Raised if one of the text and the pattern is a string and the other is bytes-like.
+    """
+    if len(pattern) == 0:
+        raise ValueError("The pattern cannot be empty")
+
+    if isinstance(text, str) != isinstance(pattern, str):
+        raise TypeError("The pattern must be of the same kind as the text, either a string or bytes-like")
+
+    pattern = pattern if isinstance(pattern, (str, bytes)) else bytes(pattern)
+    stop: int = len(text) if end is None else min(end, len(text))
+    algorithm: str = select_algorithm(pattern, stop - max(start, 0))
+
+    if algorithm == NAIVE:
+        return naive_finditer(text, pattern, start, end)
+
+    return compile_pattern(pattern, algorithm).finditer(text, start, end)
+
+
+def find(text: Text, pattern: str | bytes | bytearray | memoryview) -> list[int]:
+    """
+    Finds exact occurrences of a pattern in a text, using the algorithm chosen by select_algorithm.
+    :param text: A text string or bytes-like object, such as a memory-mapped file.
+    :param pattern: A pattern of the same kind as the text.
+    :return: A list of the inclusive start-points of the matches in the text.
+    :raises ValueError: Raised if the pattern is empty.
+    :raises TypeError: Raised if one of the text and the pattern is a string and the other is bytes-like.
+    """
+    return list(finditer(text, pattern))
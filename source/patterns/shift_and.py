@@ -0,0 +1,207 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Bit-Parallel Shift-And Pattern Matching with Character Classes
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from typing import Iterator
+
+from source.patterns.z_algorithm import Text
+
+
+Position = tuple[set[str | int], bool]
+"""The characters of one pattern position, and whether the position matches all other characters instead."""
+
+
+def parse_classes(pattern: str | bytes) -> list[Position]:
+    """
+    Parses a pattern with character classes into the characters matched at each position.
+    A class like [abc] or [a-z0-9] matches any of its characters, and [^...] matches any other
+    character. A ] first in a class is a member, and a backslash escapes the next character, so \\[
+    matches a literal [.
+    :param pattern: A pattern string or bytes.
+    :return: A list of the characters matched at each position of the pattern.
+    :raises ValueError: Raised if a class is unterminated, a range is reversed, or the pattern ends in
+    a backslash.
+    """
+    symbols: list[str | int] = list(pattern)
+    code = (lambda c: c) if isinstance(pattern, str) else ord
+    n: int = len(symbols)
+    positions: list[Position] = []
+    i: int = 0
+
+    def escaped(j: int) -> int:
+        """Skips a backslash at j, returning the index of the character to use."""
+        if symbols[j] != code("\\"):
+            return j
+
+        if j + 1 >= n:
+            raise ValueError("The pattern cannot end in a backslash")
+
+        return j + 1
+
+    while i < n:
+        if symbols[i] != code("["):
+            i = escaped(i)
+            positions.append(({symbols[i]}, False))
+            i += 1
+            continue
+
+        i += 1
+        negated: bool = i < n and symbols[i] == code("^")
+        i += negated
+        members: set[str | int] = set()
+        first: bool = True
+
+        while True:
+            if i >= n:
+                raise ValueError("The pattern has an unterminated character class")
+
+            if symbols[i] == code("]") and not first:
+                i += 1
+                break
+
+            i = escaped(i)
+            low: str | int = symbols[i]
+
+            if i + 2 < n and symbols[i + 1] == code("-") and symbols[i + 2] != code("]"):
+                i = escaped(i + 2)
+                high: str | int = symbols[i]
+                low_code: int = ord(low) if isinstance(low, str) else low
+                high_code: int = ord(high) if isinstance(high, str) else high
+
+                if low_code > high_code:
+                    raise ValueError(f"The character range {low!r}-{high!r} is reversed")
+
+                members.update(chr(c) if isinstance(low, str) else c for c in range(low_code, high_code + 1))
+            else:
+                members.add(low)
+
+            i += 1
+            first = False
+
+        positions.append((members, negated))
+
+    return positions
+
+
+def case_variants(symbol: str | int) -> set[str | int]:
+    """
+    :param symbol: A character, or a byte which is treated as ASCII.
+    :return: The character with its lower and upper case forms.
+    """
+    if isinstance(symbol, int):
+        return {symbol, symbol ^ 0x20} if 0x41 <= (symbol & ~0x20) <= 0x5A else {symbol}
+
+    return {symbol} | {variant for variant in (symbol.lower(), symbol.upper()) if len(variant) == 1}
+
+
+class ShiftAndPattern:
+    """
+    A pattern preprocessed for bit-parallel matching with the Shift-And algorithm.
+    Bit j of the state is set if the pattern prefix of length j + 1 matches the text ending at the
+    current character, so each text character updates every prefix at once with a shift and an and
+    of the character's mask. This is the complement of Shift-Or, which suits Python integers since
+    the masks keep the state within m bits, and longer patterns use big integers transparently.
+
+    n - number of characters in the text
+    m - number of positions in the pattern
+    w - machine word size
+
+    Preprocessing time complexity:  O(m * k) for k distinct class characters
+    Search time complexity:         O(n * m / w)
+    Auxiliary space complexity:     O(k * m / w)
+    """
+
+    def __init__(self, pattern: str | bytes | bytearray | memoryview, ignore_case: bool = False,
+                 classes: bool = True) -> None:
+        """
+        Preprocesses a pattern.
+        :param pattern: A pattern string or bytes-like object.
+        :param ignore_case: Whether letters match either case. Bytes are case-folded as ASCII.
+        :param classes: Whether to parse character classes in the pattern, or match it literally.
+        :raises ValueError: Raised if the pattern is empty or its classes are malformed.
+        """
+        pattern = pattern if isinstance(pattern, str) else bytes(pattern)
+        positions: list[Position] = parse_classes(pattern) if classes else [({c}, False) for c in pattern]
+
+        if len(positions) == 0:
+            raise ValueError("The pattern cannot be empty")
+
+        if ignore_case:
+            positions = [({variant for c in members for variant in case_variants(c)}, negated)
+                         for members, negated in positions]
+
+        self.is_bytes: bool = not isinstance(pattern, str)
+        self.length: int = len(positions)
+
+        self.default_mask: int = sum(1 << j for j, (_, negated) in enumerate(positions) if negated)
+        """The mask of characters in no class, which match only the negated classes."""
+
+        self.masks: dict[str | int, int] = {}
+        """Bit j of masks[c] is set if character c matches position j of the pattern."""
+
+        for members, _ in positions:
+            for c in members:
+                self.masks[c] = 0
+
+        for j, (members, negated) in enumerate(positions):
+            for c in self.masks:
+                if (c in members) != negated:
+                    self.masks[c] |= 1 << j
+
+        self.table: list[int] = []
+        """For bytes, table[b] is the mask of byte b."""
+
+        if self.is_bytes:
+            self.table = [self.masks.get(b, self.default_mask) for b in range(256)]
+
+    def __len__(self) -> int:
+        """
+        :return: The number of positions in the pattern.
+        """
+        return self.length
+
+    def finditer(self, text: Text, start: int = 0, end: int | None = None) -> Iterator[int]:
+        """
+        Finds occurrences of the pattern in the text.
+        :param text: A text of the same kind as the pattern.
+        :param start: The inclusive start of the region to search.
+        :param end: Optional. The exclusive end of the region to search. Defaults to the end of the text.
+        :return: An iterator over the inclusive start-points of the matches, in increasing order.
+        """
+        end = len(text) if end is None else min(end, len(text))
+        accept: int = 1 << (self.length - 1)
+        state: int = 0
+
+        if self.is_bytes:
+            table: list[int] = self.table
+
+            for position in range(max(start, 0), end):
+                state = ((state << 1) | 1) & table[text[position]]
+
+                if state & accept:
+                    yield position - self.length + 1
+        else:
+            masks: dict[str | int, int] = self.masks
+            default_mask: int = self.default_mask
+
+            for position in range(max(start, 0), end):
+                state = ((state << 1) | 1) & masks.get(text[position], default_mask)
+
+                if state & accept:
+                    yield position - self.length + 1
+
+
+def compile(pattern: str | bytes | bytearray | memoryview, ignore_case: bool = False,
+            classes: bool = True) -> ShiftAndPattern:
+    """
+    Preprocesses a pattern for Shift-And matching.
+    :param pattern: A pattern string or bytes-like object, which may contain character classes.
+    :param ignore_case: Whether letters match either case.
+    :param classes: Whether to parse character classes in the pattern, or match it literally.
+    :return: The compiled pattern.
+    :raises ValueError: Raised if the pattern is empty or its classes are malformed.
+    """
+    return ShiftAndPattern(pattern, ignore_case, classes)
@@ -5,10 +5,17 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-def match(string: str, i: int, j: int) -> int:
+import mmap
+
+
+Text = str | bytes | bytearray | memoryview | mmap.mmap
+"""The kinds of text the matchers accept. Bytes-like texts are indexed as integers, without copying."""
+
+
+def match(string: Text, i: int, j: int) -> int:
     """
     Manually matches two substrings of a string.
-    :param string: A character string.
+    :param string: A character string or bytes-like object.
     :param i: The inclusive startpoint of the first substring.
     :param j: The inclusive startpoint of the second substring.
     :return: The length of the match.
@@ -22,7 +29,7 @@ def match(string: str, i: int, j: int) -> int:
     return length
 
 
-def build_z_array(string: str) -> list[int]:
+def build_z_array(string: Text) -> list[int]:
     """
     Builds the z-array of a string using Gusfield's linear time construction algorithm.
 
@@ -31,7 +38,7 @@ def build_z_array(string: str) -> list[int]:
     Time complexity:            O(n)
     Auxiliary space complexity: O(n)
 
-    :param string: A character string.
+    :param string: A character string or bytes-like object.
     :return: The z-array of the string. The value at index i is the length of the longest substring
     starting at index i inclusive that matches a prefix of the string.
     """
@@ -5,37 +5,140 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-from z_algorithm import build_z_array
+from typing import BinaryIO, Iterable, Iterator, TextIO
 
+from source.patterns.z_algorithm import Text, build_z_array
 
-def z_match(text: str, pattern: str) -> list[int]:
+
+def z_match(text: Text, pattern: Text) -> list[int]:
     """
-    Finds exact matches of the pattern in the text using the z-array of the combined pattern and
-    text.
-    Works by building the z-array for the combined pattern and text, and then using that to find
-    substring matches of the pattern in the text.
+    Finds exact matches of the pattern in the text using the z-array of the pattern.
+    Works like building the z-array of the combined pattern and text, but the z-values of the text
+    are found on the fly against the pattern's z-array and only the rightmost z-box is kept, so the
+    text is never copied and no separator character is needed.
 
     n - number of characters in the text
     m - number of characters in the pattern
     c - number of matches
 
     Time complexity:            O(n + m)
-    Auxiliary space complexity: O(n + m + c)
+    Auxiliary space complexity: O(m + c)
 
-    :param text: A text string.
-    :param pattern: A pattern string.
+    :param text: A text string or bytes-like object, such as a memory-mapped file.
+    :param pattern: A pattern of the same kind as the text.
     :return: A list of the inclusive start-points of the matches of the pattern in the text.
     :raises ValueError: Raised if the pattern is longer than the text.
     """
     if len(text) < len(pattern):
         raise ValueError("The pattern cannot be longer than the text")
 
-    combined_string: str = pattern + '$' + text     # Assume '$' doesn't occur in the pattern or text
-    z_array: list[int] = build_z_array(combined_string)
+    z_array: list[int] = build_z_array(pattern)
+    m: int = len(pattern)
+    left: int = 0       # The inclusive startpoint of the rightmost z-box in the text
+    right: int = 0      # The exclusive endpoint of the rightmost z-box in the text
     matches: list[int] = []
 
-    for i in range(len(text)):
-        if z_array[len(pattern) + 1 + i] == len(pattern):
+    for i in range(len(text) - m + 1):
+        length: int
+
+        if i < right and z_array[i - left] < right - i:
+            length = z_array[i - left]
+        else:
+            # Extend past the known part of the z-box, if any
+            length = max(right - i, 0)
+
+            while length < m and text[i + length] == pattern[length]:
+                length += 1
+
+            if length > 0:
+                left = i
+                right = i + length
+
+        if length == m:
             matches.append(i)
 
     return matches
+
+
+def build_failures(pattern: str | bytes) -> list[int]:
+    """
+    Converts the z-array of a pattern into failure values for matching the pattern one character at
+    a time. Each z-box starting at i > 0 is a prefix of the pattern ending at i + z - 1, and the
+    longest such box ending at a position is the one with the smallest start.
+
+    m - number of characters in the pattern
+
+    Time complexity:            O(m)
+    Auxiliary space complexity: O(m)
+
+    :param pattern: A pattern string or bytes.
+    :return: A list where the value at index i is the length of the longest proper suffix of
+    pattern[:i + 1] that matches a prefix of the pattern, where pattern[i + 1] differs from the
+    character after the prefix, or 0 if there is no such suffix.
+    """
+    z_array: list[int] = build_z_array(pattern)
+    failures: list[int] = [0 for _ in range(len(pattern))]
+
+    for i in reversed(range(1, len(pattern))):
+        if z_array[i] > 0:
+            failures[i + z_array[i] - 1] = z_array[i]
+
+    return failures
+
+
+def read_chunks(source: Iterable[str | bytes] | TextIO | BinaryIO, chunk_size: int) -> Iterator[str | bytes]:
+    """
+    :param source: An iterable of text chunks, or a file object.
+    :param chunk_size: The number of characters read from a file object at a time.
+    :return: An iterator over the chunks of the text.
+    """
+    if not hasattr(source, "read"):
+        yield from source
+        return
+
+    while chunk := source.read(chunk_size):
+        yield chunk
+
+
+def z_match_stream(source: Iterable[str | bytes] | TextIO | BinaryIO, pattern: str | bytes,
+                   chunk_size: int = 1 << 16) -> Iterator[int]:
+    """
+    Lazily finds exact matches of the pattern in a text read chunk by chunk.
+    The failure values derived from the z-array of the pattern say how much of the pattern still
+    matches after a mismatch, so the text is read once and only the pattern is kept in memory.
+    Matches spanning chunk boundaries are found, and no separator character is needed.
+
+    n - number of characters in the text
+    m - number of characters in the pattern
+
+    Time complexity:            O(n + m)
+    Auxiliary space complexity: O(m) plus one chunk
+
+    :param source: An iterable of text chunks, such as a generator or a list, or a file object open
+    in text or binary mode. Chunks have the same type as the pattern.
+    :param pattern: A pattern string or bytes.
+    :param chunk_size: The number of characters read from a file object at a time.
+    :return: An iterator over the inclusive start-points of the matches in the text, in increasing order.
+    :raises ValueError: Raised if the pattern is empty.
+    """
+    if len(pattern) == 0:
+        raise ValueError("The pattern cannot be empty")
+
+    failures: list[int] = build_failures(pattern)
+    m: int = len(pattern)
+    matched: int = 0        # The length of the pattern prefix matching the end of the text read so far
+    offset: int = 0         # The number of characters read before the current chunk
+
+    for chunk in read_chunks(source, chunk_size):
+        for i, character in enumerate(chunk):
+            while matched > 0 and character != pattern[matched]:
+                matched = failures[matched - 1]
+
+            if character == pattern[matched]:
+                matched += 1
+
+            if matched == m:
+                yield offset + i - m + 1
+                matched = failures[m - 1]
+
+        offset += len(chunk)
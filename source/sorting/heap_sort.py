@@ -0,0 +1,66 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Heap Sort of Numbers
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+def sift_down(numbers: list[int | float], start: int, stop: int, i: int) -> None:
+    """
+    Moves an item down a max-heap stored in a sublist until it is no smaller than its children.
+    :param numbers: A list of numbers.
+    :param start: The inclusive start of the heap, which is its root.
+    :param stop: The exclusive stop of the heap.
+    :param i: The index of the item to move down.
+    """
+    item: int | float = numbers[i]
+
+    while True:
+        child: int = start + 2 * (i - start) + 1
+
+        if child >= stop:
+            break
+
+        # Pick the larger child
+        if child + 1 < stop and numbers[child + 1] > numbers[child]:
+            child += 1
+
+        if numbers[child] <= item:
+            break
+
+        numbers[i] = numbers[child]
+        i = child
+
+    numbers[i] = item
+
+
+def heap_sort(numbers: list[int | float], start: int = 0, stop: int | None = None) -> list[int | float]:
+    """
+    Sorts a list of numbers in non-decreasing order using heapsort.
+    Works by arranging the sublist into a max-heap, and then repeatedly swapping the maximum of the
+    heap to the end of the sublist and restoring the heap on the remaining items.
+
+    n - number of items in the list
+
+                                Best case       Worst case      Average case
+    Time complexity:            O(n * log(n))   O(n * log(n))   O(n * log(n))
+    Auxiliary space complexity: O(1)            O(1)            O(1)
+
+    :param numbers: A list of numbers.
+    :param start: The inclusive start of the sublist to sort.
+    :param stop: The exclusive stop of the sublist to sort.
+    :return: The list of numbers with the sublist sorted in non-decreasing order.
+    """
+    stop = len(numbers) if stop is None else stop
+
+    # Heapify bottom-up, starting from the last parent
+    for i in reversed(range(start, start + (stop - start) // 2)):
+        sift_down(numbers, start, stop, i)
+
+    for end in range(stop - 1, start, -1):
+        buffer: int | float = numbers[start]
+        numbers[start] = numbers[end]
+        numbers[end] = buffer
+        sift_down(numbers, start, end, start)
+
+    return numbers
@@ -5,7 +5,7 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-def insertion_sort(numbers: list[int | float]) -> list[int | float]:
+def insertion_sort(numbers: list[int | float], start: int = 0, stop: int | None = None) -> list[int | float]:
     """
     Sorts a list of numbers in non-decreasing order using insertion sort.
     Works by maintaining a sorted sublist and an unsorted sublist, and growing the sorted sublist
@@ -19,13 +19,17 @@ def insertion_sort(numbers: list[int | float]) -> list[int | float]:
     Auxiliary space complexity: O(1)        O(1)        O(1)
 
     :param numbers: A list of numbers.
-    :return: The list of numbers sorted in non-decreasing order.
+    :param start: The inclusive start of the sublist to sort.
+    :param stop: The exclusive stop of the sublist to sort.
+    :return: The list of numbers with the sublist sorted in non-decreasing order.
     """
-    for i in range(1, len(numbers)):
+    stop = len(numbers) if stop is None else stop
+
+    for i in range(start + 1, stop):
         item: int | float = numbers[i]
         j: int = i - 1
 
-        while j >= 0 and numbers[j] > item:
+        while j >= start and numbers[j] > item:
             numbers[j + 1] = numbers[j]
             j -= 1
 
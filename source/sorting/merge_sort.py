@@ -5,8 +5,30 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
+from bisect import bisect_left, bisect_right
+
+
+MINIMUM_GALLOP: int = 7     # Consecutive wins by one run before an adaptive merge starts galloping
+
+
+def compute_minimum_run(n: int) -> int:
+    """
+    Finds the minimum natural run length for adaptive merge sort, between 32 and 64, such that n
+    divided by it is a power of two or slightly less, so that the final merges are balanced.
+    :param n: The number of items to sort.
+    :return: The minimum run length, or n if n is less than 64.
+    """
+    remainder: int = 0
+
+    while n >= 64:
+        remainder |= n & 1
+        n >>= 1
+
+    return n + remainder
+
+
 class MergeSorter:
-    """Implements merge sorting of numbers."""
+    """Implements merge sorting of numbers, with an adaptive mode that exploits existing order."""
 
     def __init__(self, numbers: list[int | float]):
         """
@@ -14,6 +36,8 @@ class MergeSorter:
         :param numbers: A list of numbers.
         """
         self.numbers: list[int | float] = numbers
+        self.buffer: list[int | float] = []     # The scratch buffer of adaptive_sort
+        self.minimum_gallop: int = MINIMUM_GALLOP
 
     def merge(self, left_start: int, left_stop: int, right_start: int, right_stop: int) -> list[int | float]:
         """
@@ -63,3 +87,326 @@ class MergeSorter:
         self.sort(middle, stop)
         self.numbers[start:stop] = self.merge(start, middle, middle, stop)
         return self.numbers
+
+    def count_run(self, start: int, stop: int) -> int:
+        """
+        Finds the natural run at the start of a sublist, reversing it if it is strictly descending.
+        Descending runs must be strict so that reversing them keeps equal items in order.
+        :param start: The inclusive start of the sublist.
+        :param stop: The exclusive stop of the sublist.
+        :return: The exclusive stop of the run, which is now non-decreasing.
+        """
+        numbers: list[int | float] = self.numbers
+        end: int = start + 1
+
+        if end == stop:
+            return stop
+
+        if numbers[end] < numbers[start]:
+            while end < stop and numbers[end] < numbers[end - 1]:
+                end += 1
+
+            numbers[start:end] = numbers[start:end][::-1]
+        else:
+            while end < stop and numbers[end] >= numbers[end - 1]:
+                end += 1
+
+        return end
+
+    def binary_insertion_sort(self, start: int, sorted_stop: int, stop: int) -> None:
+        """
+        Extends a sorted sublist by inserting the items after it, using binary search to find each
+        position. Equal items are inserted after existing ones so the sort stays stable.
+        :param start: The inclusive start of the sorted sublist.
+        :param sorted_stop: The exclusive stop of the sorted sublist.
+        :param stop: The exclusive stop of the sublist to sort.
+        """
+        numbers: list[int | float] = self.numbers
+
+        for i in range(sorted_stop, stop):
+            item: int | float = numbers[i]
+            position: int = bisect_right(numbers, item, start, i)
+
+            for j in range(i, position, -1):
+                numbers[j] = numbers[j - 1]
+
+            numbers[position] = item
+
+    @staticmethod
+    def gallop(key: int | float, values: list[int | float], start: int, stop: int, right: bool,
+               reverse: bool = False) -> int:
+        """
+        Finds where a key belongs in a sorted sublist by exponential search from one end, followed by
+        binary search, so that positions k items from that end are found in O(log(k)) comparisons.
+        :param key: The key to find.
+        :param values: A list sorted within the sublist.
+        :param start: The inclusive start of the sublist.
+        :param stop: The exclusive stop of the sublist.
+        :param right: Whether to find the position after the items equal to the key, instead of before.
+        :param reverse: Whether to search from the stop instead of the start.
+        :return: The index of the first item greater than the key if right is true, otherwise the
+        index of the first item greater than or equal to the key.
+        """
+        bisect = bisect_right if right else bisect_left
+        offset: int = 1
+
+        if not reverse:
+            low: int = start    # Every item before low belongs before the key
+
+            while start + offset - 1 < stop and (values[start + offset - 1] <= key if right
+                                                 else values[start + offset - 1] < key):
+                low = start + offset
+                offset *= 2
+
+            return bisect(values, key, low, min(start + offset - 1, stop))
+
+        high: int = stop        # Every item from high belongs after the key
+
+        while stop - offset >= start and not (values[stop - offset] <= key if right else values[stop - offset] < key):
+            high = stop - offset
+            offset *= 2
+
+        return bisect(values, key, max(stop - offset + 1, start), high)
+
+    def merge_low(self, start: int, middle: int, stop: int) -> None:
+        """
+        Merges two adjacent sorted runs in place, copying the left run into the scratch buffer and
+        merging from the start. The left run must be no longer than the right one.
+        After MINIMUM_GALLOP consecutive wins by one run, the merge gallops, copying whole blocks of
+        items found by exponential search. The threshold adapts to how well galloping pays off.
+        :param start: The inclusive start of the left run.
+        :param middle: The exclusive stop of the left run and the inclusive start of the right run.
+        :param stop: The exclusive stop of the right run.
+        """
+        numbers: list[int | float] = self.numbers
+        buffer: list[int | float] = self.buffer
+        length: int = middle - start
+
+        for i in range(length):
+            buffer[i] = numbers[start + i]
+
+        i: int = 0              # The next item of the left run, in the buffer
+        j: int = middle         # The next item of the right run
+        k: int = start          # The next position to fill
+
+        while i < length and j < stop:
+            left_wins: int = 0
+            right_wins: int = 0
+
+            # Merge one item at a time until one run keeps winning
+            while i < length and j < stop and left_wins < self.minimum_gallop and right_wins < self.minimum_gallop:
+                if numbers[j] < buffer[i]:
+                    numbers[k] = numbers[j]
+                    j += 1
+                    right_wins += 1
+                    left_wins = 0
+                else:
+                    numbers[k] = buffer[i]
+                    i += 1
+                    left_wins += 1
+                    right_wins = 0
+
+                k += 1
+
+            # Gallop while it moves long blocks at a time
+            while i < length and j < stop:
+                left_count: int = self.gallop(numbers[j], buffer, i, length, True) - i
+
+                for _ in range(left_count):
+                    numbers[k] = buffer[i]
+                    i += 1
+                    k += 1
+
+                if i == length:
+                    break
+
+                right_count: int = self.gallop(buffer[i], numbers, j, stop, False) - j
+
+                for _ in range(right_count):
+                    numbers[k] = numbers[j]
+                    j += 1
+                    k += 1
+
+                if left_count < MINIMUM_GALLOP and right_count < MINIMUM_GALLOP:
+                    self.minimum_gallop += 1
+                    break
+
+                self.minimum_gallop = max(self.minimum_gallop - 1, 1)
+
+        # The rest of the right run is already in place
+        while i < length:
+            numbers[k] = buffer[i]
+            i += 1
+            k += 1
+
+    def merge_high(self, start: int, middle: int, stop: int) -> None:
+        """
+        Merges two adjacent sorted runs in place, copying the right run into the scratch buffer and
+        merging from the stop. The right run must be no longer than the left one. Gallops like merge_low.
+        :param start: The inclusive start of the left run.
+        :param middle: The exclusive stop of the left run and the inclusive start of the right run.
+        :param stop: The exclusive stop of the right run.
+        """
+        numbers: list[int | float] = self.numbers
+        buffer: list[int | float] = self.buffer
+        length: int = stop - middle
+
+        for j in range(length):
+            buffer[j] = numbers[middle + j]
+
+        i: int = middle - 1     # The last unmerged item of the left run
+        j: int = length - 1     # The last unmerged item of the right run, in the buffer
+        k: int = stop - 1       # The last unfilled position
+
+        while i >= start and j >= 0:
+            left_wins: int = 0
+            right_wins: int = 0
+
+            # Merge one item at a time until one run keeps winning
+            while i >= start and j >= 0 and left_wins < self.minimum_gallop and right_wins < self.minimum_gallop:
+                if buffer[j] < numbers[i]:
+                    numbers[k] = numbers[i]
+                    i -= 1
+                    left_wins += 1
+                    right_wins = 0
+                else:
+                    numbers[k] = buffer[j]
+                    j -= 1
+                    right_wins += 1
+                    left_wins = 0
+
+                k -= 1
+
+            # Gallop while it moves long blocks at a time
+            while i >= start and j >= 0:
+                left_count: int = i + 1 - self.gallop(buffer[j], numbers, start, i + 1, True, True)
+
+                for _ in range(left_count):
+                    numbers[k] = numbers[i]
+                    i -= 1
+                    k -= 1
+
+                if i < start:
+                    break
+
+                right_count: int = j + 1 - self.gallop(numbers[i], buffer, 0, j + 1, False, True)
+
+                for _ in range(right_count):
+                    numbers[k] = buffer[j]
+                    j -= 1
+                    k -= 1
+
+                if left_count < MINIMUM_GALLOP and right_count < MINIMUM_GALLOP:
+                    self.minimum_gallop += 1
+                    break
+
+                self.minimum_gallop = max(self.minimum_gallop - 1, 1)
+
+        # The rest of the left run is already in place
+        while j >= 0:
+            numbers[k] = buffer[j]
+            j -= 1
+            k -= 1
+
+    def merge_runs(self, start: int, middle: int, stop: int) -> None:
+        """
+        Merges two adjacent sorted runs in place, skipping the items already in their final positions.
+        :param start: The inclusive start of the left run.
+        :param middle: The exclusive stop of the left run and the inclusive start of the right run.
+        :param stop: The exclusive stop of the right run.
+        """
+        # Items of the left run no greater than the right run's first item are in place, as are
+        # items of the right run no less than the left run's last item
+        start = self.gallop(self.numbers[middle], self.numbers, start, middle, True)
+        stop = self.gallop(self.numbers[middle - 1], self.numbers, middle, stop, False, True)
+
+        if start == middle or stop == middle:
+            return
+
+        if middle - start <= stop - middle:
+            self.merge_low(start, middle, stop)
+        else:
+            self.merge_high(start, middle, stop)
+
+    def merge_at(self, runs: list[tuple[int, int]], i: int) -> None:
+        """
+        Merges runs i and i + 1 of the run stack.
+        :param runs: The stack of pending runs, as their inclusive starts and exclusive stops.
+        :param i: The index of the first run to merge.
+        """
+        start, middle = runs[i]
+        stop: int = runs[i + 1][1]
+        self.merge_runs(start, middle, stop)
+        runs[i:i + 2] = [(start, stop)]
+
+    def merge_collapse(self, runs: list[tuple[int, int]]) -> None:
+        """
+        Merges pending runs until the lengths on the stack shrink faster than the Fibonacci numbers
+        from bottom to top, which keeps merges balanced and the stack O(log(n)) deep.
+        :param runs: The stack of pending runs, as their inclusive starts and exclusive stops.
+        """
+        while len(runs) > 1:
+            lengths: list[int] = [stop - start for start, stop in runs[-4:]]
+            i: int = len(runs) - 2
+            top: int = len(lengths) - 2
+
+            if ((top > 0 and lengths[top - 1] <= lengths[top] + lengths[top + 1]) or
+                    (top > 1 and lengths[top - 2] <= lengths[top - 1] + lengths[top])):
+                self.merge_at(runs, i - 1 if lengths[top - 1] < lengths[top + 1] else i)
+            elif lengths[top] <= lengths[top + 1]:
+                self.merge_at(runs, i)
+            else:
+                break
+
+    def adaptive_sort(self, start: int = 0, stop: int | None = None) -> list[int | float]:
+        """
+        Sorts a list of numbers in non-decreasing order using an adaptive natural merge sort, like Timsort.
+        Works by splitting the list into natural runs that are already sorted, extending short runs
+        to a minimum length with binary insertion sort, and merging the runs on a stack whose
+        invariants keep merges balanced. Merges skip items already in place, gallop through long
+        blocks from one run, and share one scratch buffer of half the list. The sort is stable.
+
+        n - number of items in the list
+        r - number of natural runs in the list
+
+                                    Best case       Worst case      Average case
+        Time complexity:            O(n)            O(n * log(n))   O(n * log(r))
+        Auxiliary space complexity: O(n)            O(n)            O(n)
+
+        :param start: The inclusive start of the sublist to be sorted.
+        :param stop: The exclusive stop of the sublist to be sorted.
+        :return: The list of numbers sorted in non-decreasing order.
+        """
+        stop = len(self.numbers) if stop is None else stop
+
+        if stop - start < 2:
+            return self.numbers
+
+        self.buffer = [0] * ((stop - start) // 2)
+        self.minimum_gallop = MINIMUM_GALLOP
+        minimum_run: int = compute_minimum_run(stop - start)
+        runs: list[tuple[int, int]] = []
+        position: int = start
+
+        while position < stop:
+            run_stop: int = self.count_run(position, stop)
+
+            if run_stop - position < minimum_run:
+                extended_stop: int = min(position + minimum_run, stop)
+                self.binary_insertion_sort(position, run_stop, extended_stop)
+                run_stop = extended_stop
+
+            runs.append((position, run_stop))
+            self.merge_collapse(runs)
+            position = run_stop
+
+        # Merge the remaining runs, merging the middle of the top three with its shorter neighbour
+        while len(runs) > 1:
+            i: int = len(runs) - 2
+
+            if i > 0 and runs[i - 1][1] - runs[i - 1][0] < runs[i + 1][1] - runs[i + 1][0]:
+                i -= 1
+
+            self.merge_at(runs, i)
+
+        return self.numbers
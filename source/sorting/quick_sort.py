@@ -5,8 +5,19 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
+from source.sorting.heap_sort import heap_sort
+from source.sorting.insertion_sort import insertion_sort
+
+
+INSERTION_SORT_CUTOFF: int = 16     # Sublists up to this long are insertion sorted in introsort
+NINTHER_CUTOFF: int = 128           # Sublists at least this long use the ninther as the pivot in introsort
+
+
 class QuickSorter:
-    """An implementation of quicksort using DNF partitioning and random pivot selection."""
+    """
+    An implementation of quicksort using DNF partitioning and middle pivot selection, with an
+    introsort mode that guarantees O(n * log(n)) time on adversarial inputs.
+    """
 
     def __init__(self, numbers: list[int | float]) -> None:
         """
@@ -38,7 +49,7 @@ class QuickSorter:
         middle: int = start     # numbers[low:middle] == pivot
         high: int = stop        # numbers[high:stop] > pivot
 
-        while middle < stop:
+        while middle < high:
             if self.numbers[middle] < pivot:
                 self.swap(low, middle)
                 low += 1
@@ -68,3 +79,84 @@ class QuickSorter:
         self.sort(start, left)
         self.sort(right, stop)
         return self.numbers
+
+    def median_of_three(self, first: int, second: int, third: int) -> int:
+        """
+        :param first: The index of the first item.
+        :param second: The index of the second item.
+        :param third: The index of the third item.
+        :return: The index of the median of the three items.
+        """
+        a: int | float = self.numbers[first]
+        b: int | float = self.numbers[second]
+        c: int | float = self.numbers[third]
+
+        if a < b:
+            return second if b < c else (third if a < c else first)
+
+        return first if a < c else (third if b < c else second)
+
+    def choose_pivot(self, start: int, stop: int) -> int:
+        """
+        Chooses a pivot that is close to the median of a sublist, even on sorted, reversed and
+        organ-pipe inputs. Short sublists use the median of their first, middle and last items, and
+        long ones use Tukey's ninther, the median of three such medians spread across the sublist.
+        :param start: The inclusive start of the sublist.
+        :param stop: The exclusive stop of the sublist.
+        :return: The index of the pivot.
+        """
+        last: int = stop - 1
+        middle: int = (start + stop) // 2
+
+        if stop - start < NINTHER_CUTOFF:
+            return self.median_of_three(start, middle, last)
+
+        step: int = (stop - start) // 8
+        return self.median_of_three(self.median_of_three(start, start + step, start + 2 * step),
+                                    self.median_of_three(middle - step, middle, middle + step),
+                                    self.median_of_three(last - 2 * step, last - step, last))
+
+    def introsort(self, start: int = 0, stop: int | None = None) -> list[int | float]:
+        """
+        Sorts the numbers in non-decreasing order using introsort.
+        Quicksort with median-of-three or ninther pivots partitions the list, keeping the larger side
+        on an explicit stack and continuing with the smaller side, so at most O(log(n)) sublists are
+        pending. Short sublists are insertion sorted, and a sublist that is still long after
+        2 * log(n) partitions is heapsorted, which bounds the time however the pivots fall.
+
+        n - number of items in the list
+
+                                    Best case       Worst case      Average case
+        Time complexity:            O(n)            O(n * log(n))   O(n * log(n))
+        Auxiliary space complexity: O(log(n))       O(log(n))       O(log(n))
+
+        :param start: The inclusive start of the sublist to sort.
+        :param stop: The exclusive stop of the sublist to sort.
+        :return: The sorted list.
+        """
+        stop = len(self.numbers) if stop is None else stop
+        stack: list[tuple[int, int, int]] = [(start, stop, 2 * max(stop - start, 1).bit_length())]
+
+        while len(stack) > 0:
+            start, stop, depth = stack.pop()
+
+            while stop - start > INSERTION_SORT_CUTOFF:
+                if depth == 0:
+                    heap_sort(self.numbers, start, stop)
+                    break
+
+                depth -= 1
+                left, right = self.dnf_partition(start, stop, self.numbers[self.choose_pivot(start, stop)])
+
+                # Defer the larger side and continue with the smaller one
+                if left - start < stop - right:
+                    stack.append((right, stop, depth))
+                    stop = left
+                else:
+                    stack.append((start, left, depth))
+                    start = right
+
+            if stop - start <= INSERTION_SORT_CUTOFF:
+                insertion_sort(self.numbers, start, stop)
+
+        return self.numbers
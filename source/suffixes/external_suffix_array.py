@@ -0,0 +1,225 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# External-Memory Multi-Process Suffix Array Construction
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import heapq
+import itertools
+import mmap
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+from source.suffixes.index_file import map_sections, write_header
+
+
+RUN_BUFFER_SIZE: int = 1 << 16      # Number of suffixes read from a run, or written, at a time
+INITIAL_LENGTH: int = 7             # Number of bytes packed into each initial rank, which fits a signed 64-bit integer
+
+
+def map_ranks(ranks_path: str, writable: bool = False) -> memoryview:
+    """
+    Memory-maps a rank file.
+    :param ranks_path: The path of a file of 8-byte ranks, one per text position.
+    :param writable: Whether the ranks will be written, in which case writes go straight to the file.
+    :return: A memoryview of the ranks.
+    """
+    with open(ranks_path, "r+b" if writable else "rb") as file:
+        mapping: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+    return memoryview(mapping).cast('q')
+
+
+def rank_block(input_path: str, ranks_path: str, start: int, stop: int) -> None:
+    """
+    Ranks the suffixes starting in one block of the text by their first INITIAL_LENGTH bytes.
+    Each rank packs the bytes in big-endian order, padded with zeros, above the number of bytes, so
+    that a suffix shorter than INITIAL_LENGTH ranks below the longer suffixes it is a prefix of.
+    Runs in a worker process, which writes its block of ranks into the shared rank file.
+    :param input_path: The path of the text file.
+    :param ranks_path: The path of the rank file.
+    :param start: The inclusive start of the block.
+    :param stop: The exclusive stop of the block.
+    """
+    with open(input_path, "rb") as file:
+        file.seek(start)
+        window: bytes = file.read(stop - start + INITIAL_LENGTH - 1)
+
+    ranks: memoryview = map_ranks(ranks_path, writable=True)
+    block: array = array('q', [0]) * (stop - start)
+
+    for i in range(stop - start):
+        prefix: bytes = window[i:i + INITIAL_LENGTH]
+        block[i] = int.from_bytes(prefix.ljust(INITIAL_LENGTH, b"\0"), "big") << 3 | len(prefix)
+
+    ranks[start:stop] = memoryview(block)
+
+
+def sort_block(ranks_path: str, half_length: int, start: int, stop: int, run_path: str) -> str:
+    """
+    Sorts the suffixes starting in one block of the text by their rank pairs, writing them to a run file.
+    The pair of suffix i is the ranks of its first and second halves, ranks[i] and ranks[i + half_length],
+    with -1 for a second half past the end of the text. Runs in a worker process, which maps the rank
+    file itself so all workers share it through the page cache.
+    :param ranks_path: The path of the rank file, ranking the suffixes by their first half_length bytes.
+    :param half_length: Half the number of bytes to sort each suffix by.
+    :param start: The inclusive start of the block.
+    :param stop: The exclusive stop of the block.
+    :param run_path: The path of the run file to write.
+    :return: The path of the run file.
+    """
+    ranks: memoryview = map_ranks(ranks_path)
+    n: int = len(ranks)
+    firsts: list[int] = ranks[start:stop].tolist()
+    seconds: list[int] = ranks[min(start + half_length, n):min(stop + half_length, n)].tolist()
+    seconds.extend([-1] * (stop - start - len(seconds)))
+    run: array = array('q', itertools.chain.from_iterable(sorted(zip(firsts, seconds, range(start, stop)))))
+
+    with open(run_path, "wb") as file:
+        run.tofile(file)
+
+    return run_path
+
+
+def read_run(run_path: str) -> Iterator[tuple[int, int, int]]:
+    """
+    Streams the suffixes of a run file, holding only a bounded buffer in memory.
+    :param run_path: The path of the run file.
+    :return: An iterator over the rank pairs and suffixes of the run in sorted order.
+    """
+    with open(run_path, "rb") as file:
+        while True:
+            buffer: array = array('q')
+
+            try:
+                buffer.fromfile(file, 3 * RUN_BUFFER_SIZE)
+            except EOFError:
+                pass    # A short final read keeps the items that were read
+
+            items: Iterator[int] = iter(buffer)
+            yield from zip(items, items, items)
+
+            if len(buffer) < 3 * RUN_BUFFER_SIZE:
+                return
+
+
+def merge_runs(run_paths: list[str], ranks_path: str, output_path: str) -> int:
+    """
+    Merges sorted runs with a k-way merge, streaming the suffixes into an index file and writing the
+    rank of each suffix by its rank pair.
+    :param run_paths: The paths of the run files.
+    :param ranks_path: The path of the rank file to write, which must already have its full size.
+    :param output_path: The path of the index file to write.
+    :return: The number of distinct rank pairs.
+    """
+    n: int = os.path.getsize(ranks_path) // 8
+    ranks: memoryview = map_ranks(ranks_path, writable=True)
+    rank: int = -1
+    previous: tuple[int, int] | None = None
+
+    with open(output_path, "wb") as output:
+        offset: int = write_header(output, [("suffix_array", 'q', n + 1)])[0]
+        output.write(bytes(offset - output.tell()))
+        buffer: array = array('q', [n])     # The empty sentinel suffix comes first
+
+        # Rank pairs and suffixes compare as integer tuples, without reading the text
+        for first, second, suffix in heapq.merge(*map(read_run, run_paths)):
+            if (first, second) != previous:
+                rank += 1
+                previous = (first, second)
+
+            ranks[suffix] = rank
+            buffer.append(suffix)
+
+            if len(buffer) >= RUN_BUFFER_SIZE:
+                buffer.tofile(output)
+                buffer = array('q')
+
+        buffer.tofile(output)
+
+    return rank + 1
+
+
+def build_suffix_array_external(input_path: str, output_path: str, block_size: int = 1 << 22,
+                                workers: int | None = None, temporary_directory: str | None = None) -> None:
+    """
+    Builds the suffix array of a text file that may be larger than memory using external prefix-doubling.
+    Every suffix is first ranked by its first few bytes. Each round then sorts the suffixes by the
+    ranks of their two halves: the text is split into blocks, and the suffixes starting in each block
+    are sorted in a process pool and spilled to disk as sorted runs. The runs are merged with a k-way
+    merge in the calling process, which streams the suffix array into the index file and writes the
+    ranks for the next round, twice as long, to a rank file. Rounds stop once every rank is distinct.
+    Comparisons are of integer pairs and take constant time however repetitive the text is. Only the
+    page cache holds the text and the ranks, and memory use is bounded by the block size and the run
+    buffers.
+
+    n - number of bytes in the text
+    b - block size
+    l - length of the longest repeated substring
+
+    Time complexity:            O(n * log(n) * log(l)), with the block sorts spread over the workers
+    Auxiliary space complexity: O(b) memory per worker and O(n) disk
+
+    :param input_path: The path of the text file, which is indexed as bytes.
+    :param output_path: The path of the index file to write, with an 8-byte "suffix_array" section in
+    the format of PrefixDoubler and sa_is (the empty sentinel suffix first). Load it with
+    load_suffix_array.
+    :param block_size: The number of suffixes sorted by each task.
+    :param workers: The number of worker processes. Defaults to the number of CPUs.
+    :param temporary_directory: Optional. The directory for the run and rank files.
+    :raises ValueError: Raised if the block size is less than 1.
+    """
+    if block_size < 1:
+        raise ValueError("The block size must be at least 1")
+
+    n: int = os.path.getsize(input_path)
+
+    if n == 0:
+        with open(output_path, "wb") as output:
+            offset: int = write_header(output, [("suffix_array", 'q', 1)])[0]
+            output.write(bytes(offset - output.tell()))
+            array('q', [0]).tofile(output)
+
+        return
+
+    with tempfile.TemporaryDirectory(dir=temporary_directory) as directory:
+        ranks_path: str = os.path.join(directory, "ranks_0.bin")
+        next_ranks_path: str = os.path.join(directory, "ranks_1.bin")
+
+        for path in [ranks_path, next_ranks_path]:
+            with open(path, "wb") as file:
+                file.truncate(8 * n)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            starts: range = range(0, n, block_size)
+
+            for task in [executor.submit(rank_block, input_path, ranks_path, start, min(start + block_size, n))
+                         for start in starts]:
+                task.result()
+
+            half_length: int = INITIAL_LENGTH
+
+            while True:
+                tasks = [executor.submit(sort_block, ranks_path, half_length, start, min(start + block_size, n),
+                                         os.path.join(directory, f"run_{start // block_size}.bin"))
+                         for start in starts]
+                run_paths: list[str] = [task.result() for task in tasks]
+
+                if merge_runs(run_paths, next_ranks_path, output_path) == n:
+                    break
+
+                ranks_path, next_ranks_path = next_ranks_path, ranks_path
+                half_length *= 2
+
+
+def load_suffix_array(path: str) -> memoryview:
+    """
+    Memory-maps a suffix array written by build_suffix_array_external.
+    :param path: The path of the index file.
+    :return: A memoryview of the suffix array, without copying it.
+    """
+    return map_sections(path)["suffix_array"]
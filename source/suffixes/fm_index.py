@@ -0,0 +1,304 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Burrows-Wheeler Transform and FM-index
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from array import array
+from typing import Sequence
+
+from source.suffixes.index_file import map_sections, write_sections
+from source.suffixes.sa_is import sa_is
+
+
+def build_bwt(text: str | bytes | bytearray | memoryview | Sequence[int],
+              suffix_array: Sequence[int]) -> tuple[bytes | array, int]:
+    """
+    Builds the Burrows-Wheeler transform of a text from its suffix array.
+    The transform holds the symbol preceding each suffix, in suffix array order. The suffix starting
+    at 0 is preceded by the implicit sentinel, which is stored as symbol 0 at the returned row.
+    :param text: A string, a bytes-like object, or a sequence of non-negative integers.
+    :param suffix_array: The suffix array including the sentinel suffix, as built by sa_is.
+    :return: The transform, as bytes for bytes-like texts and as an array of code points otherwise, and
+    the row of the sentinel.
+    """
+    symbols: Sequence[int] = [ord(c) for c in text] if isinstance(text, str) else text
+    is_bytes: bool = isinstance(text, (bytes, bytearray)) or (isinstance(text, memoryview) and text.itemsize == 1)
+    preceding: bytearray | array = bytearray(len(suffix_array)) if is_bytes else array('I', [0]) * len(suffix_array)
+    sentinel_row: int = 0
+
+    for row, suffix in enumerate(suffix_array):
+        if suffix == 0:
+            sentinel_row = row
+        else:
+            preceding[row] = symbols[suffix - 1]
+
+    return (bytes(preceding) if is_bytes else preceding), sentinel_row
+
+
+class FMIndex:
+    """
+    A compressed full-text index over the Burrows-Wheeler transform of a text.
+    The text itself is not kept. Occurrence counts are stored at sampled checkpoints and completed by
+    counting within a block of the transform, and only the suffix array entries of text positions
+    divisible by the sample rate are kept.
+
+    n - number of symbols in the text
+    m - number of symbols in the pattern
+    k - alphabet size
+    c - number of matches
+    b - checkpoint rate
+    s - sample rate
+
+                            Time complexity
+    count:                  O(m * b), which is O(m) for a fixed checkpoint rate
+    locate:                 O(m * b + c * s * b)
+
+    Auxiliary space:        n symbols + 4 * k * n / b + 4 * n / s + n / 8 bytes
+    """
+
+    def __init__(self, text: str | bytes | bytearray | memoryview | Sequence[int] | None,
+                 sample_rate: int = 32, checkpoint_rate: int = 64,
+                 suffix_array: Sequence[int] | None = None) -> None:
+        """
+        Builds the FM-index of a text.
+        :param text: A string, a bytes-like object, or a sequence of non-negative integers. None creates
+        an uninitialized index for load_fm_index.
+        :param sample_rate: Every text position divisible by this is kept in the sampled suffix array.
+        Larger values save space and make locate slower.
+        :param checkpoint_rate: Occurrence counts are stored every this many rows of the transform.
+        Larger values save space and make count and locate slower.
+        :param suffix_array: Optional. The suffix array including the sentinel suffix, as built by sa_is.
+        :raises ValueError: Raised if a rate is less than 1.
+        """
+        if sample_rate < 1 or checkpoint_rate < 1:
+            raise ValueError("The sample and checkpoint rates must be at least 1")
+
+        self.sample_rate: int = sample_rate
+        self.checkpoint_rate: int = checkpoint_rate
+
+        if text is None:
+            return
+
+        suffix_array = suffix_array if suffix_array is not None else sa_is(text)
+        self.bwt: bytes | array | memoryview
+        self.sentinel_row: int
+        self.bwt, self.sentinel_row = build_bwt(text, suffix_array)
+
+        # Count the symbols, giving each a dense index
+        frequencies: dict[int, int] = {}
+
+        for row, symbol in enumerate(self.bwt):
+            if row != self.sentinel_row:
+                frequencies[symbol] = frequencies.get(symbol, 0) + 1
+
+        self.symbols: Sequence[int] = array('I', sorted(frequencies))
+        self.symbol_index: dict[int, int] = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        self.first_rows: Sequence[int] = array('q', [0]) * len(self.symbols)
+        """first_rows[i] is the first row of the suffixes starting with symbols[i]."""
+
+        total: int = 1      # The sentinel suffix comes first
+
+        for i, symbol in enumerate(self.symbols):
+            self.first_rows[i] = total
+            total += frequencies[symbol]
+
+        self.build_checkpoints()
+        self.build_samples(suffix_array)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of symbols in the text.
+        """
+        return len(self.bwt) - 1
+
+    def build_checkpoints(self) -> None:
+        """
+        Stores the number of occurrences of each symbol before every checkpoint row.
+        """
+        block_count: int = len(self.bwt) // self.checkpoint_rate + 1
+        self.checkpoints: Sequence[int] = array('i', [0]) * (len(self.symbols) * block_count)
+        """checkpoints[i * block_count + j] is the number of symbols[i] in bwt[:j * checkpoint_rate],
+        excluding the sentinel."""
+
+        counts: list[int] = [0] * len(self.symbols)
+
+        for block in range(block_count):
+            for i in range(len(self.symbols)):
+                self.checkpoints[i * block_count + block] = counts[i]
+
+            start: int = block * self.checkpoint_rate
+
+            for row in range(start, min(start + self.checkpoint_rate, len(self.bwt))):
+                if row != self.sentinel_row:
+                    counts[self.symbol_index[self.bwt[row]]] += 1
+
+    def build_samples(self, suffix_array: Sequence[int]) -> None:
+        """
+        Keeps the suffix array entries divisible by the sample rate, marking their rows in a bitmap
+        with rank directory.
+        :param suffix_array: The suffix array including the sentinel suffix.
+        """
+        self.sampled_rows: bytearray | memoryview = bytearray((len(suffix_array) + 7) // 8)
+        """Bit (r % 8) of sampled_rows[r // 8] is set if the suffix array entry of row r is kept."""
+
+        self.sample_ranks: Sequence[int] = array('i')
+        """sample_ranks[j] is the number of kept entries before row 512 * j."""
+
+        self.samples: Sequence[int] = array(suffix_array.typecode if isinstance(suffix_array, array) else 'q')
+        """The kept suffix array entries, in row order."""
+
+        for row, suffix in enumerate(suffix_array):
+            if row % 512 == 0:
+                self.sample_ranks.append(len(self.samples))
+
+            if suffix % self.sample_rate == 0:
+                self.sampled_rows[row >> 3] |= 1 << (row & 7)
+                self.samples.append(suffix)
+
+    def occurrences(self, symbol: int, row: int) -> int:
+        """
+        Counts the occurrences of a symbol before a row of the transform.
+        :param symbol: A symbol of the text.
+        :param row: The exclusive stop row.
+        :return: The number of occurrences of the symbol in bwt[:row], excluding the sentinel.
+        """
+        block: int = row // self.checkpoint_rate
+        block_count: int = len(self.bwt) // self.checkpoint_rate + 1
+        start: int = block * self.checkpoint_rate
+        count: int = self.checkpoints[self.symbol_index[symbol] * block_count + block]
+
+        # Scan the rest of the block, which bytes can count in place without copying
+        if isinstance(self.bwt, bytes):
+            count += self.bwt.count(symbol, start, row)
+        else:
+            segment: array | memoryview = self.bwt[start:row]
+            count += segment.tolist().count(symbol) if isinstance(segment, memoryview) else segment.count(symbol)
+
+        # The sentinel is stored as symbol 0, which must not be counted
+        if symbol == 0 and start <= self.sentinel_row < row:
+            count -= 1
+
+        return count
+
+    def last_to_first(self, row: int) -> int:
+        """
+        Maps a row to the row of the suffix starting one position earlier in the text.
+        :param row: A row whose suffix doesn't start at 0.
+        :return: The row of the preceding suffix.
+        """
+        symbol: int = self.bwt[row]
+        return self.first_rows[self.symbol_index[symbol]] + self.occurrences(symbol, row)
+
+    def sample(self, row: int) -> int | None:
+        """
+        :param row: A row of the suffix array.
+        :return: The suffix array entry of the row if it was kept, otherwise None.
+        """
+        if not self.sampled_rows[row >> 3] >> (row & 7) & 1:
+            return None
+
+        # Rank the row among the kept rows using the rank directory and a popcount
+        block_start: int = (row >> 9) << 6
+        rank: int = self.sample_ranks[row >> 9]
+        rank += int.from_bytes(self.sampled_rows[block_start:row >> 3], "little").bit_count()
+        rank += (self.sampled_rows[row >> 3] & ((1 << (row & 7)) - 1)).bit_count()
+        return self.samples[rank]
+
+    def find_interval(self, pattern: str | bytes | Sequence[int]) -> tuple[int, int]:
+        """
+        Finds the rows of the suffixes starting with a pattern using backward search.
+        :param pattern: A pattern string, bytes-like object or integer sequence.
+        :return: The inclusive start and exclusive stop of the rows.
+        """
+        symbols: Sequence[int] = [ord(c) for c in pattern] if isinstance(pattern, str) else pattern
+        start: int = 0
+        stop: int = len(self.bwt)
+
+        for symbol in reversed(symbols):
+            index: int | None = self.symbol_index.get(symbol)
+
+            if index is None:
+                return 0, 0
+
+            start = self.first_rows[index] + self.occurrences(symbol, start)
+            stop = self.first_rows[index] + self.occurrences(symbol, stop)
+
+            if start >= stop:
+                return 0, 0
+
+        return start, stop
+
+    def count(self, pattern: str | bytes | Sequence[int]) -> int:
+        """
+        Counts the occurrences of a pattern in the text.
+        :param pattern: A pattern string, bytes-like object or integer sequence.
+        :return: The number of occurrences.
+        """
+        start, stop = self.find_interval(pattern)
+        return stop - start
+
+    def locate(self, pattern: str | bytes | Sequence[int]) -> list[int]:
+        """
+        Finds the occurrences of a pattern in the text.
+        Each row is stepped backwards through the text until a kept suffix array entry is found.
+        :param pattern: A pattern string, bytes-like object or integer sequence.
+        :return: A sorted list of the inclusive start-points of the matches in the text.
+        """
+        start, stop = self.find_interval(pattern)
+        matches: list[int] = []
+
+        for row in range(start, stop):
+            steps: int = 0
+            position: int | None = self.sample(row)
+
+            while position is None:
+                row = self.last_to_first(row)
+                steps += 1
+                position = self.sample(row)
+
+            matches.append(position + steps)
+
+        matches.sort()
+        return matches
+
+
+def save_fm_index(index: FMIndex, path: str) -> None:
+    """
+    Saves an FM-index so it can be memory-mapped by load_fm_index.
+    :param index: The FM-index to save.
+    :param path: The path of the file to write.
+    """
+    write_sections(path, {
+        "parameters": ('q', array('q', [index.sentinel_row, index.sample_rate, index.checkpoint_rate])),
+        "bwt": ('B' if memoryview(index.bwt).itemsize == 1 else 'I', index.bwt),
+        "symbols": ('I', index.symbols),
+        "first_rows": ('q', index.first_rows),
+        "checkpoints": ('i', index.checkpoints),
+        "sampled_rows": ('B', index.sampled_rows),
+        "sample_ranks": ('i', index.sample_ranks),
+        "samples": (memoryview(index.samples).format, index.samples),
+    })
+
+
+def load_fm_index(path: str) -> FMIndex:
+    """
+    Loads an FM-index saved by save_fm_index, without copying the transform or the samples.
+    :param path: The path of the index file.
+    :return: An FM-index whose arrays are memoryviews over the mapped file.
+    """
+    sections: dict[str, memoryview] = map_sections(path)
+    sentinel_row, sample_rate, checkpoint_rate = sections["parameters"]
+    index: FMIndex = FMIndex(None, sample_rate, checkpoint_rate)
+    index.sentinel_row = sentinel_row
+    index.bwt = sections["bwt"]
+    index.symbols = sections["symbols"]
+    index.symbol_index = {symbol: i for i, symbol in enumerate(index.symbols)}
+    index.first_rows = sections["first_rows"]
+    index.checkpoints = sections["checkpoints"]
+    index.sampled_rows = sections["sampled_rows"]
+    index.sample_ranks = sections["sample_ranks"]
+    index.samples = sections["samples"]
+    return index
@@ -0,0 +1,255 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Append-Only Incremental Suffix Index with Segment Merging
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from source.suffixes.suffix_index import SuffixIndex
+
+
+class Segment:
+    """A contiguous piece of the corpus with its own suffix index."""
+
+    __slots__ = ("offset", "index")
+
+    def __init__(self, offset: int, index: SuffixIndex) -> None:
+        """
+        Creates a segment.
+        :param offset: The inclusive start of the segment in the corpus.
+        :param index: The suffix index of the segment's text.
+        """
+        self.offset: int = offset
+        self.index: SuffixIndex = index
+
+
+class IncrementalSuffixIndex:
+    """
+    An append-only full-text index made of suffix-indexed segments, merged like an LSM tree.
+    Each append becomes a new small segment. Whenever the newest merge_factor segments are in the
+    same size tier, they are merged into one segment of a higher tier. Tiers never increase from the
+    oldest segment to the newest, so there are at most merge_factor - 1 segments per tier and
+    O(merge_factor * log(n)) segments overall. Queries search every segment, and then the text
+    around each segment boundary for matches spanning it.
+
+    n - number of symbols in the corpus
+    m - number of symbols in the pattern
+    k - merge factor
+    s - number of segments, which is O(k * log_k(n))
+
+    Amortized append time complexity:   O(a * log_k(n)) for a symbols appended
+    Query time complexity:              O(s * (m + log(n)) + s * m) plus the number of matches
+    """
+
+    def __init__(self, merge_factor: int = 4, background: bool = False) -> None:
+        """
+        Creates an empty index.
+        :param merge_factor: The number of segments of one tier merged together.
+        :param background: Whether to merge segments on a background thread rather than during append.
+        :raises ValueError: Raised if the merge factor is less than 2.
+        """
+        if merge_factor < 2:
+            raise ValueError("The merge factor must be at least 2")
+
+        self.merge_factor: int = merge_factor
+        self.segments: list[Segment] = []       # Segments in corpus order, replaced rather than mutated
+        self.length: int = 0
+        self.lock: threading.Lock = threading.Lock()              # Guards replacing the segment list
+        self.compaction_lock: threading.Lock = threading.Lock()   # Serializes choosing and swapping in merges
+        self.executor: ThreadPoolExecutor | None = ThreadPoolExecutor(max_workers=1) if background else None
+        self.compactions: list[Future] = []     # Background merges whose outcome hasn't been checked
+
+    def __len__(self) -> int:
+        """
+        :return: The number of symbols in the corpus.
+        """
+        return self.length
+
+    def tier(self, segment: Segment) -> int:
+        """
+        :param segment: A segment.
+        :return: The size tier of the segment, which is the floor of log_k of its length.
+        """
+        tier: int = 0
+        length: int = len(segment.index) // self.merge_factor
+
+        while length > 0:
+            tier += 1
+            length //= self.merge_factor
+
+        return tier
+
+    def append(self, text: str | bytes) -> None:
+        """
+        Appends text to the corpus as a new segment, then merges segments if a tier is full.
+        :param text: A string or bytes, of the same type as the text already appended.
+        :raises ValueError: Raised if the text type differs from the corpus.
+        :raises Exception: Re-raises the error of a failed background merge, before appending.
+        """
+        self.check_compactions()
+
+        if not text:
+            return
+
+        with self.lock:
+            if self.segments and type(self.segments[0].index.text) is not type(text):
+                raise ValueError("The appended text must have the same type as the corpus")
+
+            self.segments = self.segments + [Segment(self.length, SuffixIndex(text))]
+            self.length += len(text)
+
+        if self.executor is None:
+            self.compact()
+        else:
+            self.compactions.append(self.executor.submit(self.compact))
+
+    def check_compactions(self, wait: bool = False) -> None:
+        """
+        Re-raises the error of the first failed background merge, forgetting the finished merges.
+        A failed merge leaves its segments unmerged, so the index stays correct and later merges retry it.
+        :param wait: Whether to wait for all the background merges to finish first.
+        """
+        pending: list[Future] = []
+        error: BaseException | None = None
+
+        for future in self.compactions:
+            if not wait and not future.done():
+                pending.append(future)
+            elif error is None:
+                error = future.exception()
+
+        self.compactions = pending
+
+        if error is not None:
+            raise error
+
+    def find_merge(self, segments: list[Segment]) -> tuple[int, int] | None:
+        """
+        Finds the oldest segments that break the tier invariants.
+        :param segments: A snapshot of the segments.
+        :return: The inclusive start and exclusive stop of the segments to merge, or None if there are none.
+        """
+        tiers: list[int] = [self.tier(segment) for segment in segments]
+        run: int = 1
+
+        for i in range(1, len(tiers)):
+            # Keep tiers non-increasing, so a large append absorbs the smaller segments before it
+            if tiers[i] > tiers[i - 1]:
+                return i - 1, i + 1
+
+            run = run + 1 if tiers[i] == tiers[i - 1] else 1
+
+            if run == self.merge_factor:
+                return i + 1 - run, i + 1
+
+        return None
+
+    def compact(self) -> None:
+        """
+        Merges segments until every tier is non-increasing from the oldest segment to the newest and
+        holds fewer than merge_factor segments.
+        Only one compaction runs at a time, so no two can merge the same segments. The merged index is
+        built without holding the segment lock, so queries and appends proceed meanwhile.
+        """
+        with self.compaction_lock:
+            while True:
+                with self.lock:
+                    segments: list[Segment] = self.segments
+
+                bounds: tuple[int, int] | None = self.find_merge(segments)
+
+                if bounds is None:
+                    return
+
+                candidates: list[Segment] = segments[bounds[0]:bounds[1]]
+                text: str | bytes = candidates[0].index.text[:0].join(segment.index.text for segment in candidates)
+                merged: Segment = Segment(candidates[0].offset, SuffixIndex(text))
+
+                # Swap the merged segment in, keeping any segments appended since. Appends only add
+                # segments at the end, so the candidates are still at their snapshot positions.
+                with self.lock:
+                    self.segments = self.segments[:bounds[0]] + [merged] + self.segments[bounds[1]:]
+
+    def wait(self) -> None:
+        """
+        Waits for any background merging to finish.
+        :raises Exception: Re-raises the error of a failed background merge.
+        """
+        self.check_compactions(wait=True)
+
+    def close(self) -> None:
+        """
+        Waits for any background merging to finish and stops the background thread.
+        :raises Exception: Re-raises the error of a failed background merge.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+        self.check_compactions(wait=True)
+
+    def read(self, segments: list[Segment], start: int, stop: int) -> str | bytes:
+        """
+        Reads part of the corpus that may span several segments.
+        :param segments: A snapshot of the segments.
+        :param start: The inclusive start in the corpus.
+        :param stop: The exclusive stop in the corpus.
+        :return: The text of corpus[start:stop].
+        """
+        pieces: list[str | bytes] = []
+
+        for segment in segments:
+            segment_stop: int = segment.offset + len(segment.index)
+
+            if segment_stop > start and segment.offset < stop:
+                text: str | bytes = segment.index.text
+                pieces.append(text[max(start - segment.offset, 0):min(stop, segment_stop) - segment.offset])
+
+        return pieces[0][:0].join(pieces)
+
+    def locate(self, pattern: str | bytes) -> list[int]:
+        """
+        Finds the occurrences of a pattern in the corpus.
+        :param pattern: A string or bytes, of the same type as the corpus.
+        :return: A sorted list of the inclusive start-points of the matches in the corpus.
+        :raises ValueError: Raised if the pattern is empty.
+        """
+        if len(pattern) == 0:
+            raise ValueError("The pattern cannot be empty")
+
+        with self.lock:
+            segments: list[Segment] = self.segments
+
+        m: int = len(pattern)
+        matches: list[int] = []
+
+        for segment in segments:
+            matches.extend(segment.offset + match for match in segment.index.locate(pattern))
+
+        # Find matches spanning a boundary, counting each one at the first boundary it spans
+        for i in range(1, len(segments) if m > 1 else 0):
+            boundary: int = segments[i].offset
+            start: int = max(boundary - m + 1, segments[i - 1].offset)
+            window: str | bytes = self.read(segments, start, boundary + m - 1)
+            position: int = window.find(pattern)
+
+            while 0 <= position < boundary - start:
+                if start + position + m > boundary:
+                    matches.append(start + position)
+
+                position = window.find(pattern, position + 1)
+
+        matches.sort()
+        return matches
+
+    def count(self, pattern: str | bytes) -> int:
+        """
+        Counts the occurrences of a pattern in the corpus.
+        :param pattern: A string or bytes, of the same type as the corpus.
+        :return: The number of occurrences.
+        :raises ValueError: Raised if the pattern is empty.
+        """
+        return len(self.locate(pattern))
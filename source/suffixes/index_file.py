@@ -0,0 +1,197 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Memory-Mapped On-Disk Index Format
+#
+# File layout, all integers in native byte order:
+#
+#   header      8-byte magic, u16 version, u16 section count, u8 byte order (0 little, 1 big), 3 pad bytes
+#   sections    per section: 16-byte NUL-padded ASCII name, u8 typecode, u8 item size, 6 pad bytes,
+#               u64 byte offset from the start of the file, u64 item count
+#   data        the section contents, each starting at a multiple of 8 bytes
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Any, BinaryIO
+
+from source.suffixes.range_minimum import SparseTable
+from source.suffixes.suffix_index import SuffixIndex
+
+
+MAGIC: bytes = b"SUFXIDX\0"
+VERSION: int = 1
+HEADER: struct.Struct = struct.Struct("=8sHHB3x")
+SECTION: struct.Struct = struct.Struct("=16sBB6xQQ")
+ALIGNMENT: int = 8
+
+
+def write_header(file: BinaryIO, layout: list[tuple[str, str, int]]) -> list[int]:
+    """
+    Writes the header and section table of an index file, so that the sections can then be streamed
+    into the file in order.
+    :param file: A binary file open for writing at its start.
+    :param layout: The name, typecode and item count of each section, in file order.
+    :return: The byte offset of each section. The file must be padded with zero bytes up to each offset
+    before that section is written.
+    :raises ValueError: Raised if a section name is too long.
+    """
+    offset: int = HEADER.size + SECTION.size * len(layout)
+    offsets: list[int] = []
+
+    for _, typecode, count in layout:
+        offset += -offset % ALIGNMENT
+        offsets.append(offset)
+        offset += count * array(typecode).itemsize
+
+    file.write(HEADER.pack(MAGIC, VERSION, len(layout), 0 if sys.byteorder == "little" else 1))
+
+    for (name, typecode, count), section_offset in zip(layout, offsets):
+        encoded_name: bytes = name.encode("ascii")
+
+        if len(encoded_name) > 16:
+            raise ValueError(f"The section name {name!r} is longer than 16 characters")
+
+        file.write(SECTION.pack(encoded_name, ord(typecode), array(typecode).itemsize, section_offset, count))
+
+    return offsets
+
+
+def write_sections(path: str, sections: dict[str, tuple[str, Any]]) -> None:
+    """
+    Writes typed buffers to an index file.
+    :param path: The path of the file to write.
+    :param sections: A dictionary mapping each section name to its typecode and a buffer of items
+    with that typecode, such as an array, bytes or memoryview.
+    :raises ValueError: Raised if a section name is too long, or a buffer doesn't match its typecode.
+    """
+    layout: list[tuple[str, str, int]] = []
+    views: list[memoryview] = []
+
+    for name, (typecode, buffer) in sections.items():
+        view: memoryview = memoryview(buffer).cast('B')
+        item_size: int = array(typecode).itemsize
+
+        if view.nbytes % item_size != 0:
+            raise ValueError(f"The section {name!r} is not a whole number of {typecode!r} items")
+
+        layout.append((name, typecode, view.nbytes // item_size))
+        views.append(view)
+
+    with open(path, "wb") as file:
+        offsets: list[int] = write_header(file, layout)
+
+        for view, offset in zip(views, offsets):
+            file.write(bytes(offset - file.tell()))
+            file.write(view)
+
+
+def map_sections(path: str) -> dict[str, memoryview]:
+    """
+    Memory-maps an index file and exposes its sections without copying them.
+    The mapping is read-only and stays open for as long as any of the returned views is referenced,
+    so processes mapping the same file share its pages through the page cache.
+    :param path: The path of the file to map.
+    :return: A dictionary mapping each section name to a typed memoryview of its items.
+    :raises ValueError: Raised if the file is not a compatible index file, or is truncated.
+    """
+    with open(path, "rb") as file:
+        mapping: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view: memoryview = memoryview(mapping)
+
+    if view.nbytes < HEADER.size:
+        raise ValueError(f"{path} is too short to be an index file")
+
+    magic, version, section_count, byte_order = HEADER.unpack_from(view)
+
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an index file")
+
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported format version {version}")
+
+    if byte_order != (0 if sys.byteorder == "little" else 1):
+        raise ValueError(f"{path} was written with a different byte order")
+
+    if HEADER.size + section_count * SECTION.size > view.nbytes:
+        raise ValueError(f"{path} is truncated in its section table")
+
+    sections: dict[str, memoryview] = {}
+
+    for i in range(section_count):
+        position: int = HEADER.size + i * SECTION.size
+        encoded_name, typecode, item_size, offset, count = SECTION.unpack_from(view, position)
+        name: str = encoded_name.rstrip(b"\0").decode("ascii")
+
+        if array(chr(typecode)).itemsize != item_size:
+            raise ValueError(f"{path} was written with a different size of {chr(typecode)!r} items")
+
+        if offset + count * item_size > view.nbytes:
+            raise ValueError(f"{path} is truncated in section {name!r}")
+
+        section: memoryview = view[offset:offset + count * item_size]
+        sections[name] = section.cast(chr(typecode))
+
+    return sections
+
+
+def save_suffix_index(index: SuffixIndex, path: str, include_lcp_queries: bool = False) -> None:
+    """
+    Saves a suffix index so it can be memory-mapped by load_suffix_index.
+    A string text is stored as 32-bit code points, and other texts as bytes.
+    :param index: The suffix index to save.
+    :param path: The path of the file to write.
+    :param include_lcp_queries: Whether to also store the inverse suffix array and the sparse table,
+    so that LCP queries need no preprocessing after loading. This adds O(n * log(n)) space.
+    """
+    text: Any = index.text
+    sections: dict[str, tuple[str, Any]] = {}
+
+    if isinstance(text, str):
+        sections["text"] = ('I', array('I', map(ord, text)))
+    elif isinstance(text, (bytes, bytearray)) or (isinstance(text, memoryview) and text.itemsize == 1):
+        sections["text"] = ('B', text)
+    else:
+        sections["text"] = ('I', array('I', text))
+
+    sections["suffix_array"] = (index.suffix_array.typecode if isinstance(index.suffix_array, array)
+                                else index.suffix_array.format, index.suffix_array)
+    sections["lcp"] = ('i', index.lcp_array)
+    sections["left_lcp"] = ('i', index.left_lcp)
+    sections["right_lcp"] = ('i', index.right_lcp)
+
+    if include_lcp_queries:
+        index.build_lcp_queries()
+        sections["rank"] = ('i', index.rank)
+
+        for level, values in enumerate(index.range_minimum.levels):
+            sections[f"sparse_{level}"] = ('i', values)
+
+    write_sections(path, sections)
+
+
+def load_suffix_index(path: str) -> SuffixIndex:
+    """
+    Loads a suffix index saved by save_suffix_index, without deserializing or copying any array.
+    :param path: The path of the index file.
+    :return: A suffix index whose arrays are memoryviews over the mapped file. A string text is
+    exposed as code points, and string patterns are converted to match.
+    """
+    sections: dict[str, memoryview] = map_sections(path)
+    index: SuffixIndex = SuffixIndex(sections["text"], sections["suffix_array"], sections["lcp"],
+                                     sections["left_lcp"], sections["right_lcp"])
+
+    if "rank" in sections:
+        index.rank = sections["rank"]
+        levels: list[memoryview] = []
+
+        while f"sparse_{len(levels)}" in sections:
+            levels.append(sections[f"sparse_{len(levels)}"])
+
+        index.range_minimum = SparseTable.from_levels(levels)
+
+    return index
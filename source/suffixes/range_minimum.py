@@ -0,0 +1,66 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Sparse Table for Constant Time Range Minimum Queries
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from array import array
+from typing import Sequence
+
+
+class SparseTable:
+    """
+    Answers range minimum queries over a fixed sequence of integers in constant time.
+    Level k stores the minimum of every window of 2^k values, and any range is covered by two
+    overlapping windows of the same level.
+
+    n - number of values
+
+    Preprocessing time complexity:  O(n * log(n))
+    Query time complexity:          O(1)
+    Auxiliary space complexity:     O(n * log(n))
+    """
+
+    def __init__(self, values: Sequence[int]) -> None:
+        """
+        Builds the sparse table of a sequence.
+        :param values: A sequence of integers.
+        """
+        self.levels: list[Sequence[int]] = [array('i', values)]
+        """levels[k][i] is the minimum of values[i:i + 2^k]."""
+
+        width: int = 1
+
+        while 2 * width <= len(values):
+            previous: Sequence[int] = self.levels[-1]
+            level: array = array('i', map(min, previous[:len(previous) - width], previous[width:]))
+            self.levels.append(level)
+            width *= 2
+
+    @classmethod
+    def from_levels(cls, levels: list[Sequence[int]]) -> "SparseTable":
+        """
+        Wraps precomputed levels, such as memory-mapped ones, without copying them.
+        :param levels: The levels of a sparse table, where levels[k][i] is the minimum of values[i:i + 2^k].
+        :return: The sparse table.
+        """
+        table: SparseTable = cls.__new__(cls)
+        table.levels = levels
+        return table
+
+    def query(self, start: int, stop: int) -> int:
+        """
+        :param start: The inclusive start of the range.
+        :param stop: The exclusive stop of the range, which must be after the start.
+        :return: The minimum value in the range.
+        :raises ValueError: Raised if the range is empty.
+        """
+        if stop <= start:
+            raise ValueError("The range cannot be empty")
+
+        level: Sequence[int] = self.levels[(stop - start).bit_length() - 1]
+        width: int = 1 << ((stop - start).bit_length() - 1)
+        first: int = level[start]
+        second: int = level[stop - width]
+        return first if first < second else second
@@ -0,0 +1,198 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Linear Time Suffix Array Construction Using Induced Sorting (SA-IS)
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from array import array
+from typing import Sequence
+
+
+def classify_suffixes(values: Sequence[int]) -> list[bool]:
+    """
+    Classifies each suffix as S-type (smaller than the next suffix) or L-type (larger).
+    The implicit sentinel past the end is smaller than every suffix, so the last suffix is L-type.
+    :param values: A sequence of non-negative integers.
+    :return: A list where the value at index i is True if suffix i is S-type.
+    """
+    n: int = len(values)
+    s_type: list[bool] = [False] * n
+
+    for i in range(n - 2, -1, -1):
+        s_type[i] = s_type[i + 1] if values[i] == values[i + 1] else values[i] < values[i + 1]
+
+    return s_type
+
+
+def induce_sort(values: Sequence[int], s_type: list[bool], lms_suffixes: list[int],
+                bucket_starts: list[int], bucket_ends: list[int]) -> list[int]:
+    """
+    Induces the order of all suffixes from an order of the LMS suffixes.
+    The LMS suffixes are placed at the ends of their buckets, L-type suffixes are then induced
+    left-to-right, and S-type suffixes right-to-left.
+    :param values: A sequence of non-negative integers.
+    :param s_type: The suffix types of the values.
+    :param lms_suffixes: The LMS suffixes, in the order they should be placed in their buckets.
+    :param bucket_starts: The inclusive start of each value's bucket.
+    :param bucket_ends: The exclusive stop of each value's bucket.
+    :return: The induced suffix array.
+    """
+    n: int = len(values)
+    suffix_array: list[int] = [-1] * n
+
+    # Place the LMS suffixes at the ends of their buckets, keeping their order
+    tails: list[int] = bucket_ends[:]
+
+    for suffix in reversed(lms_suffixes):
+        value: int = values[suffix]
+        tails[value] -= 1
+        suffix_array[tails[value]] = suffix
+
+    # Induce the L-type suffixes, starting from the last suffix which precedes the sentinel
+    heads: list[int] = bucket_starts[:]
+    value = values[n - 1]
+    suffix_array[heads[value]] = n - 1
+    heads[value] += 1
+
+    for i in range(n):
+        suffix: int = suffix_array[i] - 1
+
+        if suffix >= 0 and not s_type[suffix]:
+            value = values[suffix]
+            suffix_array[heads[value]] = suffix
+            heads[value] += 1
+
+    # Induce the S-type suffixes, overwriting the LMS placements
+    tails = bucket_ends[:]
+
+    for i in range(n - 1, -1, -1):
+        suffix = suffix_array[i] - 1
+
+        if suffix >= 0 and s_type[suffix]:
+            value = values[suffix]
+            tails[value] -= 1
+            suffix_array[tails[value]] = suffix
+
+    return suffix_array
+
+
+def induced_sort_suffixes(values: Sequence[int], alphabet_size: int) -> list[int]:
+    """
+    Sorts the suffixes of a sequence of integers using SA-IS, without a sentinel.
+
+    n - number of values
+    k - alphabet size
+
+    Time complexity:            O(n + k)
+    Auxiliary space complexity: O(n + k)
+
+    :param values: A sequence of integers in [0, alphabet_size).
+    :param alphabet_size: An exclusive upper bound on the values.
+    :return: The start-points of the suffixes in sorted order, where a proper prefix of a suffix is
+    smaller than it.
+    """
+    n: int = len(values)
+
+    if n < 2:
+        return list(range(n))
+
+    s_type: list[bool] = classify_suffixes(values)
+
+    # Size the buckets, one per value, in value order
+    bucket_starts: list[int] = [0] * alphabet_size
+    bucket_ends: list[int] = [0] * alphabet_size
+
+    for value in values:
+        bucket_ends[value] += 1
+
+    total: int = 0
+
+    for value in range(alphabet_size):
+        bucket_starts[value] = total
+        total += bucket_ends[value]
+        bucket_ends[value] = total
+
+    # Sort the LMS substrings with one round of induced sorting
+    lms_suffixes: list[int] = [i for i in range(1, n) if s_type[i] and not s_type[i - 1]]
+
+    if not lms_suffixes:
+        # A non-increasing sequence, where induced sorting the L-type suffixes is enough
+        return induce_sort(values, s_type, [], bucket_starts, bucket_ends)
+
+    suffix_array: list[int] = induce_sort(values, s_type, lms_suffixes, bucket_starts, bucket_ends)
+    lms_index: list[int] = [-1] * n     # lms_index[i] is the position of LMS suffix i in lms_suffixes
+
+    for i, suffix in enumerate(lms_suffixes):
+        lms_index[suffix] = i
+
+    sorted_lms: list[int] = [suffix for suffix in suffix_array if lms_index[suffix] >= 0]
+
+    # Name the LMS substrings, giving equal substrings the same name
+    names: list[int] = [0] * len(lms_suffixes)
+    name: int = 0
+
+    for i in range(1, len(sorted_lms)):
+        left: int = sorted_lms[i - 1]
+        right: int = sorted_lms[i]
+        left_index: int = lms_index[left] + 1
+        right_index: int = lms_index[right] + 1
+        left_end: int = lms_suffixes[left_index] if left_index < len(lms_suffixes) else n
+        right_end: int = lms_suffixes[right_index] if right_index < len(lms_suffixes) else n
+        same: bool = left_end - left == right_end - right
+
+        if same:
+            while left < left_end and values[left] == values[right]:
+                left += 1
+                right += 1
+
+            # The substrings also include the LMS character that ends them
+            same = left == left_end and left < n and right < n and values[left] == values[right]
+
+        if not same:
+            name += 1
+
+        names[lms_index[sorted_lms[i]]] = name
+
+    # Sort the LMS suffixes recursively if their substrings are not all distinct
+    if name + 1 < len(lms_suffixes):
+        reduced_suffix_array: list[int] = induced_sort_suffixes(names, name + 1)
+        sorted_lms = [lms_suffixes[i] for i in reduced_suffix_array]
+
+    return induce_sort(values, s_type, sorted_lms, bucket_starts, bucket_ends)
+
+
+def sa_is(text: str | bytes | bytearray | memoryview | Sequence[int], alphabet_size: int | None = None) -> array:
+    """
+    Builds the suffix array of a text using SA-IS (induced sorting).
+    The end of the text acts as an implicit sentinel smaller than every symbol, so any symbol can
+    occur in the text. The output matches PrefixDoubler.build_suffix_array, including the sentinel
+    suffix at index 0.
+
+    n - number of symbols in the text
+    k - alphabet size
+
+    Time complexity:            O(n + k)
+    Auxiliary space complexity: O(n + k)
+
+    :param text: A string, a bytes-like object, or a sequence of non-negative integers such as an array.
+    :param alphabet_size: Optional. An exclusive upper bound on the symbols. Defaults to 256 for
+    bytes-like texts, and to the largest symbol plus one otherwise.
+    :return: A compact integer array of the inclusive start-points of all the suffixes of the text,
+    including the empty sentinel suffix, sorted by the suffixes.
+    """
+    values: Sequence[int]
+
+    if isinstance(text, str):
+        values = [ord(c) for c in text]
+    elif isinstance(text, memoryview):
+        values = text.cast('B') if text.format in ('b', 'c') else text
+    else:
+        values = text
+
+    if alphabet_size is None:
+        alphabet_size = 256 if isinstance(text, (bytes, bytearray)) else max(values, default=0) + 1
+
+    suffix_array: array = array('i' if len(values) < 2 ** 31 - 1 else 'q', [len(values)])
+    suffix_array.extend(induced_sort_suffixes(values, alphabet_size))
+    return suffix_array
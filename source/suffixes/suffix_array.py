@@ -5,119 +5,113 @@
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
+from array import array
+
+
 class PrefixDoubler:
-    """Builds a suffix array using prefix-doubling."""
+    """
+    Builds a suffix array using Manber-Myers prefix-doubling with radix sorting.
+
+    n - number of characters in the string
+
+                                Worst case      Best case
+    Time complexity:            O(n * log(n))   O(n)
+    Auxiliary space complexity: O(n)            O(n)
+    """
 
     def __init__(self, string: str) -> None:
         """
         Initializes a prefix-doubling suffix array builder.
         :param string: The string to build the suffix array of.
         """
-        string = string + '$'   # Assume '$' doesn't occur in the string
+        string = string + '$'   # Terminate the string, ranking the terminator below every character
         self.string: str = string
-        self.suffix_array: list[int] = [i for i in range(len(string))]
-        self.rank: list[int] = [ord(c) for c in string]    # This already sorts by the first character
+        self.suffix_array: array = array('i', range(len(string)))
 
-    def swap(self, first: int, second: int) -> None:
-        """
-        Swaps two items in the suffix array.
-        :param first: The index of the first item.
-        :param second: The index of the second item.
-        """
-        buffer: int | float = self.suffix_array[first]
-        self.suffix_array[first] = self.suffix_array[second]
-        self.suffix_array[second] = buffer
+        # Rank the characters densely, which already sorts by the first character
+        alphabet: dict[str, int] = {c: i + 1 for i, c in enumerate(sorted(set(string[:-1])))}
+        self.rank: array = array('i', [alphabet[c] for c in string[:-1]])
+        self.rank.append(0)
+        self.class_count: int = len(alphabet) + 1   # Number of distinct ranks
 
-    def compare_suffixes(self, suffix1: int, suffix2: int, half_length: int) -> int:
-        """
-        Compares two suffixes by their first few characters.
-        :param suffix1: The inclusive start of the first suffix.
-        :param suffix2: The inclusive start of the second suffix.
-        :param half_length: Half the number of characters to compare by.
-        :return: An integer > 0 if suffix1 > suffix2, 0 if suffix == suffix2, < 0 if suffix1 < suffix2.
-        """
-        if self.rank[suffix1] != self.rank[suffix2]:
-            # Compare by first halves
-            return self.rank[suffix1] - self.rank[suffix2]
-        elif suffix1 + half_length < len(self.string) and suffix2 + half_length < len(self.string):
-            # Compare by second halves
-            return self.rank[suffix1 + half_length] - self.rank[suffix2 + half_length]
-        else:
-            # Compare by length
-            return suffix2 - suffix1
-
-    def dnf_partition(self, start: int, stop: int, pivot: int, half_length: int) -> tuple[int, int]:
+    def counting_sort(self, order: array) -> None:
         """
-        Partitions a sublist of the suffix array using DNF partitioning about the given pivot.
-        Partitions numbers[start:stop] about the pivot.
-        :param start: The inclusive start of the sublist to partition.
-        :param stop: The exclusive stop of the sublist to partition.
-        :param pivot: The pivot value.
-        :param half_length: Half the number of characters to compare the suffixes by.
-        :return: The inclusive start of values == pivot, and the exclusive end of values == pivot.
+        Stably sorts suffixes by rank using counting sort, storing them as the new suffix array.
+        :param order: The suffixes in the order to keep among equal ranks.
         """
-        low: int = start        # suffix_array[start:low] < pivot
-        middle: int = start     # suffix_array[low:middle] == pivot
-        high: int = stop        # suffix_array[high:stop] > pivot
-
-        while middle < stop:
-            if self.compare_suffixes(self.suffix_array[middle], pivot, half_length) < 0:
-                self.swap(low, middle)
-                low += 1
-                middle += 1
-            elif self.compare_suffixes(self.suffix_array[middle], pivot, half_length) == 0:
-                middle += 1
-            else:
-                self.swap(middle, high - 1)
-                high -= 1
-
-        return low, middle
-
-    def sort(self, half_length: int, start: int = 0, stop: int | None = None) -> None:
+        rank: array = self.rank
+        starts: array = array('i', [0]) * (self.class_count + 1)
+
+        for suffix in order:
+            starts[rank[suffix] + 1] += 1
+
+        for i in range(1, self.class_count + 1):
+            starts[i] += starts[i - 1]
+
+        suffix_array: array = array('i', [0]) * len(order)
+
+        for suffix in order:
+            r: int = rank[suffix]
+            suffix_array[starts[r]] = suffix
+            starts[r] += 1
+
+        self.suffix_array = suffix_array
+
+    def radix_sort(self, half_length: int) -> None:
         """
-        Sorts the suffixes in the suffix array based on the first k characters.
-        :param half_length: Half the number of characters to compare each suffix by.
-        :param start: The inclusive start of the sublist to sort.
-        :param stop: The exclusive stop of the sublist to sort.
+        Sorts the suffixes by their first 2 * half_length characters, given that the suffix array and
+        ranks are already sorted by the first half_length characters.
+        The rank pairs are radix sorted: the order by second halves comes straight from the current
+        suffix array, and a stable counting sort then orders by first halves.
+        :param half_length: Half the number of characters to sort each suffix by.
         """
-        stop = len(self.suffix_array) if stop is None else stop
+        n: int = len(self.suffix_array)
 
-        if stop - start > 1:
-            pivot: int = self.suffix_array[(start + stop) // 2]
-            left, right = self.dnf_partition(start, stop, pivot, half_length)
-            self.sort(half_length, start, left)
-            self.sort(half_length, right, stop)
+        # Suffixes with an empty second half come first, then the rest in order of their second halves
+        order: array = array('i', range(n - half_length, n))
+        order.extend(suffix - half_length for suffix in self.suffix_array if suffix >= half_length)
+        self.counting_sort(order)
 
     def update_rank(self, half_length: int) -> None:
         """
         Updates the ranks of all the suffixes.
         :param half_length: Half the number of characters the suffixes have been sorted by.
         """
-        new_rank: list[int] = [0 for _ in range(len(self.string))]
+        rank: array = self.rank
+        suffix_array: array = self.suffix_array
+        n: int = len(suffix_array)
+        new_rank: array = array('i', [0]) * n
+        current: int = 0
+        previous: int = suffix_array[0]
+        previous_pair: tuple[int, int] = (rank[previous], rank[previous + half_length] if previous + half_length < n else -1)
+
+        for i in range(1, n):
+            suffix: int = suffix_array[i]
+            pair: tuple[int, int] = (rank[suffix], rank[suffix + half_length] if suffix + half_length < n else -1)
 
-        for i in range(len(self.suffix_array) - 1):
-            suffix: int = self.suffix_array[i]
-            next_suffix: int = self.suffix_array[i + 1]
-            step: int = 1 if self.compare_suffixes(next_suffix, suffix, half_length) > 0 else 0
-            new_rank[next_suffix] = new_rank[suffix] + step
+            if pair != previous_pair:
+                current += 1
+                previous_pair = pair
+
+            new_rank[suffix] = current
 
         self.rank = new_rank
+        self.class_count = current + 1
 
     def build_suffix_array(self) -> list[int]:
         """
         Builds the suffix array of the string using prefix-doubling.
+        Stops doubling as soon as every suffix has a distinct rank.
         :return: A list of the inclusive start-points of all the suffixes of the string, sorted
         by the suffixes.
         """
-        # For each comparison length from 1 to n characters, doubling:
-        half_length: int = 1
-        while half_length <= len(self.string):
-            # Sort the suffixes by their first few characters
-            self.sort(half_length)
+        self.counting_sort(self.suffix_array)
 
-            # Update the rank array
+        # For each comparison length, doubling, until the ranks are all distinct:
+        half_length: int = 1
+        while self.class_count < len(self.string):
+            self.radix_sort(half_length)
             self.update_rank(half_length)
-
             half_length *= 2
 
-        return self.suffix_array
+        return self.suffix_array.tolist()
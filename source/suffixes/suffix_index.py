@@ -0,0 +1,421 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Suffix Array Index with LCP-Accelerated Pattern Search
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+from array import array
+from typing import Iterable, Sequence
+
+from source.suffixes.range_minimum import SparseTable
+from source.suffixes.sa_is import sa_is
+
+
+def build_lcp_array(text: Sequence, suffix_array: Sequence[int]) -> array:
+    """
+    Builds the LCP array of a suffix array using Kasai's algorithm.
+    Works by visiting the suffixes in text order, where the LCP with the preceding suffix in the
+    suffix array drops by at most one from one suffix to the next.
+
+    n - number of symbols in the text
+
+    Time complexity:            O(n)
+    Auxiliary space complexity: O(n)
+
+    :param text: A string, bytes-like object or integer sequence.
+    :param suffix_array: The sorted start-points of the non-empty suffixes of the text.
+    :return: An array where the value at index i is the length of the longest common prefix of the
+    suffixes at suffix_array[i - 1] and suffix_array[i], and 0 at index 0.
+    """
+    n: int = len(suffix_array)
+    rank: array = array('i', [0]) * n
+    lcp: array = array('i', [0]) * n
+
+    for i in range(n):
+        rank[suffix_array[i]] = i
+
+    length: int = 0
+
+    for suffix in range(n):
+        if rank[suffix] == 0:
+            length = 0
+            continue
+
+        previous: int = suffix_array[rank[suffix] - 1]
+
+        while suffix + length < n and previous + length < n and text[suffix + length] == text[previous + length]:
+            length += 1
+
+        lcp[rank[suffix]] = length
+
+        if length > 0:
+            length -= 1
+
+    return lcp
+
+
+class SuffixIndex:
+    """
+    A full-text index over a suffix array and its LCP array.
+    Pattern searches are binary searches over the suffix array, where precomputed LCPs between each
+    search midpoint and the interval ends let every text character be compared at most once (the
+    Manber-Myers "mlr" search with LCP-LR arrays).
+
+    n - number of symbols in the text
+    m - number of symbols in the pattern
+    c - number of matches
+
+                            Time complexity
+    construction:           O(n)
+    count:                  O(m + log(n))
+    locate:                 O(m + log(n) + c * log(c))
+    """
+
+    def __init__(self, text: str | bytes | bytearray | memoryview | Sequence[int],
+                 suffix_array: Sequence[int] | None = None, lcp_array: Sequence[int] | None = None,
+                 left_lcp: Sequence[int] | None = None, right_lcp: Sequence[int] | None = None) -> None:
+        """
+        Builds the index of a text, or wraps precomputed arrays.
+        :param text: A string, a bytes-like object, or a sequence of non-negative integers.
+        :param suffix_array: Optional. The sorted start-points of the non-empty suffixes of the text.
+        :param lcp_array: Optional. The LCP array matching the suffix array.
+        :param left_lcp: Optional. The left LCPs of the binary search midpoints, with right_lcp.
+        :param right_lcp: Optional. The right LCPs of the binary search midpoints, with left_lcp.
+        """
+        self.text: str | bytes | bytearray | memoryview | Sequence[int] = text
+        self.suffix_array: Sequence[int] = suffix_array if suffix_array is not None else sa_is(text)[1:]
+        self.lcp_array: Sequence[int] = (lcp_array if lcp_array is not None
+                                         else build_lcp_array(text, self.suffix_array))
+
+        self.left_lcp: Sequence[int] = (left_lcp if left_lcp is not None
+                                        else array('i', [0]) * len(self.suffix_array))
+        """left_lcp[i] is the LCP of suffix_array[i] and the suffix at the left end of the only binary
+        search interval with midpoint i, or 0 if that end is before the start."""
+
+        self.right_lcp: Sequence[int] = (right_lcp if right_lcp is not None
+                                         else array('i', [0]) * len(self.suffix_array))
+        """right_lcp[i] is the LCP of suffix_array[i] and the suffix at the right end of the only binary
+        search interval with midpoint i, or 0 if that end is after the stop."""
+
+        if left_lcp is None or right_lcp is None:
+            self.build_search_lcps()
+
+        self.rank: Sequence[int] | None = None
+        """rank[i] is the index of suffix i in the suffix array. Built on the first LCP query."""
+
+        self.range_minimum: SparseTable | None = None
+        """Range minimum queries over the LCP array. Built on the first LCP query."""
+
+    def __len__(self) -> int:
+        """
+        :return: The number of symbols in the text.
+        """
+        return len(self.suffix_array)
+
+    def build_search_lcps(self) -> None:
+        """
+        Fills the left and right LCPs of every binary search midpoint.
+        The LCP of two suffixes is the minimum of the LCP array between them, which is combined
+        bottom-up over the implicit binary search tree.
+        """
+        lcp: Sequence[int] = self.lcp_array
+        left_lcp: Sequence[int] = self.left_lcp
+        right_lcp: Sequence[int] = self.right_lcp
+        n: int = len(self.suffix_array)
+
+        def fill(low: int, high: int) -> int:
+            if high - low < 2:
+                return lcp[high] if low >= 0 and high < n else 0
+
+            middle: int = (low + high) // 2
+            left_lcp[middle] = fill(low, middle)
+            right_lcp[middle] = fill(middle, high)
+            return min(left_lcp[middle], right_lcp[middle])
+
+        fill(-1, n)
+
+    def build_lcp_queries(self) -> None:
+        """
+        Builds the inverse suffix array and the sparse table over the LCP array, if not yet built.
+        """
+        if self.rank is not None:
+            return
+
+        self.rank = array('i', [0]) * len(self.suffix_array)
+
+        for i, suffix in enumerate(self.suffix_array):
+            self.rank[suffix] = i
+
+        self.range_minimum = SparseTable(self.lcp_array)
+
+    def longest_common_prefix(self, first: int, second: int) -> int:
+        """
+        Finds the length of the longest common prefix of two suffixes of the text.
+
+        Time complexity:            O(1), after O(n * log(n)) preprocessing on the first call
+
+        :param first: The inclusive start of the first suffix.
+        :param second: The inclusive start of the second suffix.
+        :return: The length of the longest common prefix.
+        """
+        if first == second:
+            return len(self.suffix_array) - first
+
+        self.build_lcp_queries()
+        first_rank: int = self.rank[first]
+        second_rank: int = self.rank[second]
+
+        if first_rank > second_rank:
+            first_rank, second_rank = second_rank, first_rank
+
+        # The LCP of two suffixes is the minimum of the adjacent LCPs between them
+        return self.range_minimum.query(first_rank + 1, second_rank + 1)
+
+    def longest_repeated_substring(self) -> tuple[int, int]:
+        """
+        Finds a longest substring that occurs at least twice in the text, possibly overlapping.
+
+        Time complexity:            O(n)
+
+        :return: The inclusive start of an occurrence of the substring and its length, with a length of
+        0 if no symbol repeats.
+        """
+        best: int = 0
+
+        for i in range(1, len(self.lcp_array)):
+            if self.lcp_array[i] > self.lcp_array[best]:
+                best = i
+
+        if best == 0:
+            return 0, 0
+
+        return self.suffix_array[best], self.lcp_array[best]
+
+    def count_distinct_substrings(self) -> int:
+        """
+        Counts the distinct non-empty substrings of the text.
+        Each suffix contributes its prefixes that are not shared with the preceding suffix.
+
+        Time complexity:            O(n)
+
+        :return: The number of distinct non-empty substrings.
+        """
+        n: int = len(self.suffix_array)
+        return n * (n + 1) // 2 - sum(self.lcp_array)
+
+    def encode(self, pattern: str | bytes | Sequence[int]) -> Sequence:
+        """
+        Converts a pattern to the symbol type of the text.
+        :param pattern: A pattern string, bytes-like object or integer sequence.
+        :return: The pattern, with a string converted to code points if the text is not a string.
+        """
+        if isinstance(pattern, str) and not isinstance(self.text, str):
+            return [ord(c) for c in pattern]
+
+        return pattern
+
+    def find_bound(self, pattern: Sequence, upper: bool) -> int:
+        """
+        Binary searches the suffix array for the boundary of the suffixes starting with a pattern.
+        :param pattern: An encoded pattern.
+        :param upper: Whether to find the exclusive stop rather than the inclusive start.
+        :return: The inclusive start of the suffixes starting with the pattern, or their exclusive stop.
+        """
+        text: Sequence = self.text
+        suffix_array: Sequence[int] = self.suffix_array
+        n: int = len(suffix_array)
+        m: int = len(pattern)
+        low: int = -1           # suffix_array[low] is before the boundary
+        high: int = n           # suffix_array[high] is after the boundary
+        low_match: int = 0      # LCP of the pattern and suffix_array[low]
+        high_match: int = 0     # LCP of the pattern and suffix_array[high]
+
+        while high - low > 1:
+            middle: int = (low + high) // 2
+            length: int
+
+            # Decide from the LCPs with the end sharing more with the pattern, if possible
+            if low_match >= high_match:
+                shared: int = self.left_lcp[middle]
+
+                if shared < low_match:
+                    high, high_match = middle, shared
+                    continue
+                elif shared > low_match or low_match == m:
+                    low = middle
+                    continue
+
+                length = low_match
+            else:
+                shared: int = self.right_lcp[middle]
+
+                if shared < high_match:
+                    low, low_match = middle, shared
+                    continue
+                elif shared > high_match or high_match == m:
+                    high = middle
+                    continue
+
+                length = high_match
+
+            # Otherwise compare the remaining characters directly
+            suffix: int = suffix_array[middle]
+
+            while length < m and suffix + length < n and text[suffix + length] == pattern[length]:
+                length += 1
+
+            if length == m:
+                if upper:
+                    low, low_match = middle, length
+                else:
+                    high, high_match = middle, length
+            elif suffix + length == n or text[suffix + length] < pattern[length]:
+                low, low_match = middle, length
+            else:
+                high, high_match = middle, length
+
+        return high
+
+    def find_bound_within(self, pattern: Sequence, upper: bool, start: int, stop: int, known: int) -> int:
+        """
+        Binary searches part of the suffix array whose suffixes all start with a known prefix of the
+        pattern. Searches skip the characters known to match, and the smaller of the LCPs with the
+        interval ends.
+        :param pattern: An encoded pattern.
+        :param upper: Whether to find the exclusive stop rather than the inclusive start.
+        :param start: The inclusive start of the part to search.
+        :param stop: The exclusive stop of the part to search.
+        :param known: The length of the pattern prefix shared by all the suffixes in the part.
+        :return: The inclusive start of the suffixes starting with the pattern, or their exclusive stop.
+        """
+        text: Sequence = self.text
+        suffix_array: Sequence[int] = self.suffix_array
+        n: int = len(suffix_array)
+        m: int = len(pattern)
+        low: int = start - 1
+        high: int = stop
+        low_match: int = 0
+        high_match: int = 0
+
+        while high - low > 1:
+            middle: int = (low + high) // 2
+            suffix: int = suffix_array[middle]
+            length: int = max(known, min(low_match, high_match))
+
+            while length < m and suffix + length < n and text[suffix + length] == pattern[length]:
+                length += 1
+
+            if length == m:
+                if upper:
+                    low, low_match = middle, length
+                else:
+                    high, high_match = middle, length
+            elif suffix + length == n or text[suffix + length] < pattern[length]:
+                low, low_match = middle, length
+            else:
+                high, high_match = middle, length
+
+        return high
+
+    def find_interval(self, pattern: str | bytes | Sequence[int]) -> tuple[int, int]:
+        """
+        :param pattern: A pattern string, bytes-like object or integer sequence.
+        :return: The inclusive start and exclusive stop of the suffix array entries starting with
+        the pattern.
+        """
+        pattern = self.encode(pattern)
+        return self.find_bound(pattern, False), self.find_bound(pattern, True)
+
+    def count(self, pattern: str | bytes | Sequence[int]) -> int:
+        """
+        Counts the occurrences of a pattern in the text.
+        :param pattern: A pattern string, bytes-like object or integer sequence.
+        :return: The number of occurrences.
+        """
+        start, stop = self.find_interval(pattern)
+        return stop - start
+
+    def locate(self, pattern: str | bytes | Sequence[int]) -> list[int]:
+        """
+        Finds the occurrences of a pattern in the text.
+        :param pattern: A pattern string, bytes-like object or integer sequence.
+        :return: A sorted list of the inclusive start-points of the matches in the text.
+        """
+        start, stop = self.find_interval(pattern)
+        return sorted(self.suffix_array[start:stop])
+
+    def locate_many(self, patterns: Iterable[str | bytes | Sequence[int]]) -> list[list[int]]:
+        """
+        Finds the occurrences of many patterns in the text.
+        The patterns are searched in sorted order, so a pattern extending an earlier pattern is only
+        searched for within that pattern's matches, skipping the shared prefix.
+        :param patterns: An iterable of patterns.
+        :return: A list with, for each pattern in order, a sorted list of the inclusive start-points
+        of its matches in the text.
+        """
+        encoded: list[Sequence] = [self.encode(pattern) for pattern in patterns]
+        results: list[list[int]] = [[] for _ in encoded]
+        prefixes: list[tuple[Sequence, int, int]] = []  # Earlier patterns with their suffix array intervals
+
+        for i in sorted(range(len(encoded)), key=lambda j: tuple(encoded[j])):
+            pattern: Sequence = encoded[i]
+
+            # Keep only the earlier patterns that are prefixes of this one
+            while prefixes and tuple(pattern[:len(prefixes[-1][0])]) != tuple(prefixes[-1][0]):
+                prefixes.pop()
+
+            if not prefixes:
+                start: int = self.find_bound(pattern, False)
+                stop: int = self.find_bound(pattern, True)
+            else:
+                prefix, prefix_start, prefix_stop = prefixes[-1]
+                start = self.find_bound_within(pattern, False, prefix_start, prefix_stop, len(prefix))
+                stop = self.find_bound_within(pattern, True, start, prefix_stop, len(prefix))
+
+            prefixes.append((pattern, start, stop))
+            results[i] = sorted(self.suffix_array[start:stop])
+
+        return results
+
+
+def longest_common_substring(first: str | bytes | Sequence[int],
+                             second: str | bytes | Sequence[int]) -> tuple[int, int, int]:
+    """
+    Finds a longest common substring of two texts using a suffix array of both texts joined by a
+    unique separator. A longest common substring is the prefix shared by some pair of adjacent
+    suffixes from different texts.
+
+    n - total number of symbols in both texts
+
+    Time complexity:            O(n)
+    Auxiliary space complexity: O(n)
+
+    :param first: A string, bytes-like object or integer sequence.
+    :param second: A text of the same kind.
+    :return: The inclusive start of the substring in the first text, its inclusive start in the second
+    text, and its length. The length is 0 if the texts share no symbol.
+    """
+    # Shift every symbol up by one to make room for a separator smaller than all of them
+    combined: list[int] = [ord(c) + 1 for c in first] if isinstance(first, str) else [c + 1 for c in first]
+    combined.append(0)
+
+    if isinstance(second, str):
+        combined.extend(ord(c) + 1 for c in second)
+    else:
+        combined.extend(c + 1 for c in second)
+
+    index: SuffixIndex = SuffixIndex(combined)
+    boundary: int = len(first)      # Suffixes starting before the separator are from the first text
+    best: tuple[int, int, int] = (0, 0, 0)
+
+    for i in range(1, len(index.suffix_array)):
+        previous: int = index.suffix_array[i - 1]
+        current: int = index.suffix_array[i]
+
+        if (previous < boundary) != (current < boundary) and previous != boundary and current != boundary:
+            if index.lcp_array[i] > best[2]:
+                first_start, second_start = (previous, current) if previous < boundary else (current, previous)
+                best = (first_start, second_start - boundary - 1, index.lcp_array[i])
+
+    return best
@@ -0,0 +1,140 @@
+import random
+import unittest
+from source.heaps.fibonacci_heap import *
+from source.heaps.heap_statistics import *
+
+
+class TestExtractMinimum(unittest.TestCase):
+    def test_empty(self):
+        heap: MinimumFibonacciHeap = MinimumFibonacciHeap()
+        self.assertRaises(IndexError, heap.extract_minimum)
+
+    def test_sorted_order(self):
+        keys: list[int] = [random.randrange(1000) for _ in range(2000)]
+        heap: MinimumFibonacciHeap = MinimumFibonacciHeap()
+
+        for key in keys:
+            heap.insert(Node(key))
+
+        self.assertEqual(len(heap), len(keys))
+        self.assertEqual([heap.extract_minimum().key for _ in range(len(keys))], sorted(keys))
+        self.assertEqual(len(heap), 0)
+        self.assertIsNone(heap.get_minimum())
+
+    def test_merge(self):
+        first: MinimumFibonacciHeap = MinimumFibonacciHeap()
+        second: MinimumFibonacciHeap = MinimumFibonacciHeap()
+
+        for key in [5, 3, 8]:
+            first.insert(Node(key))
+
+        for key in [7, 1]:
+            second.insert(Node(key))
+
+        first.merge(second)
+        self.assertEqual(len(first), 5)
+        self.assertEqual(len(second), 0)
+        self.assertEqual([first.extract_minimum().key for _ in range(5)], [1, 3, 5, 7, 8])
+
+
+class TestDecreaseKey(unittest.TestCase):
+    def test_increase_raises(self):
+        heap: MinimumFibonacciHeap = MinimumFibonacciHeap()
+        node: Node = Node(3)
+        heap.insert(node)
+        self.assertRaises(ValueError, heap.decrease_key, node, 4)
+
+    def test_random_operations(self):
+        heap: MinimumFibonacciHeap = MinimumFibonacciHeap()
+        live: dict[int, Node] = {}
+
+        for i in range(1000):
+            node: Node = Node(random.randrange(10000), i)
+            heap.insert(node)
+            live[i] = node
+
+        for _ in range(3000):
+            operation: int = random.randrange(3)
+
+            if operation == 0 and live:
+                minimum: Node = heap.extract_minimum()
+                self.assertEqual(minimum.key, min(node.key for node in live.values()))
+                del live[minimum.data]
+            elif operation == 1 and live:
+                node: Node = live[random.choice(list(live))]
+                heap.decrease_key(node, node.key - random.randrange(100))
+            elif live:
+                node: Node = live.pop(random.choice(list(live)))
+                heap.delete(node)
+
+            self.assertEqual(len(heap), len(live))
+
+        remaining: list[int | float] = sorted(node.key for node in live.values())
+        self.assertEqual([heap.extract_minimum().key for _ in range(len(remaining))], remaining)
+
+
+class TestBulkInsert(unittest.TestCase):
+    def test_insert_many(self):
+        heap: MinimumFibonacciHeap = MinimumFibonacciHeap()
+        heap.insert(Node(50))
+        heap.insert_many(Node(key) for key in [40, 70, 10, 60])
+        heap.insert_many([])
+        self.assertEqual(len(heap), 5)
+        self.assertEqual([heap.extract_minimum().key for _ in range(5)], [10, 40, 50, 60, 70])
+
+    def test_from_items(self):
+        keys: list[int] = [random.randrange(1000) for _ in range(500)]
+        heap: MinimumFibonacciHeap = MinimumFibonacciHeap.from_items(keys, range(len(keys)))
+        self.assertEqual(len(heap), len(keys))
+
+        for _ in range(len(keys)):
+            node: Node = heap.extract_minimum()
+            self.assertEqual(keys[node.data], node.key)
+            self.assertEqual(node.key, min(key for key in keys if key is not None))
+            keys[node.data] = None
+
+
+class TestStatistics(unittest.TestCase):
+    def test_counters(self):
+        heap: InstrumentedFibonacciHeap = InstrumentedFibonacciHeap()
+        nodes: list[Node] = [Node(key) for key in range(64)]
+        heap.insert_many(nodes)
+        heap.extract_minimum()
+
+        snapshot: dict = heap.snapshot()
+        self.assertEqual(snapshot["links"], 63 - 6)
+        self.assertEqual(snapshot["root_list_maximum"], 63)
+        self.assertEqual(snapshot["maximum_degree"], 5)
+        self.assertEqual(snapshot["operations"]["extract_minimum"]["count"], 1)
+
+        # Cutting a second child from a non-root node cascades up to that node
+        parent: Node = next(node for node in nodes if node.parent is not None and node.child_count >= 2)
+        heap.decrease_key(parent.child, -1)
+        heap.decrease_key(parent.child, -2)
+        snapshot = heap.snapshot(reset=True)
+        self.assertEqual(snapshot["cuts"], 3)
+        self.assertEqual(snapshot["cascading_cuts"], 1)
+        self.assertEqual(heap.snapshot()["cuts"], 0)
+
+    def test_operation_counts(self):
+        heap: InstrumentedFibonacciHeap = InstrumentedFibonacciHeap()
+        nodes: list[Node] = [Node(key) for key in range(100)]
+
+        for node in nodes:
+            heap.insert(node)
+
+        heap.extract_minimum()
+
+        for node in nodes[1:31]:
+            heap.delete(node)
+
+        heap.extract_minimum()
+        operations: dict = heap.snapshot()["operations"]
+        self.assertEqual(operations["insert"]["count"], 100)
+        self.assertEqual(operations["extract_minimum"]["count"], 2)
+        self.assertEqual(operations["delete"]["count"], 30)
+        self.assertEqual(len(heap), 68)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import random
+import unittest
+from source.graphs.csr_graph import *
+from source.graphs.graph_search import *
+from source.heaps.dary_heap import IndexedDaryHeap
+from source.heaps.pairing_heap import MinimumPairingHeap
+
+
+FACTORIES = [MinimumFibonacciHeap, MinimumPairingHeap, IndexedDaryHeap]
+
+
+def floyd_warshall(vertex_count: int, edges: list[tuple[int, int, int]]) -> list[list[float]]:
+    distances: list[list[float]] = [[INFINITY] * vertex_count for _ in range(vertex_count)]
+
+    for vertex in range(vertex_count):
+        distances[vertex][vertex] = 0
+
+    for source, target, weight in edges:
+        distances[source][target] = min(distances[source][target], weight)
+
+    for k in range(vertex_count):
+        for i in range(vertex_count):
+            for j in range(vertex_count):
+                distances[i][j] = min(distances[i][j], distances[i][k] + distances[k][j])
+
+    return distances
+
+
+class TestCSRGraph(unittest.TestCase):
+    def test_from_edges(self):
+        graph: CSRGraph = CSRGraph.from_edges(3, [(2, 0, 1.5), (0, 1, 2), (0, 2, 3)])
+        self.assertEqual(graph.vertex_count, 3)
+        self.assertEqual(graph.edge_count, 3)
+        self.assertEqual(sorted(graph.neighbours(0)), [(1, 2.0), (2, 3.0)])
+        self.assertEqual(list(graph.neighbours(1)), [])
+        self.assertEqual(list(graph.neighbours(2)), [(0, 1.5)])
+
+    def test_invalid_edge(self):
+        self.assertRaises(ValueError, CSRGraph.from_edges, 2, [(0, 2, 1)])
+
+
+class TestShortestPaths(unittest.TestCase):
+    def setUp(self):
+        generator: random.Random = random.Random(7)
+        self.vertex_count: int = 40
+        self.edges: list[tuple[int, int, int]] = [(generator.randrange(40), generator.randrange(40),
+                                                   generator.randrange(1, 20)) for _ in range(200)]
+        self.graph: CSRGraph = CSRGraph.from_edges(self.vertex_count, self.edges)
+        self.expected: list[list[float]] = floyd_warshall(self.vertex_count, self.edges)
+
+    def test_dijkstra(self):
+        for factory in FACTORIES:
+            distances, predecessors = dijkstra(self.graph, 0, heap_factory=factory)
+            self.assertEqual(list(distances), self.expected[0])
+
+            for vertex in range(self.vertex_count):
+                if distances[vertex] < INFINITY:
+                    self.assertEqual(build_path(predecessors, vertex)[0], 0)
+
+    def test_dijkstra_early_exit(self):
+        for target in range(self.vertex_count):
+            distances, _ = dijkstra(self.graph, 3, target)
+            self.assertEqual(distances[target], self.expected[3][target])
+
+    def test_a_star(self):
+        for factory in FACTORIES:
+            for target in range(self.vertex_count):
+                distance, path = a_star(self.graph, 5, target, lambda vertex: 0, factory)
+                self.assertEqual(distance, self.expected[5][target])
+
+                if path:
+                    self.assertEqual((path[0], path[-1]), (5, target))
+
+
+class TestPrim(unittest.TestCase):
+    def test_forest(self):
+        edges: list[tuple[int, int, int]] = [(0, 1, 4), (0, 2, 1), (1, 2, 2), (1, 3, 5), (2, 3, 8), (4, 5, 3)]
+        graph: CSRGraph = CSRGraph.from_edges(6, edges, directed=False)
+
+        for factory in FACTORIES:
+            total, parents = prim(graph, factory)
+            self.assertEqual(total, 1 + 2 + 5 + 3)
+            self.assertEqual(list(parents), [-1, 2, 0, 1, -1, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,269 @@
+import io
+import mmap
+import os
+import random
+import tempfile
+import unittest
+from source.patterns.aho_corasick import *
+from source.patterns.approximate_matching import *
+from source.patterns.boyer_moore import *
+from source.patterns.file_search import *
+from source.patterns.naive_matching import *
+from source.patterns.parallel_search import *
+from source.patterns import search
+from source.patterns.shift_and import ShiftAndPattern, parse_classes
+from source.patterns import shift_and
+from source.patterns.z_matching import *
+
+
+def brute_force_match(text, pattern, start: int = 0, end: int | None = None) -> list[int]:
+    end = len(text) if end is None else end
+    return [i for i in range(start, end - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+class TestBoyerMoore(unittest.TestCase):
+    def test_matcher(self):
+        self.assertEqual(BoyerMooreMatcher("abracadabra", "abra").match(), [0, 7])
+        self.assertEqual(BoyerMooreMatcher("aaaaa", "aa").match(), [0, 1, 2, 3])
+
+    def test_random(self):
+        generator: random.Random = random.Random(17)
+
+        for _ in range(500):
+            alphabet: str = generator.choice(["ab", "acgt"])
+            text: str = "".join(generator.choice(alphabet) for _ in range(generator.randrange(60)))
+            pattern: str = "".join(generator.choice(alphabet) for _ in range(generator.randrange(1, 7)))
+            start: int = generator.randrange(5)
+            end: int = generator.randrange(65)
+            compiled: BoyerMoorePattern = compile(pattern)
+            self.assertEqual(list(compiled.finditer(text, start, end)), brute_force_match(text, pattern, start, end))
+            self.assertEqual(list(compile(pattern.encode()).finditer(text.encode())),
+                             brute_force_match(text, pattern))
+
+    def test_galil_rule(self):
+        for text, pattern in [("a" * 100, "aaaa"), ("ab" * 50, "abab"), ("abaababaab" * 10, "abaab")]:
+            compiled: BoyerMoorePattern = compile(pattern)
+            expected: list[int] = brute_force_match(text, pattern)
+            self.assertEqual(list(compiled.finditer(text, galil=True)), expected)
+            self.assertEqual(list(compiled.finditer(text, galil=False)), expected)
+
+    def test_empty_pattern(self):
+        self.assertRaises(ValueError, compile, "")
+
+
+class TestAhoCorasick(unittest.TestCase):
+    def test_overlapping_patterns(self):
+        automaton: AhoCorasickAutomaton = AhoCorasickAutomaton(["he", "she", "his", "hers"])
+        self.assertEqual(automaton.match("ushers"), [[2], [1], [], [2]])
+        self.assertEqual(list(automaton.finditer("ushers")), [(1, 1), (2, 0), (2, 3)])
+
+    def test_random(self):
+        generator: random.Random = random.Random(19)
+
+        for _ in range(300):
+            text: str = "".join(generator.choice("abc") for _ in range(generator.randrange(60)))
+            patterns: list[str] = ["".join(generator.choice("abc") for _ in range(generator.randrange(1, 6)))
+                                   for _ in range(generator.randrange(1, 8))]
+            expected: list[list[int]] = [brute_force_match(text, pattern) for pattern in patterns]
+            self.assertEqual(AhoCorasickAutomaton(patterns).match(text), expected)
+            self.assertEqual(AhoCorasickAutomaton([pattern.encode() for pattern in patterns]).match(text.encode()),
+                             expected)
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "automaton.bin")
+            save_aho_corasick(AhoCorasickAutomaton([b"abra", b"cad", b"a"]), path)
+            automaton: AhoCorasickAutomaton = load_aho_corasick(path)
+            self.assertEqual(automaton.match(b"abracadabra"), [[0, 7], [4], [0, 3, 5, 7, 10]])
+            del automaton
+
+    def test_invalid_patterns(self):
+        self.assertRaises(ValueError, AhoCorasickAutomaton, [])
+        self.assertRaises(ValueError, AhoCorasickAutomaton, ["a", ""])
+        self.assertRaises(ValueError, AhoCorasickAutomaton, ["a", b"b"])
+
+
+class TestZMatchStream(unittest.TestCase):
+    def test_failures(self):
+        self.assertEqual(build_failures("abaabab"), [0, 0, 1, 0, 0, 3, 2])
+
+    def test_chunks(self):
+        generator: random.Random = random.Random(23)
+
+        for _ in range(300):
+            text: str = "".join(generator.choice("ab") for _ in range(generator.randrange(60)))
+            pattern: str = "".join(generator.choice("ab") for _ in range(generator.randrange(1, 7)))
+            cuts: list[int] = sorted(generator.sample(range(len(text) + 1), min(len(text) + 1, 4)))
+            chunks: list[str] = [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+            self.assertEqual(list(z_match_stream(chunks, pattern)), brute_force_match(text, pattern))
+
+    def test_file(self):
+        stream: io.BytesIO = io.BytesIO(b"abcabcabc" * 10)
+        self.assertEqual(list(z_match_stream(stream, b"cab", chunk_size=4)), list(range(2, 88, 3)))
+
+
+class TestBytesMatching(unittest.TestCase):
+    def test_matchers(self):
+        text: bytes = b"abracadabra"
+        expected: list[int] = [0, 7]
+
+        for buffer in [text, bytearray(text), memoryview(text)]:
+            self.assertEqual(naive_match(buffer, b"abra"), expected)
+            self.assertEqual(z_match(buffer, b"abra"), expected)
+            self.assertEqual(BoyerMooreMatcher(buffer, b"abra").match(), expected)
+
+    def test_last_alignment(self):
+        self.assertEqual(naive_match("abcab", "ab"), [0, 3])
+        self.assertEqual(z_match("abcab", "ab"), [0, 3])
+
+    def test_z_match_separator(self):
+        self.assertEqual(z_match("a$b$a$b", "$b"), [1, 5])
+
+    def test_search_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "log.txt")
+
+            with open(path, "wb") as file:
+                file.write("naïve error\nerror\n".encode("utf-8"))
+
+            self.assertEqual(search_file(path, "error"), [7, 13])
+            self.assertEqual(search_file(path, "ï"), [2])
+
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as text:
+                self.assertEqual(z_match(text, b"error"), [7, 13])
+
+            open(path, "wb").close()
+            self.assertEqual(search_file(path, "error"), [])
+
+
+class TestParallelSearch(unittest.TestCase):
+    def test_chunks(self):
+        generator: random.Random = random.Random(29)
+        text: bytes = bytes(generator.choice(b"ab") for _ in range(2000))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "text.bin")
+
+            with open(path, "wb") as file:
+                file.write(text)
+
+            for pattern in [b"a", b"ab", b"abbab"]:
+                expected: list[int] = brute_force_match(text, pattern)
+                self.assertEqual(parallel_search(text, pattern, 2, chunk_size=97, threshold=0), expected)
+                self.assertEqual(parallel_search_file(path, pattern, 2, chunk_size=97, threshold=0), expected)
+
+    def test_in_process(self):
+        self.assertEqual(parallel_search("abcab", "ab"), [0, 3])
+        self.assertEqual(parallel_search(b"", b"ab", threshold=0), [])
+
+
+class TestShiftAnd(unittest.TestCase):
+    def test_literal(self):
+        generator: random.Random = random.Random(31)
+
+        for _ in range(300):
+            text: str = "".join(generator.choice("ab") for _ in range(generator.randrange(60)))
+            pattern: str = "".join(generator.choice("ab") for _ in range(generator.randrange(1, 7)))
+            expected: list[int] = brute_force_match(text, pattern)
+            self.assertEqual(list(shift_and.compile(pattern).finditer(text)), expected)
+            self.assertEqual(list(shift_and.compile(pattern.encode()).finditer(text.encode())), expected)
+
+    def test_long_pattern(self):
+        self.assertEqual(list(shift_and.compile("ab" * 50).finditer("ab" * 52)), [0, 2, 4])
+
+    def test_classes(self):
+        self.assertEqual(parse_classes("a[^b-d]\\["), [({"a"}, False), ({"b", "c", "d"}, True), ({"["}, False)])
+        self.assertEqual(list(shift_and.compile("x[0-9][^a]").finditer("x1ax2bx3")), [3])
+        self.assertEqual(list(shift_and.compile(b"[]a]b").finditer(b"]bab")), [0, 2])
+        self.assertEqual(list(shift_and.compile("[a]", classes=False).finditer("[a][a]")), [0, 3])
+        self.assertRaises(ValueError, shift_and.compile, "[ab")
+        self.assertRaises(ValueError, shift_and.compile, "[z-a]")
+
+    def test_ignore_case(self):
+        self.assertEqual(list(shift_and.compile("error", ignore_case=True).finditer("Error ERROR error")), [0, 6, 12])
+        self.assertEqual(list(shift_and.compile(b"[a-c]x", ignore_case=True).finditer(b"AxbXdx")), [0, 2])
+
+
+def edit_distance_ends(text: str, pattern: str, k: int) -> list[tuple[int, int]]:
+    column: list[int] = list(range(len(pattern) + 1))
+    ends: list[tuple[int, int]] = []
+
+    for j, character in enumerate(text):
+        next_column: list[int] = [0]
+
+        for i in range(1, len(pattern) + 1):
+            next_column.append(min(column[i] + 1, next_column[i - 1] + 1,
+                                   column[i - 1] + (pattern[i - 1] != character)))
+
+        column = next_column
+
+        if column[-1] <= k:
+            ends.append((j + 1, column[-1]))
+
+    return ends
+
+
+class TestApproximateMatching(unittest.TestCase):
+    def test_k_mismatch(self):
+        self.assertEqual(k_mismatch_match("acgtacgaacgt", "acgt", 1), [(0, 0), (4, 1), (8, 0)])
+        self.assertEqual(k_mismatch_match(b"aaaa", b"bb", 1), [])
+
+    def test_random(self):
+        generator: random.Random = random.Random(37)
+
+        for _ in range(300):
+            text: str = "".join(generator.choice("acgt") for _ in range(generator.randrange(50)))
+            pattern: str = "".join(generator.choice("acgt") for _ in range(generator.randrange(1, 8)))
+            k: int = generator.randrange(3)
+            mismatches: list[tuple[int, int]] = []
+
+            for start in range(len(text) - len(pattern) + 1):
+                count: int = sum(a != b for a, b in zip(text[start:start + len(pattern)], pattern))
+
+                if count <= k:
+                    mismatches.append((start, count))
+
+            self.assertEqual(k_mismatch_match(text, pattern, k), mismatches)
+            self.assertEqual(k_edit_match(text, pattern, k), edit_distance_ends(text, pattern, k))
+            self.assertEqual(k_edit_match(text.encode(), pattern.encode(), k), edit_distance_ends(text, pattern, k))
+
+    def test_k_edit(self):
+        self.assertEqual(k_edit_match("the quick brwn fox", "brown", 1), [(14, 1)])
+        self.assertEqual(len(k_edit_match("x" * 10 + "ab" * 40, "ab" * 40, 0)), 1)
+        self.assertRaises(ValueError, k_edit_match, "text", "", 1)
+
+
+class TestSearch(unittest.TestCase):
+    def test_selection(self):
+        self.assertEqual(search.select_algorithm("a", 10 ** 6), search.NAIVE)
+        self.assertEqual(search.select_algorithm("acgtacgt", 10), search.NAIVE)
+        self.assertEqual(search.select_algorithm("acgtacgt", 10 ** 6), search.SHIFT_AND)
+        self.assertEqual(search.select_algorithm("needle in a haystack", 10 ** 6), search.BOYER_MOORE)
+
+    def test_find(self):
+        generator: random.Random = random.Random(41)
+
+        for _ in range(200):
+            alphabet: str = generator.choice(["ab", "abcdefghij"])
+            text: str = "".join(generator.choice(alphabet) for _ in range(generator.randrange(200)))
+            pattern: str = "".join(generator.choice(alphabet) for _ in range(generator.randrange(1, 12)))
+            expected: list[int] = brute_force_match(text, pattern)
+            self.assertEqual(search.find(text, pattern), expected)
+            self.assertEqual(search.find(bytearray(text.encode()), bytearray(pattern.encode())), expected)
+            self.assertEqual(list(search.finditer(text, pattern, 10, 150)), brute_force_match(text, pattern, 10, 150))
+
+    def test_cache(self):
+        search.compile_pattern.cache_clear()
+        search.find("ab" * 100, "abab")
+        search.find("ba" * 100, "abab")
+        self.assertEqual(search.compile_pattern.cache_info().hits, 1)
+        self.assertRaises(ValueError, search.find, "text", "")
+
+    def test_mismatched_kinds(self):
+        for text, pattern in [(b"abcabc", "a"), ("abcabc", b"a"), (b"ab" * 100, "abab"),
+                              ("ab" * 100, bytearray(b"abab")), (memoryview(b"needle in a haystack" * 10), "needle in a haystack")]:
+            self.assertRaises(TypeError, search.find, text, pattern)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import random
+import unittest
+from source.heaps.dary_heap import *
+from source.heaps.fibonacci_heap import *
+from source.heaps.pairing_heap import *
+
+
+FACTORIES = [MinimumFibonacciHeap, MinimumPairingHeap, IndexedDaryHeap, lambda: IndexedDaryHeap(2)]
+
+
+class TestPriorityQueues(unittest.TestCase):
+    def test_random_operations(self):
+        for factory in FACTORIES:
+            heap = factory()
+            live: dict[int, int] = {}
+            handles: dict = {}
+            generator: random.Random = random.Random(1)
+
+            for step in range(4000):
+                operation: int = generator.randrange(3)
+
+                if operation == 0:
+                    live[step] = generator.randrange(10000)
+                    handles[step] = heap.push(live[step], step)
+                elif operation == 1 and live:
+                    key, data = heap.pop()
+                    self.assertEqual(key, min(live.values()))
+                    self.assertEqual(key, live.pop(data))
+                elif live:
+                    data: int = generator.choice(list(live))
+                    live[data] -= generator.randrange(100)
+                    heap.decrease_key(handles[data], live[data])
+
+                self.assertEqual(len(heap), len(live))
+
+            remaining: list[int] = sorted(live.values())
+            self.assertEqual([heap.pop()[0] for _ in range(len(remaining))], remaining)
+            self.assertRaises(IndexError, heap.pop)
+
+    def test_merge(self):
+        for factory in FACTORIES:
+            first = factory()
+            second = factory()
+
+            for key in [5, 3, 8]:
+                first.push(key)
+
+            for key in [7, 1, 4]:
+                second.push(key)
+
+            first.merge(second)
+            self.assertEqual(len(first), 6)
+            self.assertEqual(len(second), 0)
+            self.assertEqual([first.pop()[0] for _ in range(6)], [1, 3, 4, 5, 7, 8])
+
+    def test_delete(self):
+        for factory in [MinimumPairingHeap, IndexedDaryHeap]:
+            heap = factory()
+            handles: list = [heap.push(key) for key in [9, 2, 7, 4, 6, 1, 8]]
+            heap.delete(handles[3])
+            heap.delete(handles[5])
+            self.assertEqual([heap.pop()[0] for _ in range(5)], [2, 6, 7, 8, 9])
+
+    def test_handle_reuse(self):
+        heap: IndexedDaryHeap = IndexedDaryHeap()
+
+        for step in range(1000):
+            heap.push(step % 7, [step])
+
+            if step % 2 == 1:
+                heap.pop()
+                heap.pop()
+
+        self.assertEqual(len(heap), 0)
+        self.assertEqual(len(heap.keys), 2)
+        self.assertEqual(heap.data, [None, None])
+
+        other: IndexedDaryHeap = IndexedDaryHeap()
+        handles: list[int] = [other.push(key, key) for key in [4, 2, 6]]
+        other.delete(handles[1])
+        offset: int = heap.merge(other)
+        self.assertEqual(len(heap.keys), 5)
+        self.assertEqual(heap.push(1, 1), handles[1] + offset)
+        self.assertEqual([heap.pop() for _ in range(3)], [(1, 1), (4, 4), (6, 6)])
+
+
+if __name__ == "__main__":
+    unittest.main()
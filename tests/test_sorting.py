@@ -0,0 +1,143 @@
+import random
+import unittest
+from unittest import mock
+from source.sorting.heap_sort import *
+from source.sorting.insertion_sort import *
+from source.sorting.merge_sort import *
+from source.sorting.quick_sort import *
+
+
+class WorstPivotSorter(QuickSorter):
+    def choose_pivot(self, start: int, stop: int) -> int:
+        return start
+
+
+def adversarial_inputs(n: int) -> dict[str, list[int]]:
+    return {
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "organ pipe": list(range(n // 2)) + list(range(n // 2, 0, -1)),
+        "few distinct": [i % 3 for i in range(n)],
+        "sawtooth": [i % 37 for i in range(n)],
+    }
+
+
+class TestQuickSort(unittest.TestCase):
+    def test_sort(self):
+        generator: random.Random = random.Random(43)
+
+        for _ in range(200):
+            numbers: list[int] = [generator.randrange(10) for _ in range(generator.randrange(50))]
+            self.assertEqual(QuickSorter(numbers[:]).sort(), sorted(numbers))
+
+    def test_introsort(self):
+        generator: random.Random = random.Random(47)
+
+        for _ in range(200):
+            numbers: list[float] = [generator.random() for _ in range(generator.randrange(500))]
+            self.assertEqual(QuickSorter(numbers[:]).introsort(), sorted(numbers))
+
+    def test_introsort_adversarial(self):
+        for name, numbers in adversarial_inputs(20000).items():
+            with self.subTest(name):
+                self.assertEqual(QuickSorter(numbers[:]).introsort(), sorted(numbers))
+
+    def test_heapsort_fallback(self):
+        numbers: list[int] = list(range(5000))
+
+        with mock.patch("source.sorting.quick_sort.heap_sort", wraps=heap_sort) as fallback:
+            self.assertEqual(WorstPivotSorter(numbers[::-1]).introsort(), numbers)
+
+        self.assertTrue(fallback.called)
+
+        # Good pivots never reach the depth limit
+        with mock.patch("source.sorting.quick_sort.heap_sort", wraps=heap_sort) as fallback:
+            self.assertEqual(QuickSorter(numbers[::-1]).introsort(), numbers)
+
+        self.assertFalse(fallback.called)
+
+    def test_insertion_sort_cutoff(self):
+        numbers: list[int] = list(range(1000))
+
+        with mock.patch("source.sorting.quick_sort.insertion_sort", wraps=insertion_sort) as cutoff:
+            self.assertEqual(QuickSorter(numbers[::-1]).introsort(), numbers)
+
+        self.assertTrue(cutoff.called)
+        self.assertTrue(all(stop - start <= INSERTION_SORT_CUTOFF for (_, start, stop), _ in cutoff.call_args_list))
+
+    def test_sublist(self):
+        numbers: list[int] = [5, 4, 3, 2, 1, 0]
+        self.assertEqual(QuickSorter(numbers[:]).introsort(1, 5), [5, 1, 2, 3, 4, 0])
+        self.assertEqual(insertion_sort(numbers[:], 1, 5), [5, 1, 2, 3, 4, 0])
+        self.assertEqual(heap_sort(numbers[:], 1, 5), [5, 1, 2, 3, 4, 0])
+
+
+class TestHeapSort(unittest.TestCase):
+    def test_random(self):
+        generator: random.Random = random.Random(53)
+
+        for _ in range(200):
+            numbers: list[int] = [generator.randrange(100) for _ in range(generator.randrange(100))]
+            self.assertEqual(heap_sort(numbers[:]), sorted(numbers))
+
+
+class Record:
+    def __init__(self, key: int, order: int) -> None:
+        self.key: int = key
+        self.order: int = order
+
+    def __lt__(self, other: "Record") -> bool:
+        return self.key < other.key
+
+    def __le__(self, other: "Record") -> bool:
+        return self.key <= other.key
+
+    def __ge__(self, other: "Record") -> bool:
+        return self.key >= other.key
+
+
+class TestMergeSort(unittest.TestCase):
+    def test_sort(self):
+        generator: random.Random = random.Random(59)
+
+        for _ in range(100):
+            numbers: list[int] = [generator.randrange(100) for _ in range(generator.randrange(100))]
+            self.assertEqual(MergeSorter(numbers[:]).sort(), sorted(numbers))
+
+    def test_minimum_run(self):
+        self.assertEqual(compute_minimum_run(63), 63)
+        self.assertEqual(compute_minimum_run(2 ** 20), 32)
+        self.assertEqual(compute_minimum_run(2 ** 20 + 1), 33)
+
+    def test_adaptive_sort(self):
+        generator: random.Random = random.Random(61)
+
+        for _ in range(100):
+            numbers: list[float] = [generator.random() for _ in range(generator.randrange(2000))]
+            self.assertEqual(MergeSorter(numbers[:]).adaptive_sort(), sorted(numbers))
+
+        for name, numbers in adversarial_inputs(5000).items():
+            with self.subTest(name):
+                self.assertEqual(MergeSorter(numbers[:]).adaptive_sort(), sorted(numbers))
+
+    def test_natural_runs(self):
+        generator: random.Random = random.Random(67)
+        numbers: list[int] = []
+
+        while len(numbers) < 5000:
+            numbers.extend(sorted(generator.randrange(1000) for _ in range(generator.randrange(1, 500))))
+
+        self.assertEqual(MergeSorter(numbers[:]).adaptive_sort(), sorted(numbers))
+        self.assertEqual(MergeSorter(numbers[:]).adaptive_sort(100, 4000),
+                         numbers[:100] + sorted(numbers[100:4000]) + numbers[4000:])
+
+    def test_stable(self):
+        generator: random.Random = random.Random(71)
+        records: list[Record] = [Record(generator.randrange(5), i) for i in range(3000)]
+        result: list[Record] = MergeSorter(records[:]).adaptive_sort()
+        self.assertEqual([(record.key, record.order) for record in result],
+                         sorted((record.key, record.order) for record in records))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,10 @@
+import os
+import random
+import tempfile
 import unittest
+from array import array
+from source.suffixes.external_suffix_array import *
+from source.suffixes.sa_is import *
 from source.suffixes.suffix_array import *
 
 
@@ -17,6 +23,77 @@ class TestBuildSuffixArray(unittest.TestCase):
         prefix_doubler: PrefixDoubler = PrefixDoubler("banana")
         self.assertEqual(prefix_doubler.build_suffix_array(), [6, 5, 3, 1, 0, 4, 2])
 
+    def test_empty(self):
+        prefix_doubler: PrefixDoubler = PrefixDoubler("")
+        self.assertEqual(prefix_doubler.build_suffix_array(), [0])
+
+    def test_repeated_character(self):
+        prefix_doubler: PrefixDoubler = PrefixDoubler("aaaaaaaa")
+        self.assertEqual(prefix_doubler.build_suffix_array(), [8, 7, 6, 5, 4, 3, 2, 1, 0])
+
+    def test_against_sorting(self):
+        string: str = "mississippi$missouri$ssip"
+        expected: list[int] = sorted(range(len(string) + 1), key=lambda i: string[i:] + '\0')
+        self.assertEqual(PrefixDoubler(string).build_suffix_array(), expected)
+
+
+class TestSAIS(unittest.TestCase):
+    def test_banana(self):
+        self.assertEqual(sa_is(b"banana").tolist(), [6, 5, 3, 1, 0, 4, 2])
+
+    def test_empty(self):
+        self.assertEqual(sa_is(b"").tolist(), [0])
+
+    def test_sentinel_character(self):
+        self.assertEqual(sa_is("a$a").tolist(), PrefixDoubler("a$a").build_suffix_array())
+
+    def test_integer_alphabet(self):
+        self.assertEqual(sa_is(array('I', [70000, 5, 70000, 5])).tolist(), [4, 3, 1, 2, 0])
+
+    def test_against_prefix_doubling(self):
+        generator: random.Random = random.Random(3)
+
+        for _ in range(200):
+            alphabet: str = "abcd"[:generator.randrange(1, 5)]
+            string: str = "".join(generator.choice(alphabet) for _ in range(generator.randrange(60)))
+            expected: list[int] = PrefixDoubler(string).build_suffix_array()
+            self.assertEqual(sa_is(string).tolist(), expected)
+            self.assertEqual(sa_is(memoryview(string.encode())).tolist(), expected)
+
+
+class TestExternalSuffixArray(unittest.TestCase):
+    def test_against_sa_is(self):
+        generator: random.Random = random.Random(9)
+
+        with tempfile.TemporaryDirectory() as directory:
+            input_path: str = os.path.join(directory, "text.bin")
+            output_path: str = os.path.join(directory, "suffix_array.bin")
+
+            for length in [0, 1, 50, 1000]:
+                text: bytes = bytes(generator.choice(b"ab") for _ in range(length))
+
+                with open(input_path, "wb") as file:
+                    file.write(text)
+
+                build_suffix_array_external(input_path, output_path, block_size=37, workers=2)
+                suffix_array: memoryview = load_suffix_array(output_path)
+                self.assertEqual(suffix_array.tolist(), sa_is(text).tolist())
+                del suffix_array
+
+    def test_repetitive(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path: str = os.path.join(directory, "text.bin")
+            output_path: str = os.path.join(directory, "suffix_array.bin")
+
+            for text in [b"a" * 300, b"GET /index.html 200\n" * 40, b"abcabcabd" * 30 + b"abc"]:
+                with open(input_path, "wb") as file:
+                    file.write(text)
+
+                build_suffix_array_external(input_path, output_path, block_size=64, workers=2)
+                suffix_array: memoryview = load_suffix_array(output_path)
+                self.assertEqual(suffix_array.tolist(), sa_is(text).tolist())
+                del suffix_array
+
 
 if __name__ == "__main__":
     unittest.main()
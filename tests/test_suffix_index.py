@@ -0,0 +1,229 @@
+import os
+import random
+import tempfile
+import unittest
+from source.suffixes.fm_index import *
+from source.suffixes.incremental_index import *
+from source.suffixes.index_file import *
+from source.suffixes.range_minimum import *
+from source.suffixes.suffix_index import *
+
+
+def brute_force_locate(text, pattern) -> list[int]:
+    return [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+
+
+class TestLCPArray(unittest.TestCase):
+    def test_banana(self):
+        self.assertEqual(build_lcp_array("banana", [5, 3, 1, 0, 4, 2]).tolist(), [0, 1, 3, 0, 0, 2])
+
+
+class TestSuffixIndex(unittest.TestCase):
+    def setUp(self):
+        generator: random.Random = random.Random(5)
+        self.text: str = "".join(generator.choice("abc") for _ in range(500))
+        self.index: SuffixIndex = SuffixIndex(self.text)
+        self.patterns: list[str] = ["".join(generator.choice("abc") for _ in range(generator.randrange(1, 8)))
+                                    for _ in range(300)]
+
+    def test_locate(self):
+        for pattern in self.patterns:
+            expected: list[int] = brute_force_locate(self.text, pattern)
+            self.assertEqual(self.index.locate(pattern), expected)
+            self.assertEqual(self.index.count(pattern), len(expected))
+
+    def test_locate_many(self):
+        expected: list[list[int]] = [brute_force_locate(self.text, pattern) for pattern in self.patterns]
+        self.assertEqual(self.index.locate_many(self.patterns), expected)
+
+    def test_pattern_longer_than_text(self):
+        index: SuffixIndex = SuffixIndex("ab")
+        self.assertEqual(index.locate("abc"), [])
+
+    def test_bytes(self):
+        index: SuffixIndex = SuffixIndex(b"mississippi")
+        self.assertEqual(index.locate(b"ssi"), [2, 5])
+        self.assertEqual(index.locate("issi"), [1, 4])
+        self.assertEqual(index.count(b"z"), 0)
+
+
+class TestLCPQueries(unittest.TestCase):
+    def test_sparse_table(self):
+        generator: random.Random = random.Random(2)
+        values: list[int] = [generator.randrange(100) for _ in range(70)]
+        table: SparseTable = SparseTable(values)
+
+        for start in range(len(values)):
+            for stop in range(start + 1, len(values) + 1):
+                self.assertEqual(table.query(start, stop), min(values[start:stop]))
+
+    def test_longest_common_prefix(self):
+        text: str = "abaababaabaababaababa"
+        index: SuffixIndex = SuffixIndex(text)
+
+        for first in range(len(text)):
+            for second in range(len(text)):
+                length: int = 0
+
+                while (first + length < len(text) and second + length < len(text) and
+                       text[first + length] == text[second + length]):
+                    length += 1
+
+                self.assertEqual(index.longest_common_prefix(first, second), length)
+
+    def test_longest_repeated_substring(self):
+        start, length = SuffixIndex("banana").longest_repeated_substring()
+        self.assertEqual("banana"[start:start + length], "ana")
+        self.assertEqual(SuffixIndex("abc").longest_repeated_substring(), (0, 0))
+
+    def test_count_distinct_substrings(self):
+        text: str = "abaabab"
+        expected: int = len({text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)})
+        self.assertEqual(SuffixIndex(text).count_distinct_substrings(), expected)
+
+    def test_longest_common_substring(self):
+        first_start, second_start, length = longest_common_substring("xabcdey", "zzbcdezz")
+        self.assertEqual((first_start, second_start, length), (2, 2, 4))
+        self.assertEqual(longest_common_substring(b"aaa", b"bbb")[2], 0)
+
+
+class TestIndexFile(unittest.TestCase):
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for text in ["mississippi", b"mississippi"]:
+                path: str = os.path.join(directory, "index.bin")
+                save_suffix_index(SuffixIndex(text), path, include_lcp_queries=True)
+                index: SuffixIndex = load_suffix_index(path)
+
+                self.assertIsInstance(index.suffix_array, memoryview)
+                self.assertEqual(index.locate("ssi"), [2, 5])
+                self.assertEqual(index.count("i"), 4)
+                self.assertEqual(index.longest_common_prefix(1, 4), 4)
+                self.assertEqual(index.longest_repeated_substring(), (1, 4))
+                del index
+
+    def test_not_an_index(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "other.bin")
+
+            with open(path, "wb") as file:
+                file.write(b"0123456789abcdef0123")
+
+            self.assertRaises(ValueError, map_sections, path)
+
+    def test_truncated(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "index.bin")
+            save_suffix_index(SuffixIndex("mississippi"), path)
+            size: int = os.path.getsize(path)
+
+            for length in [size - 1, HEADER.size + SECTION.size]:
+                with open(path, "r+b") as file:
+                    file.truncate(length)
+
+                self.assertRaises(ValueError, map_sections, path)
+
+
+class TestFMIndex(unittest.TestCase):
+    def test_bwt(self):
+        bwt, sentinel_row = build_bwt(b"banana", [6, 5, 3, 1, 0, 4, 2])
+        self.assertEqual(bwt, b"annb\0aa")
+        self.assertEqual(sentinel_row, 4)
+
+    def test_locate(self):
+        generator: random.Random = random.Random(11)
+        text: bytes = bytes(generator.choice(b"acgt") for _ in range(2000))
+
+        for sample_rate, checkpoint_rate in [(1, 1), (7, 16), (32, 64)]:
+            index: FMIndex = FMIndex(text, sample_rate, checkpoint_rate)
+
+            for _ in range(100):
+                pattern: bytes = bytes(generator.choice(b"acgt") for _ in range(generator.randrange(1, 7)))
+                expected: list[int] = brute_force_locate(text, pattern)
+                self.assertEqual(index.locate(pattern), expected)
+                self.assertEqual(index.count(pattern), len(expected))
+
+    def test_string(self):
+        index: FMIndex = FMIndex("mississippi", 2, 4)
+        self.assertEqual(index.locate("issi"), [1, 4])
+        self.assertEqual(index.count("z"), 0)
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "fm.bin")
+            save_fm_index(FMIndex(b"abracadabra", 3, 2), path)
+            index: FMIndex = load_fm_index(path)
+            self.assertEqual(index.locate(b"abra"), [0, 7])
+            self.assertEqual(index.locate("a"), [0, 3, 5, 7, 10])
+            del index
+
+
+class TestIncrementalSuffixIndex(unittest.TestCase):
+    def test_locate(self):
+        generator: random.Random = random.Random(13)
+
+        for background in [False, True]:
+            index: IncrementalSuffixIndex = IncrementalSuffixIndex(merge_factor=3, background=background)
+            corpus: str = ""
+
+            for _ in range(60):
+                piece: str = "".join(generator.choice("ab") for _ in range(generator.randrange(12)))
+                index.append(piece)
+                corpus += piece
+                pattern: str = "".join(generator.choice("ab") for _ in range(generator.randrange(1, 8)))
+                self.assertEqual(index.locate(pattern), brute_force_locate(corpus, pattern))
+
+            index.close()
+            self.assertEqual(len(index), len(corpus))
+
+    def test_segments_merged(self):
+        index: IncrementalSuffixIndex = IncrementalSuffixIndex(merge_factor=2)
+
+        for _ in range(64):
+            index.append(b"ab")
+
+        self.assertEqual(len(index.segments), 1)
+        self.assertEqual(index.count(b"ba"), 63)
+
+    def test_mixed_types(self):
+        index: IncrementalSuffixIndex = IncrementalSuffixIndex()
+        index.append("text")
+        self.assertRaises(ValueError, index.append, b"bytes")
+
+    def test_empty_pattern(self):
+        index: IncrementalSuffixIndex = IncrementalSuffixIndex()
+        index.append("text")
+        self.assertRaises(ValueError, index.locate, "")
+        self.assertRaises(ValueError, index.count, "")
+
+    def test_concurrent_compaction(self):
+        index: IncrementalSuffixIndex = IncrementalSuffixIndex(merge_factor=2, background=True)
+        corpus: str = ""
+
+        for i in range(200):
+            index.append("abc"[i % 3] * (i % 5 + 1))
+            corpus += "abc"[i % 3] * (i % 5 + 1)
+            index.compact()
+
+        index.close()
+        self.assertEqual(index.find_merge(index.segments), None)
+        self.assertEqual(index.read(index.segments, 0, len(index)), corpus)
+        self.assertEqual(index.locate("ca"), brute_force_locate(corpus, "ca"))
+
+    def test_background_error(self):
+        index: IncrementalSuffixIndex = IncrementalSuffixIndex(merge_factor=2, background=True)
+
+        def fail(segments: list[Segment]) -> None:
+            raise RuntimeError("merge failed")
+
+        index.find_merge = fail
+        index.append("ab")
+        self.assertRaises(RuntimeError, index.wait)
+        index.append("cd")
+        index.executor.shutdown(wait=True)
+        self.assertRaises(RuntimeError, index.append, "ef")
+        self.assertEqual(index.locate("bc"), [1])
+
+
+if __name__ == "__main__":
+    unittest.main()